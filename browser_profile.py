@@ -0,0 +1,56 @@
+"""
+경량 브라우저 프로필 설정 (이미지/폰트/미디어/트래커 차단)
+
+크롤링에는 HTML과 리뷰 위젯 스크립트만 필요하므로 'light' 프로필에서는
+나머지 리소스를 CDP Network.setBlockedURLs와 Chrome 콘텐츠 설정으로 막는다.
+"""
+from typing import Dict, List, Optional
+
+
+BROWSER_PROFILES = ['full', 'light']
+
+# 확장자 기준으로 차단할 리소스 (이미지, 폰트, 미디어)
+# svg는 리뷰 위젯의 별점/더보기 아이콘으로 쓰이고, '*.ts'는 .tsx 등 스크립트 경로까지 걸리므로 차단하지 않음
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.avif', '*.bmp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.mp3',
+]
+
+# 분석/광고 스크립트 (리뷰 수집과 무관)
+TRACKER_PATTERNS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googleadservices.com*',
+    '*facebook.net*', '*connect.facebook.com*', '*analytics.tiktok.com*',
+    '*wcs.naver.net*', '*kakao.com/pixel*', '*t1.kakaocdn.net/kakao_js_sdk*',
+    '*criteo.com*', '*criteo.net*', '*hotjar.com*', '*clarity.ms*', '*adsrvr.org*',
+    '*mobon.net*', '*appier.net*', '*braze.com*', '*amplitude.com*',
+]
+
+# 차단하면 안 되는 패턴 (리뷰 위젯이 쓰는 리소스)
+DEFAULT_ALLOWLIST: List[str] = []
+
+# 'light' 프로필의 Chrome 콘텐츠 설정 (2 = 차단)
+LIGHT_PROFILE_PREFS: Dict[str, int] = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+}
+
+
+def blocked_url_patterns(allowlist: Optional[List[str]] = None) -> List[str]:
+    """
+    Network.setBlockedURLs에 넘길 차단 패턴 목록
+
+    Args:
+        allowlist: 차단에서 제외할 문자열 (예: 'woff', 'googletagmanager.com').
+                   이 문자열을 포함하는 차단 패턴은 목록에서 빠진다.
+
+    Returns:
+        차단 URL 패턴 리스트
+    """
+    allowed = DEFAULT_ALLOWLIST + list(allowlist or [])
+    return [
+        pattern for pattern in BLOCKED_RESOURCE_PATTERNS + TRACKER_PATTERNS
+        if not any(allow and allow in pattern for allow in allowed)
+    ]
@@ -0,0 +1,133 @@
+"""
+Chrome 세션 관리 모듈 (세션 재활용, 종료된 세션 감지, 메모리 측정)
+
+하나의 Chrome 세션으로 오래 크롤링하면 렌더러 메모리가 계속 늘고, "더 보기"를 수백 번 누른 뒤에는
+세션이 InvalidSessionIdException으로 죽어 남은 제품이 모두 실패한다.
+SessionMonitor는 세션마다 처리한 제품 수와 Chrome 프로세스 트리의 RSS를 기록해
+N개 제품 또는 메모리 한도를 넘으면 재시작하도록 알려 주고, 재시작 횟수를 사유별로 집계한다.
+RSS 측정은 psutil이 설치되어 있을 때만 동작한다.
+"""
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# 세션이 죽었을 때 WebDriverException 메시지에 나타나는 문구
+DEAD_SESSION_MESSAGES = [
+    'invalid session id',
+    'chrome not reachable',
+    'session deleted because of page crash',
+    'tab crashed',
+    'disconnected: not connected to devtools',
+    'no such window',
+]
+
+RESTART_REASONS = {'products': '제품 수', 'memory': '메모리', 'crash': '세션 종료'}
+
+
+def is_dead_session_error(error: Exception) -> bool:
+    """예외가 Chrome 세션 종료(크래시)로 인한 것인지 확인"""
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    if isinstance(error, WebDriverException):
+        message = (error.msg or str(error)).lower()
+        return any(text in message for text in DEAD_SESSION_MESSAGES)
+    return False
+
+
+def browser_rss_mb(driver) -> Optional[float]:
+    """
+    chromedriver와 하위 Chrome 프로세스(브라우저, 렌더러, GPU 등)의 RSS 합계
+
+    Returns:
+        MB 단위 메모리 (psutil이 없거나 측정할 수 없으면 None)
+    """
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+    except (AttributeError, psutil.Error):
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / 1024 / 1024
+
+
+class SessionMonitor:
+    """세션별 제품 수, 최대 메모리와 사유별 재시작 횟수를 기록하는 클래스"""
+
+    def __init__(self, recycle_after: Optional[int] = None, max_rss_mb: Optional[float] = None):
+        """
+        세션 모니터 초기화
+
+        Args:
+            recycle_after: 한 세션에서 처리할 최대 제품 수 (None이면 제한 없음)
+            max_rss_mb: Chrome 프로세스 트리의 최대 RSS (MB, None이면 제한 없음)
+        """
+        self.recycle_after = recycle_after
+        self.max_rss_mb = max_rss_mb
+        self.sessions: List[Dict] = []  # 세션별 {'products', 'peak_rss_mb', 'end_reason'}
+        self.restarts = {reason: 0 for reason in RESTART_REASONS}
+        if max_rss_mb is not None and psutil is None:
+            print("  ⚠ psutil이 설치되어 있지 않아 메모리 기준 세션 재시작을 사용할 수 없습니다.")
+
+    @property
+    def current(self) -> Dict:
+        return self.sessions[-1]
+
+    def session_started(self):
+        """새 세션 시작 기록"""
+        self.sessions.append({'products': 0, 'peak_rss_mb': None, 'end_reason': None})
+
+    def session_ended(self, reason: str):
+        """세션 종료 사유 기록 (RESTART_REASONS의 키)"""
+        self.current['end_reason'] = reason
+        self.restarts[reason] += 1
+
+    def product_started(self, driver) -> Optional[str]:
+        """
+        제품을 시작하기 전에 메모리를 측정하고 재시작이 필요한지 판단
+
+        Returns:
+            재시작 사유 ('products' 또는 'memory', 필요 없으면 None)
+        """
+        session = self.current
+        rss = browser_rss_mb(driver)
+        if rss is not None:
+            session['peak_rss_mb'] = max(rss, session['peak_rss_mb'] or 0)
+        if session['products'] == 0:
+            return None
+        if self.recycle_after and session['products'] >= self.recycle_after:
+            return 'products'
+        if self.max_rss_mb is not None and rss is not None and rss > self.max_rss_mb:
+            return 'memory'
+        return None
+
+    def product_finished(self, driver):
+        """제품 완료 기록 (메모리 최대값 갱신)"""
+        rss = browser_rss_mb(driver)
+        if rss is not None:
+            self.current['peak_rss_mb'] = max(rss, self.current['peak_rss_mb'] or 0)
+        self.current['products'] += 1
+
+    def print_stats(self, title: Optional[str] = None):
+        """세션 수, 사유별 재시작 횟수, 세션별 제품 수와 최대 메모리 출력"""
+        if len(self.sessions) <= 1 and not self.current.get('peak_rss_mb'):
+            return
+        print(f"\n[브라우저 세션 통계]{f' {title}' if title else ''}")
+        restarts = ', '.join(f"{label} {self.restarts[reason]}회" for reason, label in RESTART_REASONS.items())
+        print(f"  - 세션 {len(self.sessions)}개, 재시작: {restarts}")
+        for number, session in enumerate(self.sessions, 1):
+            rss = f"{session['peak_rss_mb']:.0f} MB" if session['peak_rss_mb'] is not None else '측정 안 됨'
+            ended = f", 종료 사유: {RESTART_REASONS[session['end_reason']]}" if session['end_reason'] else ''
+            print(f"  - 세션 {number}: 제품 {session['products']}개, 최대 메모리 {rss}{ended}")
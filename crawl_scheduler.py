@@ -0,0 +1,218 @@
+"""
+마감 시각 기반 크롤링 스케줄러
+
+정해진 시간 안에 끝내야 하는 야간 크롤링에서 가장 가치 있는 제품부터 갱신하도록
+제품마다 우선순위 점수를 매겨 순서를 정하고, 마감까지 남은 시간을 제품별 시간 예산으로 나눈다.
+우선순위는 마지막 크롤링 이후 경과 시간, 목록 리뷰 수의 증가분, 목록 순위(판매순)로 계산한다.
+남은 제품 목록은 제품이 끝날 때마다 체크포인트 파일에 기록하며, 마감 전에 끝내지 못한 제품은
+다음 실행에서 가장 먼저 처리한다.
+"""
+import json
+import math
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+
+STALENESS_WEIGHT = 0.4  # 마지막 크롤링 이후 경과 시간
+REVIEW_DELTA_WEIGHT = 0.4  # 목록 리뷰 수 증가분
+SALES_RANK_WEIGHT = 0.2  # 목록 순위 (앞일수록 높음)
+CARRYOVER_BONUS = 1.0  # 지난 실행에서 마감 때문에 넘어온 제품
+STALE_AFTER_HOURS = 7 * 24  # 이 시간 이상 지난 제품은 경과 시간 점수 최대
+MIN_PRODUCT_SECONDS = 30  # 남은 시간이 이보다 적으면 새 제품을 시작하지 않음
+
+
+def product_key(product: Dict) -> str:
+    """제품 식별자 (URL의 onlineProdSn, 없으면 product_code)"""
+    match = re.search(r'onlineProdSn=(\d+)', product.get('product_url') or '')
+    return match.group(1) if match else product.get('product_code', '')
+
+
+def parse_deadline(value: str) -> float:
+    """
+    마감 시각 문자열을 epoch 초로 변환
+
+    Args:
+        value: 'HH:MM' (이미 지났으면 다음 날) 또는 'YYYY-MM-DD HH:MM'
+
+    Returns:
+        마감 시각 (time.time() 기준 초)
+    """
+    now = datetime.now()
+    try:
+        deadline = datetime.strptime(value, '%Y-%m-%d %H:%M')
+    except ValueError:
+        clock = datetime.strptime(value, '%H:%M')
+        deadline = now.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0)
+        if deadline <= now:
+            deadline += timedelta(days=1)
+    return deadline.timestamp()
+
+
+class CrawlScheduler:
+    """우선순위 순서와 제품별 시간 예산을 정하고 체크포인트를 남기는 클래스"""
+
+    def __init__(self, deadline: float, checkpoint_path: Optional[str] = None, min_product_seconds: float = MIN_PRODUCT_SECONDS):
+        """
+        스케줄러 초기화
+
+        Args:
+            deadline: 마감 시각 (time.time() 기준 초)
+            checkpoint_path: 남은 제품 목록을 기록할 JSON 파일 경로 (None이면 기록하지 않음)
+            min_product_seconds: 제품 하나를 시작하는 데 필요한 최소 남은 시간 (초)
+        """
+        self.deadline = deadline
+        self.checkpoint_path = checkpoint_path
+        self.min_product_seconds = min_product_seconds
+        self.queue: List[Tuple[int, Dict]] = []  # 우선순위 순서의 (순번, 제품 딕셔너리)
+        self.priorities: Dict[int, float] = {}
+        self.weights: Dict[int, float] = {}  # 순번 -> 예상 작업량 (시간 예산 배분 가중치)
+        self.completed = set()  # 완료한 제품 식별자
+        self.carryover = set()  # 지난 실행에서 넘어온 제품 식별자
+
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            try:
+                with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                    self.carryover = {entry['key'] for entry in json.load(f).get('remaining', []) if entry.get('key')}
+                if self.carryover:
+                    print(f"  ✓ 지난 실행에서 마감 전에 끝내지 못한 제품 {len(self.carryover)}개를 먼저 처리합니다.")
+            except (OSError, ValueError, KeyError):
+                pass
+
+    def remaining_time(self) -> float:
+        """마감까지 남은 시간 (초)"""
+        return max(0.0, self.deadline - time.time())
+
+    def _staleness(self, stored: Optional[Dict], now: float) -> float:
+        """마지막 크롤링 이후 경과 시간 점수 (0~1, 크롤링한 적 없으면 1)"""
+        crawled_at = (stored or {}).get('crawled_at')
+        if not crawled_at:
+            return 1.0
+        try:
+            age_hours = (now - time.mktime(time.strptime(crawled_at, '%Y-%m-%d %H:%M:%S'))) / 3600
+        except (TypeError, ValueError, OverflowError):
+            return 1.0
+        return min(1.0, max(0.0, age_hours / STALE_AFTER_HOURS))
+
+    def plan(self, pending: List[Tuple[int, Dict]], history: Dict[int, Tuple[Optional[Dict], Optional[int]]],
+             total_products: int, incremental: bool = False) -> List[Tuple[int, Dict]]:
+        """
+        제품을 우선순위 순서로 정렬
+
+        Args:
+            pending: 목록 순서의 (순번, 제품 딕셔너리) 리스트 (순번이 목록 순위)
+            history: 순번 -> (지난 크롤링의 제품 정보, 지난 크롤링의 리뷰 수) (모르면 None)
+            total_products: 목록의 전체 제품 수
+            incremental: 증분 재크롤링 여부 (예상 작업량을 리뷰 수 대신 증가분으로 계산)
+
+        Returns:
+            우선순위가 높은 순서의 (순번, 제품 딕셔너리) 리스트
+        """
+        now = time.time()
+        deltas = {}
+        for idx, product in pending:
+            listing_count = product.get('listing_review_count')
+            stored_count = history.get(idx, (None, None))[1]
+            if listing_count is None:
+                deltas[idx] = None
+            elif stored_count is None:
+                deltas[idx] = listing_count
+            else:
+                deltas[idx] = max(0, listing_count - stored_count)
+        max_delta = max((delta for delta in deltas.values() if delta is not None), default=0)
+
+        known_volumes = [product['listing_review_count'] for _, product in pending if product.get('listing_review_count')]
+        default_volume = sum(known_volumes) / len(known_volumes) if known_volumes else 1
+
+        for idx, product in pending:
+            stored = history.get(idx, (None, None))[0]
+            delta = deltas[idx]
+            if delta is None:
+                delta_score = 0.5
+            else:
+                delta_score = math.log1p(delta) / math.log1p(max_delta) if max_delta else 0.0
+            rank_score = 1 - (idx - 1) / max(1, total_products)
+            priority = (STALENESS_WEIGHT * self._staleness(stored, now)
+                        + REVIEW_DELTA_WEIGHT * delta_score
+                        + SALES_RANK_WEIGHT * rank_score)
+            if product_key(product) in self.carryover:
+                priority += CARRYOVER_BONUS
+            self.priorities[idx] = priority
+
+            work = delta if incremental and delta is not None else product.get('listing_review_count')
+            self.weights[idx] = max(1, work if work is not None else default_volume)
+
+        self.queue = sorted(pending, key=lambda item: -self.priorities[item[0]])
+
+        print(f"\n[스케줄] 마감 {time.strftime('%Y-%m-%d %H:%M', time.localtime(self.deadline))}까지 "
+              f"{self.remaining_time() / 60:.0f}분, {len(self.queue)}개 제품을 우선순위 순서로 크롤링")
+        for idx, product in self.queue[:5]:
+            print(f"  → [{idx}] {product.get('product_name', '제품명 없음')} (우선순위 {self.priorities[idx]:.2f})")
+        self.save_checkpoint()
+        return self.queue
+
+    def budget(self, position: int) -> Optional[float]:
+        """
+        우선순위 순서 position번째 제품의 시간 예산
+        (남은 시간을 남은 제품의 예상 작업량 비율로 나눔, 최소 min_product_seconds)
+
+        Returns:
+            시간 예산 (초). 남은 시간이 부족해 시작하지 않아야 하면 None
+        """
+        remaining = self.remaining_time()
+        if remaining < self.min_product_seconds:
+            return None
+        idx = self.queue[position][0]
+        remaining_weight = sum(self.weights[i] for i, _ in self.queue[position:])
+        return max(self.min_product_seconds, remaining * self.weights[idx] / remaining_weight)
+
+    def pool_budgets(self, worker_count: int) -> Dict[int, float]:
+        """워커 풀용 제품별 시간 예산 (남은 시간 × 워커 수를 예상 작업량 비율로 미리 나눔)"""
+        total_weight = sum(self.weights[idx] for idx, _ in self.queue) or 1
+        capacity = self.remaining_time() * worker_count
+        return {idx: max(self.min_product_seconds, capacity * self.weights[idx] / total_weight) for idx, _ in self.queue}
+
+    def complete(self, product: Dict):
+        """제품 완료 기록 후 체크포인트 갱신"""
+        self.completed.add(product_key(product))
+        self.save_checkpoint()
+
+    def save_checkpoint(self):
+        """남은 제품 목록을 우선순위 순서로 기록 (임시 파일 후 교체)"""
+        if not self.checkpoint_path:
+            return
+        remaining = [
+            {
+                'key': product_key(product),
+                'product_url': product.get('product_url', ''),
+                'product_name': product.get('product_name', ''),
+                'priority': round(self.priorities[idx], 3),
+            }
+            for idx, product in self.queue if product_key(product) not in self.completed
+        ]
+        checkpoint = {
+            'deadline': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.deadline)),
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'completed': len(self.completed),
+            'remaining': remaining,
+        }
+        try:
+            temp_path = f"{self.checkpoint_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.checkpoint_path)
+        except OSError:
+            pass
+
+    def finish(self):
+        """실행 종료: 남은 제품이 없으면 체크포인트 삭제, 있으면 기록 후 안내"""
+        remaining = sum(1 for _, product in self.queue if product_key(product) not in self.completed)
+        if not remaining:
+            if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+                os.remove(self.checkpoint_path)
+            return
+        self.save_checkpoint()
+        print(f"\n⏱ 마감 시각까지 {remaining}개 제품을 끝내지 못했습니다. 다음 실행에서 먼저 처리합니다."
+              f"{f' ({self.checkpoint_path})' if self.checkpoint_path else ''}")
@@ -3,28 +3,198 @@
 """
 import time
 import json
+import math
 import os
-from typing import List, Dict, Optional
+import base64
+import queue
+import multiprocessing
+from typing import Callable, Iterator, List, Dict, Optional, Set
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from concurrent.futures import ProcessPoolExecutor
 from bs4 import BeautifulSoup
 import re
+from wait_engine import WaitEngine
+from review_payload import payload_to_cards
+from browser_profile import LIGHT_PROFILE_PREFS, blocked_url_patterns
+from driver_resolver import resolve_chromedriver
+from notice_extractor import extract_notice_fields
+from notice_cache import NoticeCache
+from selector_cache import SelectorCache
+from popup_dismisser import POPUP_DISMISS_SCRIPT, POPUP_PAUSE_SCRIPT, POPUPS_CLOSED_SCRIPT
+from review_parser import ReviewParser, card_element, parse_review_html
+from review_fingerprint import review_fingerprint
+from crawl_scheduler import CrawlScheduler
+from job_queue import CrawlJobQueue
+from review_checkpoint import ReviewCheckpoint
+from browser_session import SessionMonitor, is_dead_session_error
+from database import DatabaseManager
 
 
-class AmoreMallCrawler:
-    def __init__(self, headless: bool = False, debug: bool = False):
+# 리뷰 카드를 브라우저에서 순회하여 원시 필드를 JSON으로 반환 (review_backend='js')
+REVIEW_CARDS_SCRIPT = r"""
+    var onlyNew = arguments[0];
+    var cards = document.querySelectorAll(onlyNew ? '.reviewCard:not([data-crawled])' : '.reviewCard');
+    function text(el) { return el ? (el.textContent || '').replace(/\s+/g, ' ').trim() : ''; }
+    function lines(el) {
+        var out = [];
+        var walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT, null);
+        var node;
+        while ((node = walker.nextNode())) {
+            var t = node.nodeValue.trim();
+            if (t) out.push(t);
+        }
+        return out;
+    }
+    function first(card, selectors) {
+        for (var i = 0; i < selectors.length; i++) {
+            var el = card.querySelector(selectors[i]);
+            if (el) return el;
+        }
+        return null;
+    }
+    var result = [];
+    for (var c = 0; c < cards.length; c++) {
+        var card = cards[c];
+        var allText = lines(card).join('\n');
+        var starEl = first(card, ['div[class*="icoStarWrap" i]', 'div[class*="starWrap" i]']);
+        var textEl = first(card, ['p.txt', 'p[class*="txt"]', 'div.txt',
+            'p[class*="txt" i], p[class*="text" i], p[class*="content" i], div[class*="txt" i], div[class*="text" i], div[class*="content" i]']);
+        var notes = [];
+        var style = card.querySelector('div[class*="prdStyle" i]');
+        if (style) {
+            var dts = style.querySelectorAll('dt');
+            var dds = style.querySelectorAll('dd');
+            for (var j = 0; j < dts.length && j < dds.length; j++) {
+                notes.push(text(dts[j]) + ': ' + text(dds[j]));
+            }
+        }
+        var optionMatch = allText.match(/옵션[:\s]*([^\n]+)/i) || allText.match(/option[:\s]*([^\n]+)/i) || allText.match(/선택[:\s]*([^\n]+)/i);
+        var typeMatch = allText.match(/(\d+\s*[일개월주년]+?\s*사용\s*리뷰)/i) || allText.match(/(한달|한\s*달|1개월)\s*사용/i) || allText.match(/사용\s*리뷰/i);
+        result.push({
+            username: text(first(card, ['span[class*="userTitle" i]', '[class*="userTitle" i]'])),
+            user_info: text(first(card, ['span[class*="userDesc" i]', '[class*="userDesc" i]'])),
+            star_class: starEl ? (starEl.getAttribute('class') || '') : '',
+            star_count: (starEl || card).querySelectorAll('i[class*="star" i]').length,
+            option: optionMatch ? optionMatch[1].trim() : '',
+            review_type: typeMatch ? typeMatch[0].trim() : '',
+            notes: notes,
+            text: text(textEl),
+            all_text: allText
+        });
+        if (onlyNew) card.setAttribute('data-crawled', '1');
+    }
+    return {total: document.querySelectorAll('.reviewCard').length, cards: result};
+"""
+
+# 처리 완료(data-crawled)된 리뷰 카드를 DOM에서 비우거나 제거 (review_dom_prune)
+# 카드 수 확인과 "더 보기" 버튼 위치가 유지되도록 마지막 카드는 남겨 둠
+PRUNE_REVIEW_CARDS_SCRIPT = r"""
+    var mode = arguments[0];
+    var all = document.querySelectorAll('.reviewCard');
+    var last = all.length ? all[all.length - 1] : null;
+    var cards = document.querySelectorAll('.reviewCard[data-crawled]:not([data-pruned])');
+    var pruned = 0;
+    for (var i = 0; i < cards.length; i++) {
+        var card = cards[i];
+        if (card === last) { continue; }
+        if (mode === 'remove') {
+            card.parentNode.removeChild(card);
+        } else {
+            while (card.firstChild) { card.removeChild(card.firstChild); }
+            card.style.display = 'none';
+            card.setAttribute('data-pruned', '1');
+        }
+        pruned++;
+    }
+    return pruned;
+"""
+
+DOM_PRUNE_MODES = ['collapse', 'remove']
+
+# 현재 페이지가 내려받은 바이트 수 (문서 + 리소스, Resource Timing 기준)
+PAGE_BYTES_SCRIPT = """
+    var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+    return entries.reduce(function(total, entry) { return total + (entry.transferSize || 0); }, 0);
+"""
+
+# 네트워크 캡처 모드에서 리뷰 API 응답으로 간주할 URL 패턴
+REVIEW_API_PATTERN = re.compile(r'review', re.I)
+
+# 목록의 "평점(리뷰 수)" 표기 (예: "4.9(4,374)")
+LISTING_RATING_PATTERN = re.compile(r'(\d\.\d)\((\d{1,3}(?:,\d{3})*|\d+)\)')
+
+# 리뷰 수집 체크포인트 저장 간격 (iter_reviews의 페이지 반복 횟수)
+CHECKPOINT_EVERY_PAGES = 5
+
+
+class AmoreMallCrawler(ReviewParser):
+    def __init__(self, headless: bool = False, debug: bool = False, incremental_parse: bool = True, review_backend: str = 'html',
+                 browser_profile: str = 'full', allow_urls: Optional[List[str]] = None, driver_path: Optional[str] = None,
+                 notice_cache_path: Optional[str] = None, notice_ttl_days: float = 30, refresh_notice: bool = False,
+                 selector_cache_path: Optional[str] = None, popup_mode: str = 'sweep', parse_workers: int = 0,
+                 incremental_db_path: Optional[str] = None, review_coverage: float = 1.0, review_checkpoint_path: Optional[str] = None,
+                 recycle_after: Optional[int] = None, max_browser_mb: Optional[float] = None, review_dom_prune: Optional[str] = None):
         """
         크롤러 초기화
         
         Args:
             headless: 브라우저를 백그라운드에서 실행할지 여부
             debug: 디버깅 모드 (HTML 저장 등)
+            incremental_parse: "더 보기" 클릭 후 새로 추가된 리뷰 카드만 파싱할지 여부
+            review_backend: 리뷰 추출 방식 ('html': BeautifulSoup 파싱, 'js': 브라우저에서 JSON 추출,
+                            'network': 리뷰 API 응답을 CDP로 캡처, 응답이 없으면 HTML 파싱)
+            browser_profile: 브라우저 프로필 ('full': 모든 리소스 로드,
+                             'light': 이미지/폰트/미디어/트래커 차단 + pageLoadStrategy='eager')
+            allow_urls: 'light' 프로필에서 차단하지 않을 URL 패턴 문자열 (리뷰 위젯용)
+            driver_path: chromedriver 경로 (없으면 캐시/PATH/ChromeDriverManager 순서로 결정)
+            notice_cache_path: 상품정보제공 고시 캐시 파일 경로 (None이면 캐시 사용 안 함)
+            notice_ttl_days: 고시 캐시 유효 기간 (일)
+            refresh_notice: 캐시를 무시하고 고시를 다시 수집 (수집 결과로 캐시 갱신)
+            selector_cache_path: 성공한 셀렉터 통계 파일 경로 (None이면 이번 실행에서만 기억)
+            popup_mode: 팝업 처리 방식 ('sweep': 페이지 이동마다 셀렉터로 닫기 버튼 검색,
+                        'script': 모든 페이지에 주입한 스크립트가 팝업이 나타날 때 바로 닫음)
+            parse_workers: 리뷰 카드 파싱 프로세스 수 (0이면 브라우저와 같은 프로세스에서 파싱,
+                           증분 HTML 파싱에서만 사용)
+            incremental_db_path: 증분 재크롤링에 사용할 DB 경로 (지정하면 리뷰를 최신순으로 보다가
+                                 이 DB에 이미 저장된 리뷰를 만나면 "더 보기" 클릭을 멈춤)
+            review_coverage: 전체 리뷰 수 중 수집할 비율 (0~1, 전체 리뷰 수와 페이지 크기로
+                             "더 보기" 클릭 횟수를 계산할 때 사용)
+            review_checkpoint_path: 리뷰 수집 체크포인트 파일 경로 (지정하면 제품 수집 중 몇 페이지마다
+                                    진행 상황을 기록하고, 중단된 제품은 다음 실행에서 이어서 수집)
+            recycle_after: 한 Chrome 세션에서 크롤링할 최대 제품 수 (넘으면 다음 제품 전에 브라우저 재시작)
+            max_browser_mb: Chrome 프로세스 트리의 최대 메모리 (MB, 넘으면 다음 제품 전에 재시작, psutil 필요)
+            review_dom_prune: 추출한 리뷰 카드를 화면에서 정리하는 방식 ('collapse': 카드 내용을 비우고 숨김,
+                              'remove': 카드 요소 제거, None: 정리하지 않음). 증분 파싱, js, network 방식처럼
+                              카드를 data-crawled로 표시하는 경우에만 동작
         """
+        # 워커 프로세스에서 같은 설정으로 크롤러를 다시 만들 때 사용
+        self._init_kwargs = {
+            'headless': headless,
+            'debug': debug,
+            'incremental_parse': incremental_parse,
+            'review_backend': review_backend,
+            'browser_profile': browser_profile,
+            'allow_urls': allow_urls,
+            'driver_path': driver_path,
+            'notice_cache_path': notice_cache_path,
+            'notice_ttl_days': notice_ttl_days,
+            'refresh_notice': refresh_notice,
+            'selector_cache_path': selector_cache_path,
+            'popup_mode': popup_mode,
+            'parse_workers': parse_workers,
+            'incremental_db_path': incremental_db_path,
+            'review_coverage': review_coverage,
+            'review_checkpoint_path': review_checkpoint_path,
+            'recycle_after': recycle_after,
+            'max_browser_mb': max_browser_mb,
+            'review_dom_prune': review_dom_prune,
+        }
+        
         chrome_options = Options()
         if headless:
             chrome_options.add_argument('--headless')
@@ -34,14 +204,276 @@ class AmoreMallCrawler:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        if review_backend == 'network':
+            # 리뷰 API 응답을 가로채기 위한 성능(네트워크) 로그 활성화
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+        if browser_profile == 'light':
+            # DOMContentLoaded 시점에 driver.get 반환, 이미지 등은 콘텐츠 설정으로 차단
+            chrome_options.page_load_strategy = 'eager'
+            chrome_options.add_experimental_option('prefs', LIGHT_PROFILE_PREFS)
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 10)
+        # 세션을 재시작할 때 같은 옵션과 드라이버로 다시 띄움
+        self._chrome_options = chrome_options
+        self._driver_executable = resolve_chromedriver(driver_path, debug=debug)
+        self.driver = None
+        ready_states = ('interactive', 'complete') if browser_profile == 'light' else ('complete',)
+        self.waits = WaitEngine(self.driver, debug=debug, ready_states=ready_states)
+        self.headless = headless
         self.debug = debug
+        self.incremental_parse = incremental_parse
+        self.review_backend = review_backend
+        self.review_api_url = None  # 네트워크 캡처로 발견한 리뷰 API URL
+        self.browser_profile = browser_profile
+        self.allow_urls = allow_urls
+        # 추출한 리뷰 카드 정리 (클릭이 거듭될수록 DOM이 커져 느려지지 않도록)
+        self.review_dom_prune = review_dom_prune
+        self.prune_stats = {'cards': 0, 'products': 0}
+        
+        # 페이지 로드 통계 (driver.get ~ 로딩 완료 시간, 내려받은 바이트)
+        self.page_load_stats = {'count': 0, 'total_time': 0.0, 'bytes': 0}
+        # 현재 열린 페이지 상태 (같은 제품 화면이면 다시 로드하지 않음)
+        self._page_state = {'url': None, 'loaded_url': None, 'view': None}
+        self.navigation_count = 0  # driver.get, 페이지 이동 클릭, 뒤로가기 횟수
+        self.brand_name = None  # 마지막으로 크롤링한 브랜드명 (iter_brand_products에서 기록)
+        # 상품정보제공 고시 수집 통계 (고시 열기~파싱 전체 시간, 파싱 시간)
+        self.notice_stats = {'count': 0, 'total_time': 0.0, 'parse_time': 0.0}
+        self.notice_cache = NoticeCache(notice_cache_path, notice_ttl_days) if notice_cache_path else None
+        self.refresh_notice = refresh_notice
+        # 페이지 종류별로 성공한 셀렉터를 먼저 시도
+        self.selectors = SelectorCache(selector_cache_path)
+        # 리뷰 카드 파싱 프로세스 풀 (브라우저가 CPU 파싱을 기다리지 않도록 분리)
+        self.parse_pool = None
+        if parse_workers > 0:
+            self.parse_pool = ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context('spawn'))
+        # 증분 재크롤링: 제품별로 저장된 리뷰 지문을 조회할 DB
+        self.incremental_db = DatabaseManager(incremental_db_path) if incremental_db_path else None
+        self.review_coverage = review_coverage
+        # 제품 수집 중간 체크포인트 (Chrome이 죽어도 모은 리뷰를 잃지 않도록)
+        self.review_checkpoint = ReviewCheckpoint(review_checkpoint_path) if review_checkpoint_path else None
+        
+        # 팝업 처리 (script 모드는 새 문서마다 자동 실행되도록 등록)
+        self.popup_mode = popup_mode
+        self.popup_time = 0.0  # Python 쪽 팝업 처리에 쓴 시간 (초)
+        
+        # Chrome 세션 재활용/재시작 기록 (세션별 제품 수, 최대 메모리, 사유별 재시작 횟수)
+        self.session_monitor = SessionMonitor(recycle_after, max_browser_mb)
+        self._launch_browser()
+    
+    def _launch_browser(self):
+        """Chrome 세션 시작 (네트워크 캡처, 리소스 차단, 팝업 닫기 스크립트 설정 포함)"""
+        self.driver = webdriver.Chrome(service=Service(self._driver_executable), options=self._chrome_options)
+        self.wait = WebDriverWait(self.driver, 10)
+        self.waits.driver = self.driver
+        self._page_state = {'url': None, 'loaded_url': None, 'view': None}
+        self.session_monitor.session_started()
+        
+        if self.review_backend == 'network':
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+            except Exception as e:
+                print(f"  ⚠ 네트워크 캡처를 활성화할 수 없습니다. HTML 파싱을 사용합니다: {e}")
+                self.review_backend = 'html'
+        
+        if self.browser_profile == 'light':
+            try:
+                self.driver.execute_cdp_cmd('Network.enable', {})
+                self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(self.allow_urls)})
+            except Exception as e:
+                print(f"  ⚠ 리소스 차단을 설정할 수 없습니다: {e}")
+        
+        if self.popup_mode == 'script':
+            try:
+                self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': POPUP_DISMISS_SCRIPT})
+            except Exception as e:
+                print(f"  ⚠ 팝업 닫기 스크립트를 등록할 수 없습니다. 셀렉터 방식을 사용합니다: {e}")
+                self.popup_mode = 'sweep'
+    
+    def restart_browser(self, reason: str):
+        """
+        Chrome 세션 재시작 (기존 세션은 죽었어도 정리 시도)
+        
+        Args:
+            reason: 재시작 사유 ('products': 제품 수, 'memory': 메모리, 'crash': 세션 종료)
+        """
+        self.session_monitor.session_ended(reason)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self._launch_browser()
+        print(f"  ↻ Chrome 세션 재시작 ({len(self.session_monitor.sessions)}번째 세션)")
+    
+    def _session_alive(self) -> bool:
+        """Chrome 세션이 응답하는지 확인"""
+        try:
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception as e:
+            return not is_dead_session_error(e)
+    
+    def crawl_product_with_recovery(self, url: str, **crawl_kwargs) -> Dict:
+        """
+        세션 관리를 포함한 crawl_product_reviews
+        
+        제품을 시작하기 전에 제품 수/메모리 한도를 넘은 세션은 새로 띄우고,
+        크롤링 중 세션이 죽으면(예외 또는 크롤링 후 세션 무응답) 재시작한 뒤 한 번 다시 시도한다.
+        리뷰 체크포인트를 사용하면 다시 시도할 때 죽기 전까지 모은 리뷰부터 이어서 수집한다.
+        review_sink를 쓰면 다시 시도할 때 이미 넘긴 후기(같은 리뷰 지문)는 다시 넘기지 않는다.
+        
+        Args:
+            url: 제품 페이지 URL
+            **crawl_kwargs: crawl_product_reviews에 넘길 인자
+            
+        Returns:
+            crawl_product_reviews 결과
+        """
+        reason = self.session_monitor.product_started(self.driver)
+        if reason:
+            labels = {'products': f"제품 {self.session_monitor.recycle_after}개 처리", 'memory': f"메모리 {self.session_monitor.max_rss_mb:.0f} MB 초과"}
+            print(f"  → {labels[reason]}: 브라우저를 새로 띄웁니다.")
+            self.restart_browser(reason)
+        
+        review_sink = crawl_kwargs.get('review_sink')
+        sent_fingerprints = set()
+        if review_sink is not None:
+            def sink_once(partial: Dict):
+                fresh = []
+                for review in partial['reviews']:
+                    fingerprint = review_fingerprint(review)
+                    if fingerprint not in sent_fingerprints:
+                        sent_fingerprints.add(fingerprint)
+                        fresh.append(review)
+                if fresh:
+                    review_sink(dict(partial, reviews=fresh))
+            crawl_kwargs = dict(crawl_kwargs, review_sink=sink_once)
+        
+        for attempt in range(2):
+            try:
+                result = self.crawl_product_reviews(url, **crawl_kwargs)
+            except Exception as e:
+                if attempt or not is_dead_session_error(e):
+                    raise
+                print(f"  ⚠ Chrome 세션이 종료되었습니다: {str(e).splitlines()[0]}")
+                self.restart_browser('crash')
+                continue
+            if not attempt and not self._session_alive():
+                # 리뷰/고시 수집 중 오류를 삼킨 경우: 결과가 불완전할 수 있으므로 다시 시도
+                print(f"  ⚠ 크롤링 중 Chrome 세션이 종료되었습니다. 재시작 후 다시 시도합니다.")
+                self.restart_browser('crash')
+                continue
+            self.session_monitor.product_finished(self.driver)
+            if review_sink is not None:
+                result['total_reviews'] = len(sent_fingerprints)
+            return result
+        raise RuntimeError("Chrome 세션 재시작 후에도 크롤링에 실패했습니다.")
+    
+    def _open_page(self, url: str, view: str = 'product'):
+        """
+        페이지 이동 후 로딩 완료까지 대기하고 로드 시간/전송량 기록
+        
+        Args:
+            url: 이동할 URL
+            view: 열린 화면 종류 ('product': 제품 화면, 'listing': 제품 목록)
+        """
+        start = time.monotonic()
+        self.driver.get(url)
+        self.waits.page_settled()
+        elapsed = time.monotonic() - start
+        
+        try:
+            page_bytes = self.driver.execute_script(PAGE_BYTES_SCRIPT) or 0
+        except Exception:
+            page_bytes = 0
+        self.page_load_stats['count'] += 1
+        self.page_load_stats['total_time'] += elapsed
+        self.page_load_stats['bytes'] += page_bytes
+        self.navigation_count += 1
+        self._page_state = {'url': url, 'loaded_url': self.driver.current_url, 'view': view}
+        if self.debug:
+            print(f"  [디버깅] 페이지 로드 {elapsed:.1f}초, {page_bytes / 1024:.0f} KB: {url[:80]}")
+    
+    def _ensure_page(self, url: str) -> bool:
+        """
+        url의 제품 화면이 열려 있도록 보장 (이미 열려 있으면 다시 로드하지 않음)
+        
+        Args:
+            url: 제품 페이지 URL
+            
+        Returns:
+            새로 페이지를 로드했는지 여부
+        """
+        state = self._page_state
+        try:
+            current_url = self.driver.current_url
+        except Exception:
+            current_url = None
+        if state['url'] == url and state['view'] == 'product' and current_url == state['loaded_url']:
+            if self.debug:
+                print(f"  [디버깅] 이미 열린 제품 화면 재사용: {url[:80]}")
+            return False
+        
+        self._open_page(url)
+        self._close_popups()
+        return True
+    
+    def _set_page_view(self, view: str):
+        """현재 페이지 화면 상태 변경 (고시 열기 등 제품 화면을 벗어났을 때)"""
+        self._page_state['view'] = view
+    
+    def print_stats(self, title: Optional[str] = None):
+        """대기 통계와 페이지 로드 통계 출력"""
+        self.waits.print_stats(title)
+        stats = self.page_load_stats
+        if stats['count']:
+            print(f"\n[페이지 로드 통계]{f' {title}' if title else ''} (프로필: {self.browser_profile})")
+            print(f"  - {stats['count']}회, 평균 {stats['total_time'] / stats['count']:.2f}초, "
+                  f"총 전송량 {stats['bytes'] / 1024 / 1024:.2f} MB (페이지당 {stats['bytes'] / stats['count'] / 1024:.0f} KB)")
+        if self.popup_mode == 'sweep' and self.popup_time:
+            print(f"\n[팝업 처리]{f' {title}' if title else ''} 셀렉터 방식 총 {self.popup_time:.1f}초")
+        notice = self.notice_stats
+        if notice['count']:
+            print(f"\n[고시 수집 통계]{f' {title}' if title else ''}")
+            print(f"  - {notice['count']}개 제품, 제품당 평균 {notice['total_time'] / notice['count']:.2f}초 "
+                  f"(파싱 {notice['parse_time'] / notice['count'] * 1000:.0f}ms)")
+        if self.notice_cache:
+            self.notice_cache.print_stats(title)
+        if self.review_checkpoint:
+            self.review_checkpoint.print_stats(title)
+        if self.prune_stats['cards']:
+            print(f"\n[리뷰 카드 정리]{f' {title}' if title else ''} ({self.review_dom_prune})")
+            print(f"  - {self.prune_stats['products']}개 제품에서 추출한 리뷰 카드 {self.prune_stats['cards']}개 정리")
+        self.session_monitor.print_stats(title)
+        self.selectors.print_stats(title)
     
     def _close_popups(self):
-        """팝업 창 닫기"""
+        """
+        팝업 창 닫기
+        
+        popup_mode='script'면 주입된 스크립트가 이미 처리하므로 바로 반환한다.
+        """
+        if self.popup_mode == 'script':
+            return
+        start = time.monotonic()
+        self._sweep_popups()
+        self.popup_time += time.monotonic() - start
+    
+    def _pause_popup_script(self, paused: bool):
+        """
+        팝업 닫기 스크립트 일시 정지/재개 (popup_mode='script'에서만 사용)
+        
+        고시와 리뷰 화면을 읽는 동안 스크립트가 그 화면의 레이어를 닫지 않도록 한다.
+        """
+        if self.popup_mode != 'script':
+            return
+        try:
+            self.driver.execute_script(POPUP_PAUSE_SCRIPT, paused)
+        except Exception as e:
+            if self.debug:
+                print(f"  [디버깅] 팝업 닫기 스크립트 {'정지' if paused else '재개'} 오류: {e}")
+    
+    def _sweep_popups(self):
+        """셀렉터 목록으로 팝업 닫기 버튼을 찾아 클릭하고 ESC 키 전송"""
         try:
             # 다양한 팝업 닫기 버튼 셀렉터
             close_selectors = [
@@ -60,24 +492,30 @@ class AmoreMallCrawler:
                 # ESC 키로 닫을 수 있는 팝업도 처리
             ]
             
-            for by, selector in close_selectors:
+            # 지난번에 팝업을 닫은 셀렉터부터 시도하고, 닫기 버튼을 클릭하면 나머지 셀렉터는 건너뜀
+            for by, selector in self.selectors.ordered('popup', 'close_button', close_selectors):
+                clicked = False
                 try:
                     close_buttons = self.driver.find_elements(by, selector)
                     for btn in close_buttons:
                         if btn.is_displayed():
                             # JavaScript로 클릭 (더 안정적)
                             self.driver.execute_script("arguments[0].click();", btn)
-                            time.sleep(0.5)
+                            self.waits.dom_quiet(quiet_ms=200, timeout=1)
                             print("  ✓ 팝업 닫기 버튼 클릭")
+                            clicked = True
                             break
                 except:
                     continue
+                if clicked:
+                    self.selectors.record('popup', 'close_button', close_selectors, (by, selector))
+                    break
             
             # ESC 키로 팝업 닫기 시도
             try:
                 from selenium.webdriver.common.keys import Keys
                 self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                time.sleep(0.5)
+                self.waits.dom_quiet(quiet_ms=200, timeout=1)
             except:
                 pass
                 
@@ -96,6 +534,7 @@ class AmoreMallCrawler:
         Returns:
             제품 정보 딕셔너리 (성분, 사용방법, 주의사항 포함)
         """
+        notice_start = time.monotonic()
         product_info = {
             'product_url': url,
             'product_name': '',
@@ -137,29 +576,33 @@ class AmoreMallCrawler:
             ]
             
             notice_button_found = False
+            # 고시 레이어를 읽는 동안 팝업 닫기 스크립트 정지
+            self._pause_popup_script(True)
             
-            for by, selector in notice_button_selectors:
+            for by, selector in self.selectors.ordered('notice', 'notice_button', notice_button_selectors):
                 try:
                     notice_button = self.driver.find_element(by, selector)
                     if notice_button and notice_button.is_displayed():
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", notice_button)
-                        time.sleep(1)
+                        self.waits.element_clickable(notice_button)
                         before_url = self.driver.current_url
                         self.driver.execute_script("arguments[0].click();", notice_button)
-                        time.sleep(3)
+                        self.waits.click_settled(before_url)
                         after_url = self.driver.current_url
+                        self._set_page_view('notice')
                         
                         if before_url != after_url:
+                            self.navigation_count += 1
                             print(f"  ✓ 상품정보제공 고시 열기 (페이지 이동)")
                         else:
                             print(f"  ✓ 상품정보제공 고시 열기 (같은 페이지)")
-                            time.sleep(3)
                             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                            time.sleep(2)
+                            self.waits.dom_quiet(quiet_ms=300, timeout=3)
                             self.driver.execute_script("window.scrollTo(0, 0);")
-                            time.sleep(1)
+                            self.waits.dom_quiet(quiet_ms=300, timeout=1)
                         
                         notice_button_found = True
+                        self.selectors.record('notice', 'notice_button', notice_button_selectors, (by, selector))
                         break
                 except:
                     continue
@@ -171,260 +614,50 @@ class AmoreMallCrawler:
                 pass
             
             if notice_button_found:
-                time.sleep(2)
+                self.waits.dom_quiet()
                 notice_soup = BeautifulSoup(self.driver.page_source, 'html.parser')
                 
-                if self.debug:
-                    print(f"  [디버깅] 상품정보제공 고시 페이지 파싱 시작")
-                
-                # 사용 방법 추출 (더 포괄적으로)
-                usage_keywords = ['사용방법', '사용 방법', '사용법', 'How to Use', '용법']
-                
-                # 방법 1: dt/dd 구조에서 찾기
-                dt_elements = notice_soup.find_all('dt')
-                for dt in dt_elements:
-                    dt_text = dt.get_text(strip=True)
-                    if any(keyword in dt_text for keyword in usage_keywords):
-                        dd = dt.find_next_sibling('dd')
-                        if dd:
-                            usage_method = dd.get_text(separator='\n', strip=True)
-                            if len(usage_method) > 10:
-                                if self.debug:
-                                    print(f"  [디버깅] dt/dd 구조에서 사용 방법 추출: {len(usage_method)}자")
-                                break
-                
-                # 방법 2: 테이블 구조에서 찾기
-                if not usage_method:
-                    tables = notice_soup.find_all('table')
-                    for table in tables:
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            th = row.find('th')
-                            td = row.find('td')
-                            if th and td:
-                                th_text = th.get_text(strip=True)
-                                if any(keyword in th_text for keyword in usage_keywords):
-                                    usage_method = td.get_text(separator='\n', strip=True)
-                                    if len(usage_method) > 10:
-                                        if self.debug:
-                                            print(f"  [디버깅] 테이블 구조에서 사용 방법 추출: {len(usage_method)}자")
-                                        break
-                        if usage_method:
-                            break
-                
-                # 방법 3: 텍스트 기반 검색 (개선)
-                if not usage_method:
-                    for keyword in usage_keywords:
-                        # 정확한 키워드 매칭
-                        usage_elem = notice_soup.find(string=re.compile(keyword, re.I))
-                        if usage_elem:
-                            parent = usage_elem.find_parent()
-                            if parent:
-                                # 부모 요소의 모든 텍스트 가져오기
-                                usage_text = parent.get_text(separator='\n', strip=True)
-                                # 키워드 다음의 텍스트 추출
-                                keyword_pos = usage_text.find(keyword)
-                                if keyword_pos >= 0:
-                                    after_keyword = usage_text[keyword_pos + len(keyword):].strip()
-                                    # 줄바꿈이나 특수문자 제거 후 추출
-                                    usage_method = re.sub(r'^[:\s\n]+', '', after_keyword)
-                                    usage_method = usage_method.split('\n')[0].strip()[:1000]
-                                    if len(usage_method) > 10:
-                                        if self.debug:
-                                            print(f"  [디버깅] 텍스트 기반에서 사용 방법 추출: {len(usage_method)}자")
-                                        break
-                        
-                        # h4, h3, h2 태그에서 찾기
-                        if not usage_method:
-                            headings = notice_soup.find_all(['h2', 'h3', 'h4'])
-                            for heading in headings:
-                                heading_text = heading.get_text(strip=True)
-                                if keyword in heading_text:
-                                    # 다음 형제 요소나 부모의 다음 형제에서 내용 찾기
-                                    next_elem = heading.find_next_sibling()
-                                    if next_elem:
-                                        usage_method = next_elem.get_text(separator='\n', strip=True)
-                                        if len(usage_method) > 10:
-                                            if self.debug:
-                                                print(f"  [디버깅] 헤딩 구조에서 사용 방법 추출: {len(usage_method)}자")
-                                            break
-                                    else:
-                                        # 부모의 다음 형제 찾기
-                                        parent = heading.find_parent()
-                                        if parent:
-                                            parent_next = parent.find_next_sibling()
-                                            if parent_next:
-                                                usage_method = parent_next.get_text(separator='\n', strip=True)
-                                                if len(usage_method) > 10:
-                                                    if self.debug:
-                                                        print(f"  [디버깅] 부모 형제에서 사용 방법 추출: {len(usage_method)}자")
-                                                    break
-                        if usage_method:
-                            break
+                parse_start = time.monotonic()
+                fields = extract_notice_fields(notice_soup)
+                self.notice_stats['parse_time'] += time.monotonic() - parse_start
+                usage_method = fields['usage_method']
+                ingredients = fields['ingredients']
+                precautions = fields['precautions']
                 
-                # 성분 추출
-                h4_elems = notice_soup.find_all('h4')
                 if self.debug:
-                    print(f"  [디버깅] h4 요소 {len(h4_elems)}개 발견")
-                for h4 in h4_elems:
-                    h4_text = h4.get_text(strip=True)
-                    if self.debug and ('화장품법' in h4_text or '성분' in h4_text):
-                        print(f"  [디버깅] 성분 관련 h4 발견: {h4_text[:80]}")
-                    if '화장품법' in h4_text and '성분' in h4_text:
-                        next_sibling = h4.find_next_sibling()
-                        if next_sibling:
-                            ingredients = next_sibling.get_text(separator=' ', strip=True)
-                            if self.debug:
-                                print(f"  [디버깅] next_sibling에서 성분 추출: {len(ingredients)}자")
-                            if len(ingredients) > 20:
-                                if self.debug:
-                                    print(f"  [디버깅] ✓ 성분 추출 성공! (방법1)")
-                                break
-                        parent = h4.find_parent()
-                        if parent and (not ingredients or len(ingredients) <= 20):
-                            for sibling in parent.find_next_siblings():
-                                text = sibling.get_text(separator=' ', strip=True)
-                                if len(text) > 50:
-                                    ingredients = text
-                                    break
-                            if not ingredients:
-                                parent_text = parent.get_text(separator=' ', strip=True)
-                                h4_pos = parent_text.find(h4_text)
-                                if h4_pos >= 0:
-                                    after_h4 = parent_text[h4_pos + len(h4_text):].strip()
-                                    if len(after_h4) > 20:
-                                        ingredients = after_h4
-                        break
-                
-                # 주의사항 추출 (더 포괄적으로)
-                precautions_keywords = ['주의사항', '주의 사항', '주의', 'precaution', '경고', '주의사항', '사용시 주의사항']
-                
-                # 방법 1: dt/dd 구조에서 찾기
-                dt_elements = notice_soup.find_all('dt')
-                for dt in dt_elements:
-                    dt_text = dt.get_text(strip=True)
-                    if any(keyword in dt_text for keyword in precautions_keywords):
-                        dd = dt.find_next_sibling('dd')
-                        if dd:
-                            precautions = dd.get_text(separator='\n', strip=True)
-                            if len(precautions) > 10:
-                                if self.debug:
-                                    print(f"  [디버깅] dt/dd 구조에서 주의사항 추출: {len(precautions)}자")
-                                break
-                
-                # 방법 2: 테이블 구조에서 찾기
-                if not precautions:
-                    tables = notice_soup.find_all('table')
-                    for table in tables:
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            th = row.find('th')
-                            td = row.find('td')
-                            if th and td:
-                                th_text = th.get_text(strip=True)
-                                if any(keyword in th_text for keyword in precautions_keywords):
-                                    precautions = td.get_text(separator='\n', strip=True)
-                                    if len(precautions) > 10:
-                                        if self.debug:
-                                            print(f"  [디버깅] 테이블 구조에서 주의사항 추출: {len(precautions)}자")
-                                        break
-                        if precautions:
-                            break
-                
-                # 방법 3: 텍스트 기반 검색 (개선)
-                if not precautions:
-                    for keyword in precautions_keywords:
-                        # 정확한 키워드 매칭
-                        precautions_elem = notice_soup.find(string=re.compile(keyword, re.I))
-                        if precautions_elem:
-                            parent = precautions_elem.find_parent()
-                            if parent:
-                                # 부모 요소의 모든 텍스트 가져오기
-                                precautions_text = parent.get_text(separator='\n', strip=True)
-                                # 키워드 다음의 텍스트 추출
-                                keyword_pos = precautions_text.find(keyword)
-                                if keyword_pos >= 0:
-                                    after_keyword = precautions_text[keyword_pos + len(keyword):].strip()
-                                    # 줄바꿈이나 특수문자 제거 후 추출
-                                    precautions = re.sub(r'^[:\s\n]+', '', after_keyword)
-                                    precautions = precautions.split('\n')[0].strip()[:1000]
-                                    if len(precautions) > 10:
-                                        if self.debug:
-                                            print(f"  [디버깅] 텍스트 기반에서 주의사항 추출: {len(precautions)}자")
-                                        break
-                        
-                        # h4, h3, h2 태그에서 찾기
-                        if not precautions:
-                            headings = notice_soup.find_all(['h2', 'h3', 'h4'])
-                            for heading in headings:
-                                heading_text = heading.get_text(strip=True)
-                                if keyword in heading_text:
-                                    # 다음 형제 요소나 부모의 다음 형제에서 내용 찾기
-                                    next_elem = heading.find_next_sibling()
-                                    if next_elem:
-                                        precautions = next_elem.get_text(separator='\n', strip=True)
-                                        if len(precautions) > 10:
-                                            if self.debug:
-                                                print(f"  [디버깅] 헤딩 구조에서 주의사항 추출: {len(precautions)}자")
-                                            break
-                                    else:
-                                        # 부모의 다음 형제 찾기
-                                        parent = heading.find_parent()
-                                        if parent:
-                                            parent_next = parent.find_next_sibling()
-                                            if parent_next:
-                                                precautions = parent_next.get_text(separator='\n', strip=True)
-                                                if len(precautions) > 10:
-                                                    if self.debug:
-                                                        print(f"  [디버깅] 부모 형제에서 주의사항 추출: {len(precautions)}자")
-                                                    break
-                        if precautions:
-                            break
-                
-                # 사용 방법과 주의사항 텍스트 정리
-                if usage_method:
-                    usage_method = usage_method.strip()[:1000]
-                    if len(usage_method) < 10:
-                        usage_method = ""
-                
-                if precautions:
-                    precautions = precautions.strip()[:1000]
-                    if len(precautions) < 10:
-                        precautions = ""
-                
-                # 성분 텍스트 정리
-                if ingredients:
-                    ingredients = re.sub(r'^\d+\.\s*\w+', '', ingredients)
-                    if len(ingredients) < 20:
-                        ingredients = ""
-                    else:
-                        ingredients = ingredients[:2000].strip()
+                    print(f"  [디버깅] 고시 파싱: 사용 방법 {len(usage_method)}자, 성분 {len(ingredients)}자, 주의사항 {len(precautions)}자")
                 
         except Exception as e:
             if self.debug:
                 print(f"  [디버깅] 상품정보제공 고시 추출 오류: {e}")
+        finally:
+            self._pause_popup_script(False)
         
         product_info['usage_method'] = usage_method
         product_info['ingredients'] = ingredients
         product_info['precautions'] = precautions
         
+        notice_time = time.monotonic() - notice_start
+        self.notice_stats['count'] += 1
+        self.notice_stats['total_time'] += notice_time
+        print(f"  ⏱ 고시 수집 시간: {notice_time:.1f}초")
+        
         return product_info
     
-    def get_product_info(self, url: str) -> Dict:
+    def get_product_info(self, url: str, include_notice: bool = True) -> Dict:
         """
         제품 기본 정보 추출
         
         Args:
             url: 제품 페이지 URL
+            include_notice: 상품정보제공 고시도 열어서 사용 방법/주의사항 수집
+                            (crawl_product_reviews는 리뷰 수집 후 고시를 따로 열기 때문에 False)
             
         Returns:
             제품 정보 딕셔너리
         """
-        self.driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
-        
-        # 팝업 닫기
-        self._close_popups()
+        # 이미 열린 제품 화면이면 다시 로드하지 않음 (팝업 닫기 포함)
+        self._ensure_page(url)
         
         try:
             soup = BeautifulSoup(self.driver.page_source, 'html.parser')
@@ -602,7 +835,7 @@ class AmoreMallCrawler:
             
             try:
                 # 페이지가 완전히 로드될 때까지 대기
-                time.sleep(2)
+                self.waits.dom_quiet()
                 
                 # Selenium으로 직접 요소 찾기
                 page_text = self.driver.page_source
@@ -877,43 +1110,47 @@ class AmoreMallCrawler:
             precautions = ""  # 주의사항
             
             try:
-                # "상품정보제공 고시 보기" 버튼 찾기 및 클릭
+                # "상품정보제공 고시 보기" 버튼 찾기 및 클릭 (include_notice=False면 건너뜀)
                 notice_button_selectors = [
                     (By.XPATH, "//*[contains(text(), '상품정보제공 고시')]"),
                     (By.XPATH, "//*[contains(text(), '상품정보제공')]"),
                     (By.XPATH, "//*[contains(text(), '고시 보기')]"),
                     (By.CSS_SELECTOR, "[class*='notice'][class*='button']"),
-                ]
+                ] if include_notice else []
                 
                 notice_button_found = False
                 current_url = self.driver.current_url  # 현재 URL 저장
+                # 고시 레이어를 읽는 동안 팝업 닫기 스크립트 정지
+                if include_notice:
+                    self._pause_popup_script(True)
                 
-                for by, selector in notice_button_selectors:
+                for by, selector in self.selectors.ordered('notice', 'notice_button', notice_button_selectors):
                     try:
                         notice_button = self.driver.find_element(by, selector)
                         if notice_button and notice_button.is_displayed():
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", notice_button)
-                            time.sleep(1)
+                            self.waits.element_clickable(notice_button)
                             before_url = self.driver.current_url
                             self.driver.execute_script("arguments[0].click();", notice_button)
-                            time.sleep(3)  # 페이지 이동 또는 콘텐츠 로드 대기
+                            self.waits.click_settled(before_url)  # 페이지 이동 또는 콘텐츠 로드 대기
                             after_url = self.driver.current_url
+                            self._set_page_view('notice')
                             
                             # URL이 변경되었는지 확인
                             if before_url != after_url:
+                                self.navigation_count += 1
                                 print(f"  ✓ 상품정보제공 고시 열기 (페이지 이동)")
                             else:
                                 # URL이 변경되지 않았으면 같은 페이지에서 섹션이 표시됨
                                 print(f"  ✓ 상품정보제공 고시 열기 (같은 페이지)")
-                                # 추가 대기 (동적 콘텐츠 로드)
-                                time.sleep(3)
                                 # 페이지 스크롤하여 모든 콘텐츠 로드
                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                time.sleep(2)
+                                self.waits.dom_quiet(quiet_ms=300, timeout=3)
                                 self.driver.execute_script("window.scrollTo(0, 0);")
-                                time.sleep(1)
+                                self.waits.dom_quiet(quiet_ms=300, timeout=1)
                             
                             notice_button_found = True
+                            self.selectors.record('notice', 'notice_button', notice_button_selectors, (by, selector))
                             break
                     except:
                         continue
@@ -922,139 +1159,19 @@ class AmoreMallCrawler:
                     # 페이지 이동 후 정보 추출
                     # 페이지 소스 다시 가져오기 (동적 콘텐츠 반영)
                     # 추가 대기 (동적 콘텐츠가 완전히 로드될 때까지)
-                    time.sleep(2)
+                    self.waits.dom_quiet()
                     # 페이지 소스 다시 가져오기
                     notice_soup = BeautifulSoup(self.driver.page_source, 'html.parser')
                     
-                    # 변수 초기화는 함수 스코프에서 이미 했으므로 여기서는 하지 않음
-                    # (함수 스코프의 변수에 직접 할당됨)
-                    
-                    if self.debug:
-                        print(f"  [디버깅] 상품정보제공 고시 페이지 파싱 시작")
-                    
-                    # 사용 방법 추출
-                    usage_keywords = ['사용방법', '사용 방법', 'How to Use']
-                    for keyword in usage_keywords:
-                        usage_elem = notice_soup.find(string=re.compile(keyword, re.I))
-                        if usage_elem:
-                            parent = usage_elem.find_parent()
-                            if parent:
-                                # 다음 형제 요소나 부모의 텍스트에서 사용 방법 찾기
-                                usage_text = parent.get_text(separator='\n', strip=True)
-                                # "사용방법" 다음 텍스트 추출
-                                usage_match = re.search(rf'{keyword}[^\n]*\n([^\n]+)', usage_text, re.I)
-                                if usage_match:
-                                    usage_method = usage_match.group(1).strip()
-                                else:
-                                    # 부모 요소의 전체 텍스트에서 추출
-                                    usage_method = usage_text.split(keyword)[-1].strip()[:500]
-                                break
+                    parse_start = time.monotonic()
+                    fields = extract_notice_fields(notice_soup)
+                    self.notice_stats['parse_time'] += time.monotonic() - parse_start
+                    usage_method = fields['usage_method']
+                    ingredients = fields['ingredients']
+                    precautions = fields['precautions']
                     
-                    # 성분 추출 (더 강화된 방법)
-                    # 방법 1: h4 태그에서 "화장품법" 또는 "성분" 키워드 찾기 (가장 정확)
-                    h4_elems = notice_soup.find_all('h4')
                     if self.debug:
-                        print(f"  [디버깅] h4 요소 {len(h4_elems)}개 발견")
-                    for h4 in h4_elems:
-                        h4_text = h4.get_text(strip=True)
-                        if self.debug and ('화장품법' in h4_text or '성분' in h4_text):
-                            print(f"  [디버깅] 성분 관련 h4 발견: {h4_text[:80]}")
-                        if '화장품법' in h4_text and '성분' in h4_text:
-                            # h4 다음 형제 요소에서 성분 찾기
-                            next_sibling = h4.find_next_sibling()
-                            if next_sibling:
-                                ingredients = next_sibling.get_text(separator=' ', strip=True)
-                                if self.debug:
-                                    print(f"  [디버깅] next_sibling에서 성분 추출: {len(ingredients)}자")
-                                if len(ingredients) > 20:
-                                    if self.debug:
-                                        print(f"  [디버깅] ✓ 성분 추출 성공! (방법1)")
-                                    break
-                            # h4의 부모 요소에서 찾기
-                            if self.debug and (not ingredients or len(ingredients) <= 20):
-                                print(f"  [디버깅] next_sibling에서 성분 추출 실패, 부모 요소 확인 중...")
-                            parent = h4.find_parent()
-                            if parent and (not ingredients or len(ingredients) <= 20):
-                                # 부모의 다음 형제나 자식 요소에서 찾기
-                                for sibling in parent.find_next_siblings():
-                                    text = sibling.get_text(separator=' ', strip=True)
-                                    if len(text) > 50:
-                                        ingredients = text
-                                        break
-                                if not ingredients:
-                                    # 부모의 모든 텍스트에서 h4 다음 부분만 추출
-                                    parent_text = parent.get_text(separator=' ', strip=True)
-                                    h4_pos = parent_text.find(h4_text)
-                                    if h4_pos >= 0:
-                                        after_h4 = parent_text[h4_pos + len(h4_text):].strip()
-                                        if len(after_h4) > 20:
-                                            ingredients = after_h4
-                            break
-                    
-                    # 방법 2: dt/dd 구조에서 찾기
-                    if not ingredients or len(ingredients) < 10:
-                        ingredients_keywords = ['성분', '화장품법', 'ingredient', '성분명']
-                        for keyword in ingredients_keywords:
-                            dt_elem = notice_soup.find('dt', string=re.compile(keyword, re.I))
-                            if dt_elem:
-                                next_dd = dt_elem.find_next_sibling('dd')
-                                if next_dd:
-                                    ingredients = next_dd.get_text(separator=' ', strip=True)
-                                    if len(ingredients) > 10:
-                                        break
-                    
-                    # 방법 3: div.dSection 구조에서 찾기 (이미지에서 확인된 구조)
-                    if not ingredients or len(ingredients) < 10:
-                        d_sections = notice_soup.find_all('div', class_=re.compile('dSection|section', re.I))
-                        for section in d_sections:
-                            section_text = section.get_text(strip=True)
-                            if '화장품법' in section_text and '성분' in section_text:
-                                # h4 다음의 텍스트 추출
-                                h4_in_section = section.find('h4')
-                                if h4_in_section:
-                                    # h4 다음의 모든 텍스트
-                                    h4_text = h4_in_section.get_text(strip=True)
-                                    full_text = section.get_text(separator=' ', strip=True)
-                                    h4_pos = full_text.find(h4_text)
-                                    if h4_pos >= 0:
-                                        after_h4 = full_text[h4_pos + len(h4_text):].strip()
-                                        if len(after_h4) > 20:
-                                            ingredients = after_h4
-                                            break
-                    
-                    # 방법 4: 텍스트 패턴으로 찾기
-                    if not ingredients or len(ingredients) < 10:
-                        notice_text = notice_soup.get_text(separator=' ')
-                        # "화장품법...성분" 다음의 긴 텍스트 찾기
-                        pattern = r'화장품법[^성]*성분[^\\n]*([^\\n]{50,})'
-                        match = re.search(pattern, notice_text)
-                        if match:
-                            ingredients = match.group(1).strip()
-                    
-                    # 성분 텍스트 정리 (최대 2000자)
-                    if ingredients:
-                        # 불필요한 텍스트 제거
-                        ingredients = re.sub(r'^\d+\.\s*\w+', '', ingredients)
-                        # 너무 짧은 경우 제외
-                        if len(ingredients) < 20:
-                            ingredients = ""
-                        else:
-                            ingredients = ingredients[:2000].strip()
-                    
-                    # 주의사항 추출
-                    precautions_keywords = ['주의사항', '주의 사항', '주의', 'precaution', '경고']
-                    for keyword in precautions_keywords:
-                        precautions_elem = notice_soup.find(string=re.compile(keyword, re.I))
-                        if precautions_elem:
-                            parent = precautions_elem.find_parent()
-                            if parent:
-                                precautions_text = parent.get_text(separator='\n', strip=True)
-                                precautions_match = re.search(rf'{keyword}[^\n]*\n([^\n]+)', precautions_text, re.I)
-                                if precautions_match:
-                                    precautions = precautions_match.group(1).strip()
-                                else:
-                                    precautions = precautions_text.split(keyword)[-1].strip()[:500]
-                                break
+                        print(f"  [디버깅] 고시 파싱: 사용 방법 {len(usage_method)}자, 성분 {len(ingredients)}자, 주의사항 {len(precautions)}자")
                     
                     # 상품정보제공 고시 페이지에서 제품 페이지로 돌아가기
                     try:
@@ -1064,25 +1181,31 @@ class AmoreMallCrawler:
                         for back_button in back_buttons:
                             if back_button.is_displayed():
                                 self.driver.execute_script("arguments[0].click();", back_button)
-                                time.sleep(2)
+                                self.waits.page_settled()
+                                self.navigation_count += 1
                                 back_found = True
                                 break
                         
                         if not back_found:
                             # 뒤로가기 버튼이 없으면 브라우저 뒤로가기
                             self.driver.back()
-                            time.sleep(2)
+                            self.waits.page_settled()
+                            self.navigation_count += 1
                     except:
                         # 뒤로가기 버튼이 없으면 브라우저 뒤로가기
                         try:
                             self.driver.back()
-                            time.sleep(2)
+                            self.waits.page_settled()
+                            self.navigation_count += 1
                         except:
                             pass
                         
             except Exception as e:
                 if self.debug:
                     print(f"  [디버깅] 상품정보제공 고시 추출 오류: {e}")
+            finally:
+                if include_notice:
+                    self._pause_popup_script(False)
             
             # 가격 정보 우선순위: 페이지에서 추출한 정보 > 제품명에서 추출한 정보
             # 원래 가격 (취소선이 있는 가격, 정가)
@@ -1158,20 +1281,65 @@ class AmoreMallCrawler:
                 f.write(html_content)
             print(f"  [디버깅] HTML 저장: {filepath}")
     
-    def extract_reviews(self, max_pages: int = 10, max_reviews: int = None, test_mode: bool = False, max_more_clicks: int = None) -> List[Dict]:
+    def extract_reviews(self, max_pages: int = 10, max_reviews: int = None, test_mode: bool = False, max_more_clicks: int = None, known_fingerprints: Optional[Set[str]] = None,
+                        review_total: Optional[int] = None, time_budget: Optional[float] = None, checkpoint_key: Optional[str] = None) -> List[Dict]:
         """
-        후기 데이터 추출
+        후기 데이터 추출 (iter_reviews의 결과를 리스트로 모음)
         
         Args:
             max_pages: 최대 페이지 수 (None이면 모든 페이지)
             max_reviews: 최대 리뷰 수 (None이면 제한 없음)
             test_mode: 테스트 모드 (더 보기 버튼 1번만 클릭)
             max_more_clicks: 더 보기 버튼 최대 클릭 횟수 (None이면 test_mode에 따라 자동 설정)
+            known_fingerprints: 이미 저장된 리뷰 지문 (지정하면 증분 모드, iter_reviews 참고)
+            review_total: 제품의 전체 리뷰 수 (알면 "더 보기" 클릭 횟수를 계산, iter_reviews 참고)
+            time_budget: 리뷰 수집에 쓸 수 있는 시간 (초, None이면 제한 없음)
+            checkpoint_key: 체크포인트 식별자 (제품 코드 등, iter_reviews 참고)
             
         Returns:
             후기 리스트
         """
         reviews = []
+        for batch in self.iter_reviews(max_pages, max_reviews, test_mode, max_more_clicks, known_fingerprints, review_total, time_budget, checkpoint_key):
+            reviews.extend(batch)
+        return reviews
+    
+    def iter_reviews(self, max_pages: int = 10, max_reviews: int = None, test_mode: bool = False, max_more_clicks: int = None, known_fingerprints: Optional[Set[str]] = None,
+                     review_total: Optional[int] = None, time_budget: Optional[float] = None, checkpoint_key: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        후기 데이터를 페이지("더 보기" 클릭) 단위로 추출하는 제너레이터
+        
+        Args:
+            max_pages: 최대 페이지 수 (None이면 모든 페이지)
+            max_reviews: 최대 리뷰 수 (None이면 제한 없음)
+            test_mode: 테스트 모드 (더 보기 버튼 1번만 클릭)
+            max_more_clicks: 더 보기 버튼 최대 클릭 횟수 (None이면 test_mode에 따라 자동 설정)
+            known_fingerprints: 이미 저장된 리뷰 지문 (증분 모드: 최신순 정렬 후 저장된 리뷰를 만나면 중단,
+                                최신순을 선택하지 못하면 페이지의 리뷰가 모두 저장된 리뷰일 때 중단)
+            review_total: 제품의 전체 리뷰 수. 지정하면 첫 페이지의 리뷰 수를 페이지 크기로 보고
+                          목표(전체 × review_coverage, max_reviews)에 필요한 만큼만 "더 보기"를 클릭
+                          (max_more_clicks, test_mode의 횟수는 상한으로 사용)
+            time_budget: 리뷰 수집에 쓸 수 있는 시간 (초). 넘으면 더 불러오지 않고 종료
+            checkpoint_key: 체크포인트 식별자 (제품 코드 등). review_checkpoint_path가 설정되어 있으면
+                            CHECKPOINT_EVERY_PAGES 페이지마다 진행 상황을 기록하고, 기록이 있으면 저장된 리뷰를
+                            먼저 내보낸 뒤 "더 보기"를 같은 횟수만큼 파싱 없이 클릭하고 이어서 수집
+                            (정상 종료하면 체크포인트 삭제, 오류로 중단되면 남겨 둠)
+            
+        Yields:
+            페이지마다 새로 추출한 후기 리스트 (중복 제거됨, 빈 리스트는 내보내지 않음)
+        """
+        start_time = time.monotonic()
+        review_count = 0  # 지금까지 내보낸 후기 수
+        seen_review_ids = set()  # 중복 체크를 위한 리뷰 ID
+        pending_parses = []  # 파싱 프로세스 풀에 넘긴 리뷰 카드 묶음 (Future, 카드 수)
+        pending_cards = 0  # 아직 파싱 결과를 받지 않은 리뷰 카드 수
+        checkpoint = self.review_checkpoint if checkpoint_key else None
+        unsaved_reviews = []  # 지난 체크포인트 이후 내보낸 후기
+        pages_since_checkpoint = 0
+        page_size = None  # 첫 페이지의 리뷰 수 (체크포인트에 기록)
+        completed = False  # 오류 없이 끝났는지 여부 (체크포인트 삭제 조건)
+        click_times = []  # "더 보기" 클릭별 소요 시간 (초)
+        pruned_cards = 0  # 화면에서 정리한 리뷰 카드 수
         
         try:
             # 팝업 닫기
@@ -1180,10 +1348,12 @@ class AmoreMallCrawler:
             # 페이지 하단으로 스크롤하여 후기 섹션 로드
             print("후기 섹션 찾는 중...")
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
+            self.waits.dom_quiet()
             
             # 스크롤 후 다시 팝업 닫기 (스크롤로 인해 팝업이 다시 나타날 수 있음)
             self._close_popups()
+            # 리뷰/옵션 레이어를 읽는 동안 팝업 닫기 스크립트 정지
+            self._pause_popup_script(True)
             
             # 여러 방법으로 후기 탭/섹션 찾기
             review_tab_found = False
@@ -1201,7 +1371,7 @@ class AmoreMallCrawler:
                 "[class*='tab'][class*='후기']",
             ]
             
-            for selector in tab_css_selectors:
+            for selector in self.selectors.ordered('product', 'review_tab', tab_css_selectors):
                 try:
                     tabs = self.driver.find_elements(By.CSS_SELECTOR, selector)
                     for tab in tabs:
@@ -1211,10 +1381,11 @@ class AmoreMallCrawler:
                             # 숫자가 포함된 탭이면 우선 선택
                             if any(char.isdigit() for char in tab_text):
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                                time.sleep(1)
+                                self.waits.element_clickable(tab)
                                 self.driver.execute_script("arguments[0].click();", tab)
-                                time.sleep(3)
+                                self.waits.dom_quiet()
                                 review_tab_found = True
+                                self.selectors.record('product', 'review_tab', tab_css_selectors, selector)
                                 print(f"✓ 후기/리뷰 탭 클릭 완료: {tab_text[:30]} (CSS 셀렉터)")
                                 break
                     if review_tab_found:
@@ -1226,10 +1397,11 @@ class AmoreMallCrawler:
                             tab_text = tab.text.strip()
                             if ('리뷰' in tab_text or '후기' in tab_text) and tab.is_displayed():
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                                time.sleep(1)
+                                self.waits.element_clickable(tab)
                                 self.driver.execute_script("arguments[0].click();", tab)
-                                time.sleep(3)
+                                self.waits.dom_quiet()
                                 review_tab_found = True
+                                self.selectors.record('product', 'review_tab', tab_css_selectors, selector)
                                 print(f"✓ 후기/리뷰 탭 클릭 완료: {tab_text[:30]} (CSS 셀렉터)")
                                 break
                         if review_tab_found:
@@ -1261,9 +1433,9 @@ class AmoreMallCrawler:
                                 # 숫자가 포함된 리뷰 탭 찾기 (예: "리뷰 2,010")
                                 if ('후기' in tab_text or '리뷰' in tab_text) and len(tab_text) > 0:
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", tab)
-                                    time.sleep(1)
+                                    self.waits.element_clickable(tab)
                                     self.driver.execute_script("arguments[0].click();", tab)
-                                    time.sleep(3)
+                                    self.waits.dom_quiet()
                                     review_tab_found = True
                                     print(f"✓ 후기/리뷰 탭 클릭 완료: {tab_text[:30]} (XPath)")
                                     break
@@ -1279,9 +1451,10 @@ class AmoreMallCrawler:
                     for link in review_links:
                         if link.is_displayed():
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-                            time.sleep(1)
+                            self.waits.element_clickable(link)
+                            before_url = self.driver.current_url
                             self.driver.execute_script("arguments[0].click();", link)
-                            time.sleep(3)
+                            self.waits.click_settled(before_url)
                             review_tab_found = True
                             print("✓ 후기/리뷰 탭 클릭 완료 (링크 클릭)")
                             break
@@ -1292,10 +1465,18 @@ class AmoreMallCrawler:
                 print("⚠ 후기 탭을 찾지 못했습니다. 페이지 전체에서 후기 검색을 시도합니다.")
                 # 후기 섹션으로 스크롤
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
+                self.waits.dom_quiet()
+            
+            # 증분 재크롤링: 최신 리뷰부터 보이도록 정렬을 바꿈
+            newest_first = False
+            reached_known = False  # 이미 저장된 리뷰에 도달했는지 여부
+            if known_fingerprints is not None:
+                newest_first = self._select_newest_first()
             
-            # 중복 체크를 위한 리뷰 ID 저장
-            seen_review_ids = set()
+            # 증분 파싱 여부 (.reviewCard 구조가 없으면 전체 파싱으로 전환됨)
+            incremental = self.incremental_parse
+            use_js_backend = self.review_backend == 'js'
+            use_network_capture = self.review_backend == 'network'
             
             page = 1
             no_new_reviews_count = 0  # 새로운 리뷰가 없는 연속 횟수
@@ -1303,124 +1484,103 @@ class AmoreMallCrawler:
             # max_more_clicks가 지정되면 사용, 아니면 test_mode에 따라 자동 설정
             if max_more_clicks is not None:
                 MAX_MORE_BUTTON_CLICKS = max_more_clicks
-            else:
+            elif test_mode or not review_total:
                 MAX_MORE_BUTTON_CLICKS = 3 if test_mode else 15  # 테스트 모드면 3번, 아니면 15번
+            else:
+                MAX_MORE_BUTTON_CLICKS = None  # 첫 페이지를 본 뒤 전체 리뷰 수로 계산
+            click_budget_computed = False  # 전체 리뷰 수로 클릭 횟수를 계산했는지 여부
             
             if test_mode:
-                print(f"  [테스트 모드] '더 보기' 버튼을 {MAX_MORE_BUTTON_CLICKS}번만 클릭합니다.")
+                print(f"  [테스트 모드] '더 보기' 버튼을 최대 {MAX_MORE_BUTTON_CLICKS}번 클릭합니다.")
             elif max_more_clicks is not None:
-                print(f"  [사용자 지정] '더 보기' 버튼을 {MAX_MORE_BUTTON_CLICKS}번 클릭합니다.")
+                print(f"  [사용자 지정] '더 보기' 버튼을 최대 {MAX_MORE_BUTTON_CLICKS}번 클릭합니다.")
+            if time_budget is not None:
+                print(f"  ⏱ 리뷰 수집 시간 예산: {time_budget:.0f}초")
+            
+            # 체크포인트에서 재개: 저장된 리뷰를 먼저 내보내고 같은 위치까지 "더 보기"만 클릭
+            # (정렬 순서나 수집 방식이 다르면 클릭 위치가 맞지 않으므로 재개하지 않음)
+            checkpoint_context = f"{self.review_backend}:{'newest' if newest_first else 'default'}"
+            resumed = checkpoint.load(checkpoint_key, checkpoint_context) if checkpoint else None
+            if resumed:
+                print(f"  ✓ 체크포인트에서 이어서 수집: 후기 {len(resumed['reviews'])}개, '더 보기' {resumed['clicks']}회")
+                seen_review_ids.update(resumed['seen_ids'])
+                resumed_reviews = resumed['reviews'][:max_reviews] if max_reviews else resumed['reviews']
+                review_count = len(resumed_reviews)
+                if resumed_reviews:
+                    yield resumed_reviews
+                page_size = resumed['page_size']
+                if page_size and review_total and not click_budget_computed:
+                    needed_clicks = self._clicks_needed(review_total, page_size, max_reviews)
+                    MAX_MORE_BUTTON_CLICKS = needed_clicks if MAX_MORE_BUTTON_CLICKS is None else min(MAX_MORE_BUTTON_CLICKS, needed_clicks)
+                    click_budget_computed = True
+                elif MAX_MORE_BUTTON_CLICKS is None:
+                    MAX_MORE_BUTTON_CLICKS = 15
+                while more_button_click_count < resumed['clicks'] and self._click_more_button():
+                    more_button_click_count += 1
+                print(f"  → '더 보기' {more_button_click_count}회 클릭하여 이전 위치로 이동")
+                # 이미 수집한 카드와 응답은 다시 파싱하지 않음
+                self._mark_review_cards_crawled()
+                if use_network_capture:
+                    self._collect_network_review_cards()
             
             while (max_pages is None or page <= max_pages):
-                print(f"\n[페이지 {page}] 후기 크롤링 중... (현재 누적: {len(reviews)}개)")
+                print(f"\n[페이지 {page}] 후기 크롤링 중... (현재 누적: {review_count}개)")
                 
                 # 디버깅: 페이지 HTML 저장
                 if self.debug and page == 1:
                     self._save_debug_html(self.driver.page_source, f"page_{page}_source.html")
                 
-                # 현재 페이지의 리뷰 수 저장
-                reviews_before = len(reviews)
-                
-                # 방법 1: Selenium으로 직접 리뷰 요소 찾기 (정확한 셀렉터 우선)
-                selenium_reviews = []
-                selenium_selectors = [
-                    (By.CSS_SELECTOR, ".reviewCard"),  # 아모레몰의 개별 리뷰 카드
-                    (By.CSS_SELECTOR, "div.reviewCard"),
-                    (By.CSS_SELECTOR, "[class*='reviewCard']"),
-                    (By.CSS_SELECTOR, "[class*='review']"),
-                    (By.CSS_SELECTOR, "[class*='리뷰']"),
-                    (By.CSS_SELECTOR, "[class*='comment']"),
-                    (By.CSS_SELECTOR, "[data-review]"),
-                    (By.CSS_SELECTOR, "[id*='review']"),
-                    (By.XPATH, "//div[contains(@class, 'reviewCard')]"),
-                    (By.XPATH, "//div[contains(@class, 'review')]"),
-                    (By.XPATH, "//li[contains(@class, 'review')]"),
-                    (By.XPATH, "//article[contains(@class, 'review')]"),
-                ]
-                
-                for by, selector in selenium_selectors:
-                    try:
-                        elements = self.driver.find_elements(by, selector)
-                        if elements:
-                            selenium_reviews = elements
-                            print(f"  ✓ Selenium으로 {len(elements)}개의 리뷰 요소 발견: {selector}")
-                            break
-                    except:
-                        continue
+                # 네트워크 캡처: "더 보기" 클릭으로 받은 리뷰 API 응답을 그대로 사용
+                parsed_reviews = None
+                if use_network_capture:
+                    network_cards = self._collect_network_review_cards()
+                    if network_cards:
+                        print(f"  ✓ 네트워크 응답에서 리뷰 {len(network_cards)}개 캡처")
+                        parsed_reviews = [self._review_from_card_data(card, idx) for idx, card in enumerate(network_cards)]
+                        # 화면의 카드는 이미 응답으로 받았으므로 증분 파싱 대상에서 제외
+                        self._mark_review_cards_crawled()
+                    else:
+                        print("  → 캡처된 리뷰 응답이 없어 HTML 파싱으로 대체합니다.")
+                
+                # JavaScript 백엔드: 브라우저에서 리뷰 카드를 JSON으로 바로 추출
+                if parsed_reviews is None and use_js_backend:
+                    card_data = self._extract_review_cards_js(only_new=incremental)
+                    if card_data is None:
+                        # .reviewCard 구조가 없으면 HTML 파싱 방식으로 전환
+                        use_js_backend = False
+                    else:
+                        print(f"  ✓ JavaScript로 리뷰 카드 {len(card_data)}개 추출")
+                        parsed_reviews = [self._review_from_card_data(card, idx) for idx, card in enumerate(card_data)]
+                
+                # 후기 요소 찾기: 증분 모드면 지난번 이후 새로 추가된 리뷰 카드만 가져옴
+                review_elements = None
+                if parsed_reviews is not None:
+                    review_elements = []
+                elif incremental:
+                    review_elements = self._get_new_review_cards()
+                    if review_elements is None:
+                        # .reviewCard 구조가 없으면 전체 파싱 방식으로 전환
+                        incremental = False
+                    else:
+                        print(f"  ✓ 새로 추가된 리뷰 카드 {len(review_elements)}개 발견 (증분 파싱)")
                 
-                # 방법 2: BeautifulSoup으로 파싱
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                
-                # 다양한 방법으로 후기 요소 찾기
-                review_elements = []
-                
-                # 정확한 셀렉터 우선 (아모레몰 구조에 맞춤)
-                selectors = [
-                    {'class': 'reviewCard'},  # 아모레몰의 개별 리뷰 카드
-                    {'class': lambda x: x and 'reviewCard' in x},
-                    {'class': re.compile('reviewCard', re.I)},
-                    {'class': re.compile('review.*item|item.*review', re.I)},
-                    {'class': re.compile('review|comment|후기|리뷰', re.I)},
-                    {'class': lambda x: x and any(kw in x.lower() for kw in ['review', 'comment', '후기', '리뷰'])},
-                    {'data-review': True},
-                    {'id': re.compile('review|comment|리뷰|후기', re.I)},
-                ]
+                if review_elements is None:
+                    review_elements = self._find_review_elements(page)
+                    if not review_elements:
+                        break
                 
-                for selector in selectors:
-                    elements = soup.find_all(['div', 'li', 'article', 'section', 'tr'], selector)
-                    if elements:
-                        # reviewArea는 제외 (전체 영역이므로)
-                        elements = [e for e in elements if 'reviewArea' not in ' '.join(e.get('class', []))]
-                        if elements:
-                            review_elements = elements
-                            print(f"  ✓ BeautifulSoup으로 {len(elements)}개의 후기 요소 발견 (방법: {selector})")
-                            break
+                # 파싱 프로세스 풀: 새 카드 HTML만 넘기고 브라우저는 바로 다음 "더 보기"로 진행
+                deferred_cards = 0
+                # (증분 재크롤링은 저장된 리뷰를 바로 확인해야 하므로 넘기지 않음)
+                if parsed_reviews is None and self.parse_pool is not None and incremental and review_elements and known_fingerprints is None:
+                    card_htmls = [str(element) for element in review_elements]
+                    pending_parses.append((self.parse_pool.submit(parse_review_html, card_htmls, self.debug), len(card_htmls)))
+                    deferred_cards = len(card_htmls)
+                    pending_cards += deferred_cards
+                    parsed_reviews = []
                 
-                # 방법 3: 텍스트 패턴으로 찾기 (사용자명, 평점 등이 있는 요소)
-                if not review_elements:
-                    all_divs = soup.find_all(['div', 'li', 'article'])
-                    for div in all_divs:
-                        text = div.get_text()
-                        # 사용자명 패턴 (예: smle******) 또는 평점 패턴 찾기
-                        if (re.search(r'\w+\*+|\d+대|여성|남성|지성|건성|수분', text) and 
-                            len(text) > 50 and 
-                            (re.search(r'지속력|촉촉|유분|향|각질', text) or len(text) > 100)):
-                            review_elements.append(div)
-                    if review_elements:
-                        print(f"  ✓ {len(review_elements)}개의 후기 요소 발견 (텍스트 패턴)")
-                
-                # Selenium으로 찾은 요소를 BeautifulSoup 요소로 변환
-                if selenium_reviews and not review_elements:
-                    for selenium_elem in selenium_reviews[:20]:  # 최대 20개만
-                        try:
-                            html = selenium_elem.get_attribute('outerHTML')
-                            if html:
-                                soup_elem = BeautifulSoup(html, 'html.parser')
-                                review_elements.append(soup_elem)
-                        except:
-                            continue
-                    if review_elements:
-                        print(f"  ✓ Selenium 요소를 BeautifulSoup으로 변환: {len(review_elements)}개")
-                
-                if not review_elements:
-                    print("  ⚠ 후기 요소를 찾을 수 없습니다.")
-                    # 디버깅: 페이지 구조 일부 출력
-                    if page == 1:
-                        print("  [디버깅] 페이지의 주요 클래스명:")
-                        classes = set()
-                        for tag in soup.find_all(class_=True)[:30]:
-                            classes.update(tag.get('class', []))
-                        print(f"    {', '.join(list(classes)[:15])}")
-                        
-                        # 디버깅: 리뷰 관련 텍스트가 있는 요소 찾기
-                        review_text_elements = soup.find_all(string=re.compile('리뷰|후기|review', re.I))
-                        if review_text_elements:
-                            print(f"  [디버깅] '리뷰' 텍스트를 포함한 요소 {len(review_text_elements)}개 발견")
-                            for i, elem in enumerate(review_text_elements[:3]):
-                                parent = elem.parent if elem.parent else None
-                                if parent:
-                                    print(f"    예시 {i+1}: {parent.name} - {str(parent)[:200]}")
-                    break
+                if parsed_reviews is None:
+                    parsed_reviews = [self._parse_review_element(element, idx) for idx, element in enumerate(review_elements)]
                 
                 # 디버깅: 첫 번째 요소의 HTML 샘플 저장
                 if self.debug and page == 1 and review_elements:
@@ -1429,8 +1589,7 @@ class AmoreMallCrawler:
                     print(f"  [디버깅] 첫 번째 후기 요소 샘플 저장")
                 
                 page_reviews = []
-                for idx, element in enumerate(review_elements):
-                    review_data = self._parse_review_element(element, idx)
+                for review_data in parsed_reviews:
                     if review_data:
                         # 중복 체크 (사용자명 + 리뷰 텍스트 일부로 고유 ID 생성)
                         review_id = f"{review_data.get('username', '')}_{review_data.get('review_text', '')[:50]}"
@@ -1438,7 +1597,34 @@ class AmoreMallCrawler:
                             seen_review_ids.add(review_id)
                             page_reviews.append(review_data)
                 
-                if not page_reviews:
+                # 증분 재크롤링: 최신순이면 처음 만난 저장된 리뷰 앞까지만, 아니면 저장되지 않은 리뷰만 사용
+                if known_fingerprints is not None and page_reviews:
+                    known_flags = [review_fingerprint(review_data) in known_fingerprints for review_data in page_reviews]
+                    if newest_first and any(known_flags):
+                        page_reviews = page_reviews[:known_flags.index(True)]
+                        reached_known = True
+                    elif not newest_first:
+                        reached_known = all(known_flags)
+                        page_reviews = [review_data for review_data, known in zip(page_reviews, known_flags) if not known]
+                
+                # 첫 페이지의 리뷰 카드 수를 페이지 크기로 보고 필요한 "더 보기" 클릭 횟수 계산
+                if page == 1 and more_button_click_count == 0 and review_total and not click_budget_computed:
+                    page_size = deferred_cards or len(parsed_reviews)
+                    if page_size:
+                        needed_clicks = self._clicks_needed(review_total, page_size, max_reviews)
+                        MAX_MORE_BUTTON_CLICKS = needed_clicks if MAX_MORE_BUTTON_CLICKS is None else min(MAX_MORE_BUTTON_CLICKS, needed_clicks)
+                        click_budget_computed = True
+                        print(f"  → 전체 리뷰 {review_total}개, 페이지당 {page_size}개: '더 보기' {MAX_MORE_BUTTON_CLICKS}회 클릭 예정")
+                    elif MAX_MORE_BUTTON_CLICKS is None:
+                        MAX_MORE_BUTTON_CLICKS = 15
+                
+                # 파싱 프로세스에서 끝난 카드 묶음은 이번 페이지 결과와 함께 내보냄
+                if pending_parses:
+                    parsed, drained_cards = self._drain_parsed_reviews(pending_parses, seen_review_ids)
+                    pending_cards -= drained_cards
+                    page_reviews.extend(parsed)
+                
+                if not page_reviews and not deferred_cards and not reached_known:
                     print(f"  ⚠ 페이지 {page}에서 새로운 후기를 찾을 수 없습니다.")
                     no_new_reviews_count += 1
                     if no_new_reviews_count >= 3:
@@ -1447,86 +1633,69 @@ class AmoreMallCrawler:
                 else:
                     no_new_reviews_count = 0  # 새로운 후기가 있으면 카운터 리셋
                 
-                reviews.extend(page_reviews)
-                new_reviews_count = len(reviews) - reviews_before
-                print(f"✓ 페이지 {page}에서 {new_reviews_count}개의 새로운 후기 추출 (누적: {len(reviews)}개)")
+                if max_reviews:
+                    page_reviews = page_reviews[:max_reviews - review_count]
+                review_count += len(page_reviews)
+                if deferred_cards:
+                    print(f"✓ 페이지 {page}에서 리뷰 카드 {deferred_cards}개를 파싱 프로세스로 전달 (누적: {review_count + pending_cards}개)")
+                else:
+                    print(f"✓ 페이지 {page}에서 {len(page_reviews)}개의 새로운 후기 추출 (누적: {review_count}개)")
+                if page_reviews:
+                    yield page_reviews
+                
+                # 추출한(data-crawled) 카드는 화면에서 정리해 다음 클릭/스크롤이 느려지지 않게 함
+                if self.review_dom_prune:
+                    pruned_cards += self._prune_review_cards()
+                
+                # 체크포인트: 파싱 중인 카드까지 받은 뒤 지금까지의 클릭 횟수와 함께 기록
+                if checkpoint:
+                    unsaved_reviews.extend(page_reviews)
+                    pages_since_checkpoint += 1
+                    if pages_since_checkpoint >= CHECKPOINT_EVERY_PAGES:
+                        if pending_parses:
+                            parsed, drained_cards = self._drain_parsed_reviews(pending_parses, seen_review_ids, wait=True)
+                            pending_cards -= drained_cards
+                            if max_reviews:
+                                parsed = parsed[:max(0, max_reviews - review_count)]
+                            review_count += len(parsed)
+                            if parsed:
+                                yield parsed
+                            unsaved_reviews.extend(parsed)
+                        checkpoint.save(checkpoint_key, unsaved_reviews, more_button_click_count, seen_review_ids, page_size,
+                                        checkpoint_context)
+                        unsaved_reviews = []
+                        pages_since_checkpoint = 0
+                        print(f"  ✓ 체크포인트 저장 (누적 후기 {review_count}개, '더 보기' {more_button_click_count}회)")
+                
+                if reached_known:
+                    print(f"  ✓ 이미 저장된 리뷰에 도달했습니다. 크롤링 종료.")
+                    break
                 
-                # 최대 리뷰 수 제한 확인
-                if max_reviews and len(reviews) >= max_reviews:
+                # 최대 리뷰 수 제한 확인 (파싱 중인 카드도 포함)
+                if max_reviews and review_count + pending_cards >= max_reviews:
                     print(f"  ✓ 최대 리뷰 수({max_reviews}개)에 도달했습니다. 크롤링 종료.")
                     break
                 
-                # "더 보기" 버튼 찾기 및 클릭 (최대 20번 제한)
+                # 시간 예산을 다 쓰면 더 불러오지 않음
+                if time_budget is not None and time.monotonic() - start_time >= time_budget:
+                    print(f"  ⏱ 리뷰 수집 시간 예산({time_budget:.0f}초)을 모두 사용했습니다. 크롤링 종료.")
+                    break
+                
+                # 전체 리뷰 수로 계산한 클릭 횟수를 다 썼으면 다음 페이지/스크롤로 넘어가지 않고 종료
+                if click_budget_computed and more_button_click_count >= MAX_MORE_BUTTON_CLICKS:
+                    print(f"  ✓ 계산된 '더 보기' 클릭 횟수({MAX_MORE_BUTTON_CLICKS}회)를 모두 사용했습니다. 크롤링 종료.")
+                    break
+                
+                # "더 보기" 버튼 찾기 및 클릭 (최대 클릭 횟수 제한)
                 more_button_found = False
                 
-                if more_button_click_count < MAX_MORE_BUTTON_CLICKS:
-                    more_button_selectors = [
-                        # CSS 셀렉터 (우선순위 높음)
-                        (By.CSS_SELECTOR, "button.btnIr.more"),
-                        (By.CSS_SELECTOR, ".btnIr.more"),
-                        (By.CSS_SELECTOR, "button[class*='more']"),
-                        (By.CSS_SELECTOR, "[class*='more'][class*='btn']"),
-                        (By.CSS_SELECTOR, "a[class*='more']"),
-                        (By.CSS_SELECTOR, "[class*='more']"),
-                        # XPath 셀렉터
-                        (By.XPATH, "//button[contains(text(), '더 보기')]"),
-                        (By.XPATH, "//button[contains(text(), '더보기')]"),
-                        (By.XPATH, "//*[contains(text(), '더 보기')]"),
-                        (By.XPATH, "//*[contains(text(), '더보기')]"),
-                        (By.XPATH, "//*[contains(text(), '더 많은 리뷰')]"),
-                        (By.XPATH, "//*[contains(text(), '더 많은 후기')]"),
-                        (By.XPATH, "//button[contains(@class, 'more')]"),
-                        (By.XPATH, "//*[contains(@class, 'more') and contains(@class, 'btn')]"),
-                        (By.XPATH, "//a[contains(text(), '더 보기')]"),
-                        (By.XPATH, "//a[contains(text(), '더보기')]"),
-                    ]
-                    
-                    for by, selector in more_button_selectors:
-                        try:
-                            # find_elements로 여러 버튼 찾기
-                            more_buttons = self.driver.find_elements(by, selector)
-                            for more_button in more_buttons:
-                                if more_button and more_button.is_displayed():
-                                    # 버튼이 비활성화되어 있지 않은지 확인
-                                    is_disabled = (
-                                        more_button.get_attribute('disabled') is not None or
-                                        'disabled' in (more_button.get_attribute('class') or '') or
-                                        'disabled' in (more_button.get_attribute('aria-disabled') or '')
-                                    )
-                                    
-                                    # 버튼 텍스트 확인
-                                    button_text = more_button.text.strip()
-                                    if not button_text:
-                                        button_text = more_button.get_attribute('textContent') or ''
-                                    
-                                    # "더 많은 리뷰 보기" 또는 "더 보기" 관련 텍스트가 있는지 확인
-                                    if ('더' in button_text and ('보기' in button_text or '많은' in button_text or '리뷰' in button_text)) or (not button_text and 'more' in (more_button.get_attribute('class') or '').lower()):
-                                        if not is_disabled:
-                                            # 버튼이 보이도록 스크롤
-                                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", more_button)
-                                            time.sleep(1)
-                                            # 버튼 클릭
-                                            self.driver.execute_script("arguments[0].click();", more_button)
-                                            time.sleep(3)  # 새로운 리뷰 로딩 대기
-                                            # 추가로 아래로 스크롤하여 더 많은 리뷰 로드
-                                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                            time.sleep(2)
-                                            # 점진적 스크롤 (더 많은 리뷰 로드)
-                                            for i in range(3):
-                                                scroll_height = self.driver.execute_script("return document.body.scrollHeight")
-                                                scroll_pos = (i + 1) * (scroll_height // 4)
-                                                self.driver.execute_script(f"window.scrollTo(0, {scroll_pos});")
-                                                time.sleep(0.5)
-                                            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                            time.sleep(2)
-                                            more_button_click_count += 1
-                                            more_button_found = True
-                                            print(f"  → '더 보기' 버튼 클릭 ({more_button_click_count}/{MAX_MORE_BUTTON_CLICKS}) - 추가 리뷰 로딩 중...")
-                                            break
-                            if more_button_found:
-                                break
-                        except:
-                            continue
+                if MAX_MORE_BUTTON_CLICKS is None or more_button_click_count < MAX_MORE_BUTTON_CLICKS:
+                    click_start = time.monotonic()
+                    more_button_found = self._click_more_button()
+                    if more_button_found:
+                        click_times.append(time.monotonic() - click_start)
+                        more_button_click_count += 1
+                        print(f"  → '더 보기' 버튼 클릭 ({more_button_click_count}/{MAX_MORE_BUTTON_CLICKS}) - 추가 리뷰 로딩 중...")
                 else:
                     print(f"  ⚠ '더 보기' 버튼 최대 클릭 횟수({MAX_MORE_BUTTON_CLICKS}회)에 도달했습니다.")
                 
@@ -1563,9 +1732,12 @@ class AmoreMallCrawler:
                                 if not is_disabled:
                                     # 스크롤하여 버튼이 보이도록
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                                    time.sleep(1)
+                                    self.waits.element_clickable(next_button)
+                                    before_url = self.driver.current_url
                                     self.driver.execute_script("arguments[0].click();", next_button)
-                                    time.sleep(3)  # 페이지 로딩 대기
+                                    self.waits.click_settled(before_url)  # 페이지 로딩 대기
+                                    if self.driver.current_url != before_url:
+                                        self.navigation_count += 1
                                     next_page_found = True
                                     print(f"  → 다음 페이지로 이동 (페이지 {page + 1})")
                                     break
@@ -1580,7 +1752,7 @@ class AmoreMallCrawler:
                         # 페이지 하단으로 스크롤
                         last_height = self.driver.execute_script("return document.body.scrollHeight")
                         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                        time.sleep(2)
+                        self.waits.scroll_height_changed(last_height, timeout=3)
                         new_height = self.driver.execute_script("return document.body.scrollHeight")
                         
                         if new_height == last_height:
@@ -1593,411 +1765,568 @@ class AmoreMallCrawler:
                     # "더 보기" 버튼을 클릭했으면 같은 페이지에서 계속
                     pass
             
+            completed = True
         except Exception as e:
             print(f"후기 추출 오류: {e}")
             import traceback
             traceback.print_exc()
+            if checkpoint:
+                print(f"  → 체크포인트를 남겨 두었습니다. 다음 실행에서 이어서 수집합니다.")
+        finally:
+            self._pause_popup_script(False)
         
-        return reviews
+        # 남은 파싱 결과를 기다려 마지막 묶음으로 내보냄
+        if pending_parses:
+            start = time.monotonic()
+            parsed, _ = self._drain_parsed_reviews(pending_parses, seen_review_ids, wait=True)
+            if max_reviews:
+                parsed = parsed[:max(0, max_reviews - review_count)]
+            print(f"  ✓ 파싱 프로세스 결과 수집: 후기 {len(parsed)}개 (대기 {time.monotonic() - start:.2f}초)")
+            if parsed:
+                yield parsed
+        
+        if checkpoint and completed:
+            checkpoint.clear(checkpoint_key)
+        
+        if pruned_cards:
+            self.prune_stats['cards'] += pruned_cards
+            self.prune_stats['products'] += 1
+        if len(click_times) >= 20:
+            print(f"  ⏱ '더 보기' 클릭 {len(click_times)}회: 처음 10회 평균 {sum(click_times[:10]) / 10:.2f}초, "
+                  f"마지막 10회 평균 {sum(click_times[-10:]) / 10:.2f}초 (정리한 카드 {pruned_cards}개)")
     
-    def _parse_review_element(self, element, index: int = 0) -> Optional[Dict]:
+    def _click_more_button(self) -> bool:
         """
-        개별 후기 요소 파싱
+        "더 보기" 버튼을 찾아 클릭하고 새 리뷰가 로드될 때까지 대기
         
-        Args:
-            element: BeautifulSoup 요소
-            index: 요소 인덱스 (디버깅용)
-            
         Returns:
-            파싱된 후기 데이터
+            버튼을 클릭했으면 True
         """
-        try:
-            # 요소의 전체 텍스트 가져오기
-            all_text = element.get_text(separator='\n', strip=True)
-            text_lines = [line.strip() for line in all_text.split('\n') if line.strip()]
-            
-            # 최소한의 텍스트가 없으면 스킵
-            if not all_text or len(all_text) < 20:
-                return None
-            
-            review_data = {}
-            
-            # 사용자명 추출 - 아모레몰 구조에 맞춤
-            username = ""
-            # 아모레몰: span.profileCard__userTitle
-            username_elem = (
-                element.find('span', class_=re.compile('profileCard__userTitle|userTitle', re.I)) or
-                element.find(class_=re.compile('profileCard__userTitle|userTitle', re.I)) or
-                element.find('span', class_=lambda x: x and 'userTitle' in x) or
-                element.find(class_=re.compile('user|name|nick|id', re.I))
-            )
-            if username_elem:
-                username = username_elem.get_text(strip=True)
-            
-            # 텍스트에서 사용자명 패턴 직접 찾기
-            if not username:
-                username_match = re.search(r'([a-zA-Z0-9]+\*+)', all_text)
-                if username_match:
-                    username = username_match.group(1)
-            
-            # 사용자 정보 (나이/성별/피부타입 등) - 아모레몰 구조에 맞춤
-            user_info = ""
-            # 아모레몰: span.profileCard__userDesc
-            info_elem = (
-                element.find('span', class_=re.compile('profileCard__userDesc|userDesc', re.I)) or
-                element.find(class_=re.compile('profileCard__userDesc|userDesc', re.I)) or
-                element.find('span', class_=lambda x: x and 'userDesc' in x) or
-                element.find(class_=re.compile('info|demographic|user-info', re.I))
-            )
-            if info_elem:
-                user_info = info_elem.get_text(strip=True)
-            
-            # 텍스트에서 직접 추출 (백업)
-            if not user_info:
-                info_patterns = [
-                    r'(\d+대[^\n]*여성|남성[^\n]*)',
-                    r'(\d+대[^\n]*지성|건성|수분[^\n]*)',
-                    r'(\d+대[^\n]*)',
-                    r'(여성|남성[^\n]*지성|건성[^\n]*)'
-                ]
-                for pattern in info_patterns:
-                    info_match = re.search(pattern, all_text)
-                    if info_match:
-                        user_info = info_match.group(1).strip()
-                        break
-            
-            # user_info를 세분화하여 파싱
-            age = ""
-            gender = ""
-            skin_type_1 = ""
-            skin_type_2 = ""
-            
-            if user_info:
-                # "/" 구분자가 있는 경우와 없는 경우 모두 처리
-                if '/' in user_info:
-                    # "20대/여성/지성/트러블" 형식 파싱
-                    parts = [p.strip() for p in user_info.split('/') if p.strip()]
-                    
-                    if len(parts) >= 1:
-                        # 나이 추출 (예: "20대", "30대")
-                        age_match = re.search(r'(\d+대)', parts[0])
-                        if age_match:
-                            age = age_match.group(1)
-                    
-                    if len(parts) >= 2:
-                        # 성별 추출
-                        if '여성' in parts[1] or '여' in parts[1]:
-                            gender = '여성'
-                        elif '남성' in parts[1] or '남' in parts[1]:
-                            gender = '남성'
-                    
-                    if len(parts) >= 3:
-                        # 피부타입1 추출
-                        skin_type_1 = parts[2]
-                    
-                    if len(parts) >= 4:
-                        # 피부타입2 추출
-                        skin_type_2 = parts[3]
-                else:
-                    # "/" 구분자가 없는 경우 (예: "40대여성복합성주름")
-                    # 정규식으로 패턴 매칭하여 추출
-                    
-                    # 나이 추출 (예: "20대", "30대", "40대", "50대 이상")
-                    age_match = re.search(r'(\d+대(?:\s*이상)?)', user_info)
-                    if age_match:
-                        age = age_match.group(1).strip()
-                    
-                    # 성별 추출
-                    if '여성' in user_info or '여' in user_info:
-                        gender = '여성'
-                    elif '남성' in user_info or '남' in user_info:
-                        gender = '남성'
-                    
-                    # 피부타입 패턴 정의 (더 포괄적으로)
-                    # 주요 피부타입 (skin_type_1)
-                    main_skin_types = [
-                        '지성', '건성', '수분부족지성', '수분부족', '복합성', 
-                        '민감성', '중성', '수분'
-                    ]
-                    
-                    # 부가 정보 (skin_type_2)
-                    additional_info = [
-                        '트러블', '모공', '주름', '칙칙함', '건조함', 
-                        '탄력없음', '수분부족', '민감성'
-                    ]
-                    
-                    # 피부타입 추출 (긴 패턴부터 매칭)
-                    found_main = None
-                    found_additional = []
-                    
-                    # 주요 피부타입 찾기 (긴 것부터)
-                    for st in sorted(main_skin_types, key=len, reverse=True):
-                        if st in user_info:
-                            found_main = st
-                            break
-                    
-                    # 부가 정보 찾기
-                    for info in sorted(additional_info, key=len, reverse=True):
-                        if info in user_info and info != found_main:
-                            found_additional.append(info)
-                    
-                    # 중복 제거
-                    found_additional = list(dict.fromkeys(found_additional))  # 순서 유지하며 중복 제거
-                    
-                    # 피부타입 할당
-                    if found_main:
-                        skin_type_1 = found_main
-                    
-                    # 부가 정보 할당 (주요 피부타입과 중복되지 않는 것만)
-                    if found_additional:
-                        # 첫 번째 부가 정보를 skin_type_2에 할당
-                        # 단, 이미 skin_type_1에 할당된 것은 제외
-                        for info in found_additional:
-                            if info != skin_type_1:
-                                skin_type_2 = info
-                                break
+        more_button_selectors = [
+            # CSS 셀렉터 (우선순위 높음)
+            (By.CSS_SELECTOR, "button.btnIr.more"),
+            (By.CSS_SELECTOR, ".btnIr.more"),
+            (By.CSS_SELECTOR, "button[class*='more']"),
+            (By.CSS_SELECTOR, "[class*='more'][class*='btn']"),
+            (By.CSS_SELECTOR, "a[class*='more']"),
+            (By.CSS_SELECTOR, "[class*='more']"),
+            # XPath 셀렉터
+            (By.XPATH, "//button[contains(text(), '더 보기')]"),
+            (By.XPATH, "//button[contains(text(), '더보기')]"),
+            (By.XPATH, "//*[contains(text(), '더 보기')]"),
+            (By.XPATH, "//*[contains(text(), '더보기')]"),
+            (By.XPATH, "//*[contains(text(), '더 많은 리뷰')]"),
+            (By.XPATH, "//*[contains(text(), '더 많은 후기')]"),
+            (By.XPATH, "//button[contains(@class, 'more')]"),
+            (By.XPATH, "//*[contains(@class, 'more') and contains(@class, 'btn')]"),
+            (By.XPATH, "//a[contains(text(), '더 보기')]"),
+            (By.XPATH, "//a[contains(text(), '더보기')]"),
+        ]
+        
+        for by, selector in self.selectors.ordered('review_list', 'more_button', more_button_selectors):
+            try:
+                # find_elements로 여러 버튼 찾기
+                more_buttons = self.driver.find_elements(by, selector)
+                for more_button in more_buttons:
+                    if more_button and more_button.is_displayed():
+                        # 버튼이 비활성화되어 있지 않은지 확인
+                        is_disabled = (
+                            more_button.get_attribute('disabled') is not None or
+                            'disabled' in (more_button.get_attribute('class') or '') or
+                            'disabled' in (more_button.get_attribute('aria-disabled') or '')
+                        )
                         
-                        # 두 번째 부가 정보가 있으면 skin_type_2에 추가 (또는 별도 처리)
-                        if len(found_additional) > 1 and not skin_type_2:
-                            for info in found_additional[1:]:
-                                if info != skin_type_1:
-                                    skin_type_2 = info
-                                    break
-                    
-                    # 나이가 없고 피부타입만 있는 경우 (예: "건성건조함")
-                    if not age and (skin_type_1 or skin_type_2):
-                        # 이미 파싱된 상태이므로 그대로 사용
-                        pass
-            
-            # 평점 추출 - 아모레몰 구조에 맞춤
-            rating = 0
-            
-            # 방법 1: 아모레몰 구조 - div.icoStarWrap.star5 (star5 = 5점)
-            star_wrap = element.find('div', class_=re.compile('icoStarWrap|starWrap', re.I))
-            if star_wrap:
-                star_class = ' '.join(star_wrap.get('class', []))
-                # star5, star4 등의 패턴 찾기
-                star_match = re.search(r'star(\d+)', star_class)
-                if star_match:
-                    rating = int(star_match.group(1))
-                else:
-                    # 별 개수 세기
-                    stars = star_wrap.find_all('i', class_=re.compile('icoStar|star', re.I))
-                    rating = len(stars) if stars else 0
-            
-            # 방법 2: 별 요소 직접 찾기
-            if rating == 0:
-                star_elements = element.find_all('i', class_=re.compile('icoStar|star', re.I))
-                if star_elements:
-                    rating = len(star_elements)
-            
-            # 방법 3: 텍스트에서 평점 숫자 찾기
-            if rating == 0:
-                rating_match = re.search(r'(\d+)\s*점|평점[:\s]*(\d+)|(\d+)\s*/\s*5', all_text)
-                if rating_match:
-                    rating = int(rating_match.group(1) or rating_match.group(2) or rating_match.group(3))
-            
-            # 방법 4: 클래스에서 평점 찾기
-            if rating == 0:
-                rating_elem = element.find(class_=re.compile('rating|score|point', re.I))
-                if rating_elem:
-                    rating_text = rating_elem.get_text(strip=True)
-                    rating_match = re.search(r'(\d+)', rating_text)
-                    if rating_match:
-                        rating = int(rating_match.group(1))
-            
-            # 옵션 정보 (예: "옵션: 베리")
-            option = ""
-            option_patterns = [
-                r'옵션[:\s]*([^\n]+)',
-                r'option[:\s]*([^\n]+)',
-                r'선택[:\s]*([^\n]+)'
-            ]
-            
-            for pattern in option_patterns:
-                option_match = re.search(pattern, all_text, re.I)
-                if option_match:
-                    option = option_match.group(1).strip()
-                    break
+                        # 버튼 텍스트 확인
+                        button_text = more_button.text.strip()
+                        if not button_text:
+                            button_text = more_button.get_attribute('textContent') or ''
+                        
+                        # "더 많은 리뷰 보기" 또는 "더 보기" 관련 텍스트가 있는지 확인
+                        if ('더' in button_text and ('보기' in button_text or '많은' in button_text or '리뷰' in button_text)) or (not button_text and 'more' in (more_button.get_attribute('class') or '').lower()):
+                            if not is_disabled:
+                                # 버튼이 보이도록 스크롤
+                                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", more_button)
+                                self.waits.element_clickable(more_button)
+                                # 버튼 클릭
+                                cards_before = self.waits.count('.reviewCard')
+                                self.driver.execute_script("arguments[0].click();", more_button)
+                                # 새로운 리뷰 로딩 대기 (리뷰 카드 수 증가 후 렌더링 안정화)
+                                if self.waits.review_count_increased(cards_before):
+                                    self.waits.dom_quiet(quiet_ms=300, timeout=3)
+                                # 추가로 아래로 스크롤하여 더 많은 리뷰 로드
+                                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                                self.waits.dom_quiet(quiet_ms=300, timeout=3)
+                                # 점진적 스크롤 (더 많은 리뷰 로드)
+                                for i in range(3):
+                                    scroll_height = self.driver.execute_script("return document.body.scrollHeight")
+                                    scroll_pos = (i + 1) * (scroll_height // 4)
+                                    self.driver.execute_script(f"window.scrollTo(0, {scroll_pos});")
+                                    self.waits.dom_quiet(quiet_ms=200, timeout=1)
+                                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                                self.waits.dom_quiet(quiet_ms=300, timeout=3)
+                                self.selectors.record('review_list', 'more_button', more_button_selectors, (by, selector))
+                                return True
+            except:
+                continue
+        return False
+    
+    def _clicks_needed(self, review_total: int, page_size: int, max_reviews: int = None) -> int:
+        """
+        목표 리뷰 수까지 필요한 "더 보기" 클릭 횟수
+        
+        Args:
+            review_total: 제품의 전체 리뷰 수
+            page_size: 첫 페이지(클릭 한 번)에 보이는 리뷰 수
+            max_reviews: 최대 리뷰 수 (None이면 제한 없음)
             
-            # 리뷰 텍스트 추출 - 아모레몰 구조에 맞춤
-            review_text = ""
+        Returns:
+            클릭 횟수 (목표 = 전체 리뷰 수 × review_coverage, max_reviews 이하)
+        """
+        target = math.ceil(review_total * min(max(self.review_coverage, 0.0), 1.0))
+        if max_reviews:
+            target = min(target, max_reviews)
+        return max(0, math.ceil((target - page_size) / page_size))
+    
+    def _drain_parsed_reviews(self, pending_parses: List[tuple], seen_review_ids: set, wait: bool = False) -> tuple[List[Dict], int]:
+        """
+        파싱 프로세스 풀의 결과를 제출 순서대로 꺼내 중복 제거
+        
+        Args:
+            pending_parses: (parse_review_html Future, 카드 수) 리스트 (꺼낸 항목은 제거됨)
+            seen_review_ids: 이미 내보낸 리뷰 ID 집합
+            wait: 끝나지 않은 결과도 기다릴지 여부 (False면 앞에서부터 끝난 것만 꺼냄)
             
-            # 방법 1: 아모레몰 구조 - p.txt 또는 div.txt
-            text_elem = (
-                element.find('p', class_='txt') or
-                element.find('p', class_=lambda x: x and 'txt' in x) or
-                element.find('div', class_='txt') or
-                element.find(['p', 'div'], class_=re.compile('txt|text|content', re.I))
-            )
-            if text_elem:
-                review_text = text_elem.get_text(strip=True)
-                # 불필요한 텍스트 제거 (신고 버튼 등)
-                review_text = re.sub(r'신고내용.*?차단하기', '', review_text, flags=re.DOTALL)
-                review_text = re.sub(r'작성자:.*?글내용:', '', review_text)
-                review_text = review_text.strip()
-            
-            # 방법 2: 모든 텍스트 라인 중 가장 긴 것 찾기
-            if not review_text or len(review_text) < 20:
-                # 리뷰 관련 키워드가 포함된 긴 텍스트 찾기
-                review_keywords = ['지속력', '촉촉', '유분', '향', '각질', '입술', '립', '보습', '수분', '건조', '사용', '후기']
-                candidate_texts = []
-                
-                for line in text_lines:
-                    if len(line) > 30:  # 최소 길이
-                        # 리뷰 키워드가 있거나 매우 긴 텍스트
-                        if any(kw in line for kw in review_keywords) or len(line) > 100:
-                            candidate_texts.append(line)
-                
-                if candidate_texts:
-                    # 가장 긴 텍스트 선택
-                    review_text = max(candidate_texts, key=len)
-                    # 불필요한 텍스트 제거
-                    review_text = re.sub(r'신고내용.*?차단하기', '', review_text, flags=re.DOTALL)
-                    review_text = review_text.strip()
-                elif text_lines:
-                    # 키워드가 없어도 가장 긴 텍스트 선택
-                    review_text = max(text_lines, key=len)
-            
-            # 리뷰 타입 (예: "한달 사용 리뷰")
-            review_type = ""
-            type_patterns = [
-                r'(\d+\s*[일개월주년]+?\s*사용\s*리뷰)',
-                r'(한달|한\s*달|1개월)\s*사용',
-                r'사용\s*리뷰'
-            ]
+        Returns:
+            (새 후기 리스트, 꺼낸 카드 수) 튜플
+        """
+        reviews = []
+        drained_cards = 0
+        while pending_parses and (wait or pending_parses[0][0].done()):
+            future, card_count = pending_parses.pop(0)
+            drained_cards += card_count
+            try:
+                parsed_reviews = future.result()
+            except Exception as e:
+                print(f"  ⚠ 리뷰 카드 파싱 실패: {e}")
+                continue
+            for review_data in parsed_reviews:
+                if not review_data:
+                    continue
+                review_id = f"{review_data.get('username', '')}_{review_data.get('review_text', '')[:50]}"
+                if review_id not in seen_review_ids:
+                    seen_review_ids.add(review_id)
+                    reviews.append(review_data)
+        return reviews, drained_cards
+    
+    def _select_newest_first(self) -> bool:
+        """
+        리뷰 정렬을 최신순으로 변경 (증분 재크롤링용)
+        
+        Returns:
+            최신순 정렬을 선택했는지 여부
+        """
+        sort_selectors = [
+            (By.XPATH, "//button[normalize-space(.)='최신순']"),
+            (By.XPATH, "//a[normalize-space(.)='최신순']"),
+            (By.XPATH, "//li[normalize-space(.)='최신순']"),
+            (By.XPATH, "//label[normalize-space(.)='최신순']"),
+            (By.XPATH, "//*[@role='tab' or @role='option' or @role='radio'][contains(normalize-space(.), '최신')]"),
+            (By.XPATH, "//*[contains(@class, 'sort')]//*[contains(normalize-space(.), '최신')]"),
+        ]
+        
+        for by, selector in self.selectors.ordered('review_list', 'sort_newest', sort_selectors):
+            try:
+                for element in self.driver.find_elements(by, selector):
+                    if not element.is_displayed():
+                        continue
+                    # 정렬을 바꾸기 전의 리뷰 응답은 버림 (정렬 후 응답만 캡처)
+                    if self.review_backend == 'network':
+                        self.driver.get_log('performance')
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+                    self.waits.element_clickable(element)
+                    self.driver.execute_script("arguments[0].click();", element)
+                    self.waits.dom_quiet()
+                    self.selectors.record('review_list', 'sort_newest', sort_selectors, (by, selector))
+                    print("  ✓ 리뷰 정렬: 최신순")
+                    return True
+            except Exception:
+                continue
+        
+        print("  ⚠ 최신순 정렬을 찾지 못했습니다. 페이지의 리뷰가 모두 저장된 리뷰일 때 중단합니다.")
+        return False
+    
+    def _find_review_elements(self, page: int = 1) -> List:
+        """
+        현재 페이지 전체에서 후기 요소 찾기 (Selenium 셀렉터 + BeautifulSoup 전체 파싱)
+        
+        Args:
+            page: 현재 페이지 번호 (디버깅 출력용)
             
-            for pattern in type_patterns:
-                type_match = re.search(pattern, all_text, re.I)
-                if type_match:
-                    review_type = type_match.group(0).strip()
+        Returns:
+            BeautifulSoup 후기 요소 리스트 (찾지 못하면 빈 리스트)
+        """
+        # 방법 1: Selenium으로 직접 리뷰 요소 찾기 (정확한 셀렉터 우선)
+        selenium_reviews = []
+        selenium_selectors = [
+            (By.CSS_SELECTOR, ".reviewCard"),  # 아모레몰의 개별 리뷰 카드
+            (By.CSS_SELECTOR, "div.reviewCard"),
+            (By.CSS_SELECTOR, "[class*='reviewCard']"),
+            (By.CSS_SELECTOR, "[class*='review']"),
+            (By.CSS_SELECTOR, "[class*='리뷰']"),
+            (By.CSS_SELECTOR, "[class*='comment']"),
+            (By.CSS_SELECTOR, "[data-review]"),
+            (By.CSS_SELECTOR, "[id*='review']"),
+            (By.XPATH, "//div[contains(@class, 'reviewCard')]"),
+            (By.XPATH, "//div[contains(@class, 'review')]"),
+            (By.XPATH, "//li[contains(@class, 'review')]"),
+            (By.XPATH, "//article[contains(@class, 'review')]"),
+        ]
+        
+        for by, selector in self.selectors.ordered('review_list', 'review_elements', selenium_selectors):
+            try:
+                elements = self.driver.find_elements(by, selector)
+                if elements:
+                    selenium_reviews = elements
+                    self.selectors.record('review_list', 'review_elements', selenium_selectors, (by, selector))
+                    print(f"  ✓ Selenium으로 {len(elements)}개의 리뷰 요소 발견: {selector}")
+                    break
+            except:
+                continue
+        
+        # 방법 2: BeautifulSoup으로 파싱
+        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+        
+        # 다양한 방법으로 후기 요소 찾기
+        review_elements = []
+        
+        # 정확한 셀렉터 우선 (아모레몰 구조에 맞춤)
+        selectors = [
+            {'class': 'reviewCard'},  # 아모레몰의 개별 리뷰 카드
+            {'class': lambda x: x and 'reviewCard' in x},
+            {'class': re.compile('reviewCard', re.I)},
+            {'class': re.compile('review.*item|item.*review', re.I)},
+            {'class': re.compile('review|comment|후기|리뷰', re.I)},
+            {'class': lambda x: x and any(kw in x.lower() for kw in ['review', 'comment', '후기', '리뷰'])},
+            {'data-review': True},
+            {'id': re.compile('review|comment|리뷰|후기', re.I)},
+        ]
+        
+        for selector in self.selectors.ordered('review_list', 'review_elements_soup', selectors):
+            elements = soup.find_all(['div', 'li', 'article', 'section', 'tr'], selector)
+            if elements:
+                # reviewArea는 제외 (전체 영역이므로)
+                elements = [e for e in elements if 'reviewArea' not in ' '.join(e.get('class', []))]
+                if elements:
+                    review_elements = elements
+                    self.selectors.record('review_list', 'review_elements_soup', selectors, selector)
+                    print(f"  ✓ BeautifulSoup으로 {len(elements)}개의 후기 요소 발견 (방법: {selector})")
                     break
+        
+        # 방법 3: 텍스트 패턴으로 찾기 (사용자명, 평점 등이 있는 요소)
+        if not review_elements:
+            all_divs = soup.find_all(['div', 'li', 'article'])
+            for div in all_divs:
+                text = div.get_text()
+                # 사용자명 패턴 (예: smle******) 또는 평점 패턴 찾기
+                if (re.search(r'\w+\*+|\d+대|여성|남성|지성|건성|수분', text) and 
+                    len(text) > 50 and 
+                    (re.search(r'지속력|촉촉|유분|향|각질', text) or len(text) > 100)):
+                    review_elements.append(div)
+            if review_elements:
+                print(f"  ✓ {len(review_elements)}개의 후기 요소 발견 (텍스트 패턴)")
+        
+        # Selenium으로 찾은 요소를 BeautifulSoup 요소로 변환
+        if selenium_reviews and not review_elements:
+            for selenium_elem in selenium_reviews[:20]:  # 최대 20개만
+                try:
+                    html = selenium_elem.get_attribute('outerHTML')
+                    if html:
+                        soup_elem = BeautifulSoup(html, 'html.parser')
+                        review_elements.append(soup_elem)
+                except:
+                    continue
+            if review_elements:
+                print(f"  ✓ Selenium 요소를 BeautifulSoup으로 변환: {len(review_elements)}개")
+        
+        if not review_elements:
+            print("  ⚠ 후기 요소를 찾을 수 없습니다.")
+            # 디버깅: 페이지 구조 일부 출력
+            if page == 1:
+                print("  [디버깅] 페이지의 주요 클래스명:")
+                classes = set()
+                for tag in soup.find_all(class_=True)[:30]:
+                    classes.update(tag.get('class', []))
+                print(f"    {', '.join(list(classes)[:15])}")
+                
+                # 디버깅: 리뷰 관련 텍스트가 있는 요소 찾기
+                review_text_elements = soup.find_all(string=re.compile('리뷰|후기|review', re.I))
+                if review_text_elements:
+                    print(f"  [디버깅] '리뷰' 텍스트를 포함한 요소 {len(review_text_elements)}개 발견")
+                    for i, elem in enumerate(review_text_elements[:3]):
+                        parent = elem.parent if elem.parent else None
+                        if parent:
+                            print(f"    예시 {i+1}: {parent.name} - {str(parent)[:200]}")
+        
+        return review_elements
+    
+    def _get_new_review_cards(self) -> Optional[List]:
+        """
+        지난 호출 이후 새로 추가된 .reviewCard 요소만 가져오기 (증분 파싱)
+        
+        브라우저에서 아직 처리하지 않은 카드의 outerHTML만 꺼내고 data-crawled 속성으로
+        표시해 둔다. 페이지 전체 page_source를 다시 파싱하지 않으므로 파싱 비용이
+        리뷰 수에 비례한다.
+        
+        Returns:
+            새 카드 요소(Tag) 리스트 (.reviewCard 구조가 없으면 None)
+        """
+        script = """
+            var cards = document.querySelectorAll('.reviewCard:not([data-crawled])');
+            var html = [];
+            for (var i = 0; i < cards.length; i++) {
+                html.push(cards[i].outerHTML);
+                cards[i].setAttribute('data-crawled', '1');
+            }
+            return {total: document.querySelectorAll('.reviewCard').length, html: html};
+        """
+        try:
+            data = self.driver.execute_script(script)
+        except Exception as e:
+            if self.debug:
+                print(f"  [디버깅] 증분 리뷰 카드 추출 오류: {e}")
+            return None
+        
+        if not data or not data.get('total'):
+            return None
+        
+        elements = [card_element(html) for html in data.get('html', [])]
+        return [element for element in elements if element is not None]
+    
+    def _extract_review_cards_js(self, only_new: bool = True) -> Optional[List[Dict]]:
+        """
+        execute_script 한 번으로 모든 .reviewCard를 브라우저에서 순회하여 JSON으로 추출
+        
+        page_source 전송과 HTML 재파싱 없이 카드별 원시 필드(사용자명, 사용자 정보,
+        별점 클래스, 옵션, 리뷰 타입, prdStyle 특이사항, 본문)만 가져온다.
+        
+        Args:
+            only_new: True면 아직 처리하지 않은 카드만 가져오고 data-crawled로 표시
             
-            # 특이사항 추출 (prdStyle 구조: dt/dd)
-            special_note_1 = ""
-            special_note_2 = ""
-            special_note_3 = ""
-            
-            prd_style = element.find('div', class_=re.compile('prdStyle', re.I))
-            if prd_style:
-                # dt/dd 구조로 된 특이사항 추출
-                dts = prd_style.find_all('dt')
-                dds = prd_style.find_all('dd')
-                
-                special_notes = []
-                for i, dt in enumerate(dts):
-                    if i < len(dds):
-                        label = dt.get_text(strip=True)
-                        value = dds[i].get_text(strip=True)
-                        special_notes.append(f"{label}: {value}")
-                
-                if len(special_notes) >= 1:
-                    special_note_1 = special_notes[0]
-                if len(special_notes) >= 2:
-                    special_note_2 = special_notes[1]
-                if len(special_notes) >= 3:
-                    special_note_3 = special_notes[2]
-            
-            # 특이사항이 없으면 텍스트에서 키워드 기반으로 추출
-            if not special_note_1:
-                # 발색감, 지속력, 사용감, 향, 민감성, 보습감 등 키워드 찾기
-                special_keywords = {
-                    '지속력': ['지속', '오래', '오랫동안', '지속력'],
-                    '발색감': ['발색', '색상', '컬러', '톤'],
-                    '사용감': ['사용감', '발림', '밀착', '부드러움', '끈적'],
-                    '향': ['향', '냄새', '향기', '아로마'],
-                    '민감성': ['민감', '순함', '자극', '알레르기'],
-                    '보습감': ['보습', '촉촉', '수분', '건조'],
-                    '유분기': ['유분', '기름', '번들', '윤기'],
-                    '광택감': ['광택', '글로시', '윤기', '번들']
-                }
-                
-                found_notes = []
-                for keyword, patterns in special_keywords.items():
-                    for pattern in patterns:
-                        if pattern in review_text or pattern in all_text:
-                            # 해당 키워드 주변 텍스트 추출
-                            text_to_search = review_text if review_text else all_text
-                            match = re.search(f'{pattern}[^\n]*', text_to_search, re.I)
-                            if match:
-                                note_text = match.group(0).strip()[:50]  # 최대 50자
-                                if note_text and note_text not in found_notes:
-                                    found_notes.append(f"{keyword}: {note_text}")
-                                    break
-                
-                if len(found_notes) >= 1:
-                    special_note_1 = found_notes[0]
-                if len(found_notes) >= 2:
-                    special_note_2 = found_notes[1]
-                if len(found_notes) >= 3:
-                    special_note_3 = found_notes[2]
-            
-            # 최소한 리뷰 텍스트가 있어야 유효한 후기로 간주
-            if review_text and len(review_text) > 10:
-                review_data = {
-                    'username': username,
-                    'user_info': user_info,  # 원본 정보
-                    'age': age,
-                    'gender': gender,
-                    'skin_type_1': skin_type_1,
-                    'skin_type_2': skin_type_2,
-                    'rating': rating if rating > 0 else None,
-                    'option': option,
-                    'review_type': review_type,
-                    'special_note_1': special_note_1,  # 특이사항1 (예: "지속력: 오래 지속돼요")
-                    'special_note_2': special_note_2,  # 특이사항2 (예: "유분기: 유분 적당해요")
-                    'special_note_3': special_note_3,  # 특이사항3 (예: "촉촉함: 촉촉해요")
-                    'review_text': review_text,
-                }
-                
-                # 디버깅 모드일 때만 raw_html 저장
+        Returns:
+            카드별 딕셔너리 리스트 (.reviewCard 구조가 없으면 None)
+        """
+        try:
+            data = self.driver.execute_script(REVIEW_CARDS_SCRIPT, only_new)
+        except Exception as e:
+            if self.debug:
+                print(f"  [디버깅] JavaScript 리뷰 추출 오류: {e}")
+            return None
+        
+        if not data or not data.get('total'):
+            return None
+        return data.get('cards', [])
+    
+    def _collect_network_review_cards(self) -> List[Dict]:
+        """
+        지난 호출 이후 캡처된 리뷰 API 응답을 리뷰 카드 딕셔너리로 변환 (review_backend='network')
+        
+        성능 로그의 Network.responseReceived 이벤트 중 리뷰 URL의 JSON 응답만 골라
+        Network.getResponseBody로 본문을 가져온다.
+        
+        Returns:
+            리뷰 카드 딕셔너리 리스트 (캡처된 응답이 없으면 빈 리스트)
+        """
+        try:
+            logs = self.driver.get_log('performance')
+        except Exception as e:
+            if self.debug:
+                print(f"  [디버깅] 성능 로그 읽기 오류: {e}")
+            return []
+        
+        cards = []
+        for entry in logs:
+            try:
+                message = json.loads(entry['message'])['message']
+            except Exception:
+                continue
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            params = message.get('params', {})
+            response = params.get('response', {})
+            url = response.get('url', '')
+            if not REVIEW_API_PATTERN.search(url) or 'json' not in response.get('mimeType', ''):
+                continue
+            try:
+                body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+                text = body.get('body', '')
+                if body.get('base64Encoded'):
+                    text = base64.b64decode(text).decode('utf-8')
+                payload = json.loads(text)
+            except Exception as e:
                 if self.debug:
-                    review_data['raw_html'] = str(element)[:1000]
-                
-                return review_data
-            else:
-                # 디버깅: 파싱 실패 원인 출력
-                if self.debug and index < 3:
-                    print(f"    [디버깅] 요소 {index} 파싱 실패 - 텍스트 길이: {len(review_text) if review_text else 0}")
-                    print(f"      전체 텍스트 샘플: {all_text[:200]}")
+                    print(f"  [디버깅] 응답 본문 읽기 오류 ({url[:80]}): {e}")
+                continue
             
+            payload_cards = payload_to_cards(payload)
+            if payload_cards:
+                self.review_api_url = url
+                cards.extend(payload_cards)
+                if self.debug:
+                    print(f"  [디버깅] 리뷰 API 응답 캡처: {url[:120]} ({len(payload_cards)}개)")
+        
+        return cards
+    
+    def _prune_review_cards(self) -> int:
+        """
+        처리 완료(data-crawled)된 리뷰 카드를 review_dom_prune 방식으로 정리 (마지막 카드는 유지)
+        
+        Returns:
+            정리한 카드 수
+        """
+        try:
+            return self.driver.execute_script(PRUNE_REVIEW_CARDS_SCRIPT, self.review_dom_prune) or 0
         except Exception as e:
             if self.debug:
-                print(f"후기 파싱 오류 (요소 {index}): {e}")
-        
-        return None
+                print(f"  [디버깅] 리뷰 카드 정리 오류: {e}")
+            return 0
     
-    def crawl_product_reviews(self, url: str, max_pages: int = 10, max_reviews: int = None, test_mode: bool = False, max_more_clicks: int = None) -> Dict:
+    def _mark_review_cards_crawled(self):
+        """화면의 모든 .reviewCard를 처리 완료(data-crawled)로 표시"""
+        try:
+            self.driver.execute_script(
+                "document.querySelectorAll('.reviewCard').forEach(function(card) { card.setAttribute('data-crawled', '1'); });"
+            )
+        except Exception:
+            pass
+    
+    def crawl_product_reviews(self, url: str, max_pages: int = 10, max_reviews: int = None, test_mode: bool = False, max_more_clicks: int = None, include_reviews: bool = True,
+                              review_total: Optional[int] = None, time_budget: Optional[float] = None,
+                              review_sink: Optional[Callable[[Dict], None]] = None) -> Dict:
         """
         제품 후기 전체 크롤링
         
         프로세스:
-        1. 제품 페이지 접속
+        1. 제품 페이지 접속 (한 번만 로드, 기본 정보 수집에 재사용)
         2. 리뷰 수집 (더 많은 리뷰 보기 버튼 클릭)
         3. 리뷰 수집 후 상품정보제공 고시 보기로 상품 정보 수집
-        4. 뒤로가기로 전체 제품 페이지로 복귀
+        
+        다음 제품은 driver.get으로 바로 이동하므로 목록 페이지로 뒤로가기 하지 않는다.
         
         Args:
             url: 제품 페이지 URL
             max_pages: 최대 페이지 수 (None이면 모든 페이지)
             max_reviews: 최대 리뷰 수 (None이면 제한 없음)
             test_mode: 테스트 모드 (더 보기 버튼 3번만 클릭)
+            include_reviews: False면 리뷰 수집을 건너뛰고 제품 정보만 수집 (리뷰는 fetch_reviews_http로 수집)
+            review_total: 전체 리뷰 수 (브랜드 목록에서 읽은 값, 없으면 제품 페이지의 리뷰 수 사용)
+            time_budget: 이 제품에 쓸 수 있는 시간 (초, 페이지 로드 포함, None이면 제한 없음)
+            review_sink: 지정하면 후기를 모으지 않고 페이지마다 {'product_info': 기본 정보, 'reviews': 후기 묶음,
+                         'partial': True}로 넘김 (결과의 reviews는 빈 리스트, total_reviews는 넘긴 후기 수)
             
         Returns:
-            제품 정보와 후기 리스트를 포함한 딕셔너리
+            제품 정보와 후기 리스트를 포함한 딕셔너리 (review_sink를 쓰면 'streamed': True)
         """
-        # 1. 제품 페이지 접속 및 기본 정보 수집
-        self.driver.get(url)
-        time.sleep(3)
-        self._close_popups()
+        product_start = time.monotonic()
+        wait_time_before = self.waits.total_wait_time()
+        navigation_before = self.navigation_count
+        popup_time_before = self.popup_time
+        
+        # 1. 제품 페이지 접속 및 기본 정보 수집 (가격, 평점, 제품명 등)
+        # 고시는 리뷰 수집 후 한 번만 열기 때문에 여기서는 제외
+        self._ensure_page(url)
+        basic_info = self.get_product_info(url, include_notice=False)
+        
+        # 2. 리뷰 수집 (증분 재크롤링이면 DB에 저장된 리뷰를 만날 때까지만)
+        known_fingerprints = None
+        if include_reviews and self.incremental_db is not None and basic_info.get('product_code'):
+            known_fingerprints = self.incremental_db.get_review_fingerprints(basic_info['product_code'])
+            print(f"  → 증분 재크롤링: 저장된 리뷰 {len(known_fingerprints)}개")
+        if review_total is None:
+            digits = re.sub(r'[^\d]', '', str(basic_info.get('review_count') or ''))
+            review_total = int(digits) if digits else None
+        review_time_budget = None
+        if time_budget is not None:
+            review_time_budget = max(0.0, time_budget - (time.monotonic() - product_start))
+        reviews = []
+        streamed_count = 0
+        if include_reviews:
+            review_batches = self.iter_reviews(max_pages, max_reviews, test_mode, max_more_clicks, known_fingerprints,
+                                               review_total, review_time_budget,
+                                               checkpoint_key=basic_info.get('product_code') or url)
+            for batch in review_batches:
+                if review_sink is None:
+                    reviews.extend(batch)
+                    continue
+                # 페이지마다 바로 저장 단계로 넘기고 보관하지 않음
+                review_sink({'product_info': basic_info, 'reviews': batch, 'partial': True})
+                streamed_count += len(batch)
+        
+        # 3~4. 상품정보제공 고시 수집 (캐시에 최신 정보가 있으면 고시를 열지 않음)
+        product_code = basic_info.get('product_code', '')
+        notice_info = None
+        if self.notice_cache and not self.refresh_notice:
+            notice_info = self.notice_cache.get(product_code)
+        if notice_info is not None:
+            print(f"  ✓ 고시 캐시 사용 (제품 코드: {product_code})")
+        else:
+            notice_info = self._collect_notice_info(url)
+            if self.notice_cache:
+                self.notice_cache.put(product_code, notice_info)
+        
+        # 기본 정보와 고시 정보 병합
+        # notice_info는 usage_method, ingredients, precautions만 포함
+        # 나머지는 모두 basic_info에서 가져오기
+        product_info = {**basic_info}  # basic_info를 기본으로
+        # notice_info에서 usage_method, ingredients, precautions만 추가
+        if notice_info.get('usage_method'):
+            product_info['usage_method'] = notice_info['usage_method']
+        if notice_info.get('ingredients'):
+            product_info['ingredients'] = notice_info['ingredients']
+        if notice_info.get('precautions'):
+            product_info['precautions'] = notice_info['precautions']
         
-        # 제품 기본 정보 먼저 수집 (가격, 평점, 제품명 등)
-        basic_info = self.get_product_info(url)
+        # 상품 정보 수집 결과 로그 출력
+        if product_info.get('ingredients'):
+            print(f"  ✓ 성분 정보 수집 완료 ({len(product_info['ingredients'])}자)")
+        else:
+            print(f"  ⚠ 성분 정보를 찾을 수 없습니다.")
+        
+        if product_info.get('usage_method'):
+            print(f"  ✓ 사용 방법 수집 완료 ({len(product_info['usage_method'])}자)")
+        
+        if product_info.get('precautions'):
+            print(f"  ✓ 주의사항 수집 완료 ({len(product_info['precautions'])}자)")
         
-        # 2. 리뷰 수집
-        reviews = self.extract_reviews(max_pages, max_reviews, test_mode)
+        print(f"  ⏱ 페이지 대기 시간: {self.waits.total_wait_time() - wait_time_before:.1f}초")
+        print(f"  🧭 페이지 이동: {self.navigation_count - navigation_before}회")
+        if self.popup_mode == 'script':
+            try:
+                popups_closed = self.driver.execute_script(POPUPS_CLOSED_SCRIPT)
+            except Exception:
+                popups_closed = 0
+            print(f"  ✓ 팝업: 스크립트가 현재 페이지에서 닫은 팝업 {popups_closed}개")
+        else:
+            print(f"  ⏱ 팝업 처리 시간: {self.popup_time - popup_time_before:.1f}초")
+        
+        return {
+            'product_info': product_info,
+            'reviews': reviews,
+            'total_reviews': streamed_count if review_sink is not None else len(reviews),
+            'incremental': known_fingerprints is not None,  # True면 reviews는 새 리뷰만 포함
+            'streamed': review_sink is not None  # True면 후기는 review_sink로 이미 넘김
+        }
+    
+    def _collect_notice_info(self, url: str) -> Dict:
+        """
+        "상품상세" 탭으로 이동한 뒤 상품정보제공 고시에서 상품 정보 수집
         
-        # 3. 리뷰 수집 후 "상품상세" 탭 클릭
+        Args:
+            url: 제품 페이지 URL
+            
+        Returns:
+            _get_product_info_from_notice 결과 딕셔너리
+        """
+        # 리뷰 수집 후 "상품상세" 탭 클릭
         print("  → '상품상세' 탭 클릭 중...")
         try:
             # "상품상세" 탭 찾기 및 클릭
@@ -2015,9 +2344,9 @@ class AmoreMallCrawler:
                     detail_tab = self.driver.find_element(by, selector)
                     if detail_tab and detail_tab.is_displayed():
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", detail_tab)
-                        time.sleep(1)
+                        self.waits.element_clickable(detail_tab)
                         self.driver.execute_script("arguments[0].click();", detail_tab)
-                        time.sleep(2)
+                        self.waits.dom_quiet()
                         print("  ✓ '상품상세' 탭 클릭 완료")
                         detail_tab_found = True
                         break
@@ -2025,63 +2354,106 @@ class AmoreMallCrawler:
                     continue
             
             if not detail_tab_found:
-                print("  ⚠ '상품상세' 탭을 찾을 수 없습니다. 상품 페이지로 다시 이동합니다.")
-                self.driver.get(url)
-                time.sleep(3)
-                self._close_popups()
+                print("  ⚠ '상품상세' 탭을 찾을 수 없습니다. 현재 제품 화면에서 고시를 찾습니다.")
+                # 리뷰 수집 중 다른 페이지로 이동한 경우에만 다시 로드
+                self._ensure_page(url)
         except Exception as e:
             if self.debug:
                 print(f"  [디버깅] '상품상세' 탭 클릭 오류: {e}")
-            # 오류 발생 시 상품 페이지로 다시 이동
-            self.driver.get(url)
-            time.sleep(3)
-            self._close_popups()
+            self._ensure_page(url)
         
-        # 4. 상품정보제공 고시 보기로 상품 정보 수집
+        # 상품정보제공 고시 보기로 상품 정보 수집
         print("  → 상품정보제공 고시에서 상품 정보 수집 중...")
-        notice_info = self._get_product_info_from_notice(url)
+        return self._get_product_info_from_notice(url)
+    
+    def fetch_reviews_http(self, product_urls: List[str], max_pages: int = None, max_reviews: int = None, concurrency: int = 8) -> Dict[str, List[Dict]]:
+        """
+        네트워크 캡처로 찾은 리뷰 API를 브라우저 없이 직접 호출해 여러 제품의 리뷰 수집
         
-        # 기본 정보와 고시 정보 병합
-        # notice_info는 usage_method, ingredients, precautions만 포함
-        # 나머지는 모두 basic_info에서 가져오기
-        product_info = {**basic_info}  # basic_info를 기본으로
-        # notice_info에서 usage_method, ingredients, precautions만 추가
-        if notice_info.get('usage_method'):
-            product_info['usage_method'] = notice_info['usage_method']
-        if notice_info.get('ingredients'):
-            product_info['ingredients'] = notice_info['ingredients']
-        if notice_info.get('precautions'):
-            product_info['precautions'] = notice_info['precautions']
+        iter_reviews_http의 결과를 모두 받은 뒤 한 번에 반환한다.
         
-        # 상품 정보 수집 결과 로그 출력
-        if product_info.get('ingredients'):
-            print(f"  ✓ 성분 정보 수집 완료 ({len(product_info['ingredients'])}자)")
-        else:
-            print(f"  ⚠ 성분 정보를 찾을 수 없습니다.")
+        Args:
+            product_urls: 제품 페이지 URL 리스트
+            max_pages: 제품당 최대 페이지 수 (None이면 제한 없음)
+            max_reviews: 제품당 최대 리뷰 수 (None이면 제한 없음)
+            concurrency: 동시 요청 수
+            
+        Returns:
+            제품 URL을 키로 하는 후기 리스트 딕셔너리
+        """
+        results = {}
+        for url, reviews in self.iter_reviews_http(product_urls, max_pages, max_reviews, concurrency):
+            results[url] = reviews
+        return results
+    
+    def iter_reviews_http(self, product_urls: List[str], max_pages: int = None, max_reviews: int = None, concurrency: int = 8) -> Iterator[tuple]:
+        """
+        리뷰 API를 직접 호출해 여러 제품의 리뷰를 수집하면서 제품별 결과를 완료되는 대로 내보내는 제너레이터
         
-        if product_info.get('usage_method'):
-            print(f"  ✓ 사용 방법 수집 완료 ({len(product_info['usage_method'])}자)")
+        현재 브라우저 세션의 쿠키와 User-Agent를 그대로 사용한다.
         
-        if product_info.get('precautions'):
-            print(f"  ✓ 주의사항 수집 완료 ({len(product_info['precautions'])}자)")
+        Args:
+            product_urls: 제품 페이지 URL 리스트
+            max_pages: 제품당 최대 페이지 수 (None이면 제한 없음)
+            max_reviews: 제품당 최대 리뷰 수 (None이면 제한 없음)
+            concurrency: 동시 요청 수
+            
+        Yields:
+            (제품 URL, 후기 리스트) 튜플 (완료 순서)
+        """
+        if not self.review_api_url:
+            print("  ⚠ 리뷰 API URL을 아직 찾지 못했습니다. (review_backend='network'로 제품을 먼저 크롤링하세요)")
+            return
+        
+        # aiohttp는 HTTP 수집을 쓸 때만 필요하므로 여기서 import
+        from review_fetcher import ReviewFetcher, cookies_from_driver
         
-        # 5. 뒤로가기로 전체 제품 페이지로 복귀 (한번만)
+        headers = {'Referer': self.driver.current_url}
         try:
-            self.driver.back()
-            time.sleep(2)
-            # 만약 상품정보제공 고시 페이지에 있다면 한 번 더 뒤로가기
-            if 'notice' in self.driver.current_url.lower() or '고시' in self.driver.current_url.lower():
-                self.driver.back()
-                time.sleep(2)
-            print("  ✓ 뒤로가기로 전체 제품 페이지로 복귀")
-        except:
+            headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+        except Exception:
             pass
         
-        return {
-            'product_info': product_info,
-            'reviews': reviews,
-            'total_reviews': len(reviews)
-        }
+        fetcher = ReviewFetcher(
+            self.review_api_url,
+            cookies=cookies_from_driver(self.driver),
+            headers=headers,
+            concurrency=concurrency,
+            debug=self.debug
+        )
+        print(f"\n→ 리뷰 API로 {len(product_urls)}개 제품의 리뷰 수집 중 (동시 요청 {concurrency}개)...")
+        try:
+            for url, cards in fetcher.iter_fetch(product_urls, max_pages, max_reviews):
+                reviews = [self._review_from_card_data(card, idx) for idx, card in enumerate(cards)]
+                yield url, [review for review in reviews if review]
+        finally:
+            fetcher.print_stats()
+    
+    def _iter_http_results(self, http_pending: List[Dict], max_pages: int = None, max_reviews: int = None, concurrency: int = 8) -> Iterator[Dict]:
+        """
+        제품 정보만 수집된 결과들의 리뷰를 HTTP로 받아 채우면서 완료되는 대로 내보내는 제너레이터
+        
+        Args:
+            http_pending: 리뷰 없이 제품 정보만 수집된 crawl_product_reviews 결과 리스트
+            max_pages: 제품당 최대 페이지 수
+            max_reviews: 제품당 최대 리뷰 수
+            concurrency: 동시 요청 수
+            
+        Yields:
+            리뷰를 채운 결과 (완료 순서)
+        """
+        by_url = {result['product_info']['product_url']: result for result in http_pending}
+        for url, reviews in self.iter_reviews_http(list(by_url), max_pages, max_reviews, concurrency):
+            result = by_url.pop(url)
+            result['reviews'] = reviews
+            result['total_reviews'] = len(reviews)
+            print(f"  ✓ {result['product_info'].get('product_name', '제품명 없음')}: HTTP로 {len(reviews)}개의 후기 수집 완료")
+            yield result
+        # 리뷰 API를 쓸 수 없었던 제품은 제품 정보만 내보냄
+        for result in by_url.values():
+            result['reviews'] = []
+            result['total_reviews'] = 0
+            yield result
     
     def get_brand_products(self, brand_url: str, max_products: int = None) -> tuple[List[Dict], str]:
         """
@@ -2103,8 +2475,7 @@ class AmoreMallCrawler:
             page_type = "제품 목록"
         
         print(f"\n{page_type} 페이지에서 제품 목록 추출 중: {brand_url}")
-        self.driver.get(brand_url)
-        time.sleep(3)
+        self._open_page(brand_url, view='listing')
         
         # 팝업 닫기
         self._close_popups()
@@ -2200,7 +2571,7 @@ class AmoreMallCrawler:
             print(f"  [페이지 {page}] 제품 링크 찾는 중...")
             
             # 페이지가 완전히 로드될 때까지 대기
-            time.sleep(2)
+            self.waits.dom_quiet()
             
             # 첫 페이지에서 목표 제품 수에 도달할 때까지 스크롤 반복
             if page == 1:
@@ -2222,11 +2593,13 @@ class AmoreMallCrawler:
                     for i in range(scroll_steps):
                         scroll_position = int((i + 1) * (last_height / scroll_steps))
                         self.driver.execute_script(f"window.scrollTo(0, {scroll_position});")
-                        time.sleep(0.2)
+                        self.waits.dom_quiet(quiet_ms=150, timeout=0.5)
                     
                     # 끝까지 스크롤
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(3)  # 제품 로드 대기
+                    # 제품 로드 대기 (스크롤 높이 증가 후 렌더링 안정화)
+                    if self.waits.scroll_height_changed(last_height, timeout=3):
+                        self.waits.dom_quiet(quiet_ms=300, timeout=3)
                     
                     # "더 보기" 버튼 클릭 시도 (더 적극적으로)
                     if not more_button_clicked or scroll_count % 3 == 0:  # 3번마다 다시 시도
@@ -2249,14 +2622,17 @@ class AmoreMallCrawler:
                                         try:
                                             if btn.is_displayed() and btn.is_enabled():
                                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
-                                                time.sleep(0.5)
+                                                self.waits.element_clickable(btn)
+                                                links_before = self.waits.count("a[href*='/product/detail']")
                                                 self.driver.execute_script("arguments[0].click();", btn)
-                                                time.sleep(3)  # 클릭 후 제품 로드 대기
+                                                # 클릭 후 제품 로드 대기
+                                                if self.waits.count_increased("a[href*='/product/detail']", links_before, timeout=5):
+                                                    self.waits.dom_quiet(quiet_ms=300, timeout=3)
                                                 print(f"    → '더 보기' 버튼 클릭")
                                                 more_button_clicked = True
                                                 # 버튼 클릭 후 다시 스크롤
                                                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                                time.sleep(2)
+                                                self.waits.dom_quiet(quiet_ms=300, timeout=3)
                                                 break
                                         except:
                                             continue
@@ -2291,9 +2667,9 @@ class AmoreMallCrawler:
                                 # 목표 미달 시 한 번만 추가 시도
                                 if scroll_count < max_scrolls - 1:
                                     print(f"    → 목표 제품 수({max_products_target}개) 미달, 한 번만 추가 시도... (현재: {current_count}개)")
-                                    time.sleep(2)
+                                    links_before = self.waits.count("a[href*='/product/detail']")
                                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                                    time.sleep(3)
+                                    self.waits.count_increased("a[href*='/product/detail']", links_before, timeout=5)
                                     # 다시 카운트
                                     current_links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/product/detail']")
                                     seen_hrefs = set()
@@ -2324,7 +2700,7 @@ class AmoreMallCrawler:
                 
                 # 다시 맨 위로 스크롤 (파싱을 위해)
                 self.driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
+                self.waits.dom_quiet(quiet_ms=300, timeout=1)
             
             # 페이지 소스 파싱
             soup = BeautifulSoup(self.driver.page_source, 'html.parser')
@@ -2352,10 +2728,11 @@ class AmoreMallCrawler:
                     {'class': re.compile('product|item|goods', re.I)},
                 ]
                 
-                for selector in link_selectors:
+                for selector in self.selectors.ordered('brand_list', 'product_link', link_selectors):
                     links = soup.find_all('a', selector)
                     if links:
                         product_links = links
+                        self.selectors.record('brand_list', 'product_link', link_selectors, selector)
                         print(f"    ✓ BeautifulSoup으로 {len(links)}개의 링크 발견")
                         break
             
@@ -2453,7 +2830,9 @@ class AmoreMallCrawler:
                     products.append({
                         'product_url': href,
                         'product_name': product_name,
-                        'product_code': product_code
+                        'product_code': product_code,
+                        # 목록에 보이는 평점/리뷰 수/가격 (변경 감지용)
+                        **self._parse_listing_stats(product_name_raw)
                     })
                     new_products_count += 1
                     
@@ -2493,9 +2872,10 @@ class AmoreMallCrawler:
                             )
                             if not is_disabled:
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-                                time.sleep(1)
+                                self.waits.element_clickable(next_button)
+                                before_url = self.driver.current_url
                                 self.driver.execute_script("arguments[0].click();", next_button)
-                                time.sleep(3)
+                                self.waits.click_settled(before_url)
                                 next_page_found = True
                                 print(f"    → 다음 페이지로 이동")
                                 break
@@ -2519,8 +2899,9 @@ class AmoreMallCrawler:
                 if page == 1 and max_products_target and len(products) < max_products_target:
                     print(f"    → 목표 제품 수({max_products_target}개) 미달, 한 번만 추가 시도... (현재: {len(products)}개)")
                     # 한 번만 끝까지 스크롤
+                    links_before = self.waits.count("a[href*='/product/detail']")
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(3)
+                    self.waits.count_increased("a[href*='/product/detail']", links_before, timeout=5)
                     
                     # 페이지 소스 다시 파싱
                     soup = BeautifulSoup(self.driver.page_source, 'html.parser')
@@ -2590,9 +2971,9 @@ class AmoreMallCrawler:
         
         return products, brand_name
     
-    def crawl_brand_products(self, brand_url: str, max_products: int = None, max_pages_per_product: int = 10, max_reviews_per_product: int = None, test_mode: bool = False, max_more_clicks: int = None, resume: bool = True) -> tuple[List[Dict], str]:
+    def crawl_brand_products(self, brand_url: str, max_products: int = None, max_pages_per_product: int = 10, max_reviews_per_product: int = None, test_mode: bool = False, max_more_clicks: int = None, resume: bool = True, workers: int = 1, http_reviews: bool = False, http_concurrency: int = 8, skip_unchanged: bool = False, time_budget: Optional[float] = None, deadline: Optional[float] = None, job_queue: Optional[CrawlJobQueue] = None, result_callback: Optional[Callable[[Dict], None]] = None) -> tuple[List[Dict], str]:
         """
-        브랜드의 모든 제품 리뷰 크롤링
+        브랜드의 모든 제품 리뷰 크롤링 (iter_brand_products의 결과를 리스트로 모음)
         
         Args:
             brand_url: 브랜드 페이지 URL
@@ -2602,21 +2983,96 @@ class AmoreMallCrawler:
             test_mode: 테스트 모드 (더 보기 버튼 3번만 클릭)
             max_more_clicks: 더 보기 버튼 최대 클릭 횟수
             resume: 중단 후 재개 모드 (기존 JSON 파일에서 이미 크롤링된 제품 건너뛰기)
+            workers: 병렬 워커(Chrome 프로세스) 수 (1이면 현재 브라우저로 순차 크롤링)
+            http_reviews: 리뷰 API를 찾은 뒤부터는 브라우저 대신 HTTP로 리뷰 수집 (review_backend='network' 필요)
+            http_concurrency: HTTP 리뷰 수집 시 동시 요청 수
+            skip_unchanged: 목록의 리뷰 수가 지난 크롤링과 같은 제품은 가격/평점만 갱신
+            time_budget: 전체 크롤링 시간 예산 (초, 제품별 리뷰 수 비율로 배분)
+            deadline: 마감 시각 (time.time() 기준 초, 우선순위 순서로 크롤링하고 마감에 맞춰 중단)
+            job_queue: 여러 프로세스가 함께 쓰는 작업 큐 (지정하면 큐에서 제품을 하나씩 임대해 크롤링)
+            result_callback: 제품 하나의 크롤링이 끝날 때마다 결과를 넘겨받는 함수
+                             (예: ResultWriter.submit, 저장 단계를 브라우저와 분리)
             
         Returns:
             (각 제품의 크롤링 결과 리스트, 브랜드명) 튜플
         """
+        results = []
+        for result in self.iter_brand_products(brand_url, max_products, max_pages_per_product, max_reviews_per_product,
+                                               test_mode, max_more_clicks, resume, workers, http_reviews, http_concurrency,
+                                               skip_unchanged, time_budget, deadline, job_queue):
+            results.append(result)
+            if result_callback:
+                result_callback(result)
+        return results, self.brand_name
+    
+    def iter_brand_products(self, brand_url: str, max_products: int = None, max_pages_per_product: int = 10, max_reviews_per_product: int = None, test_mode: bool = False, max_more_clicks: int = None, resume: bool = True, workers: int = 1, http_reviews: bool = False, http_concurrency: int = 8, skip_unchanged: bool = False, time_budget: Optional[float] = None, deadline: Optional[float] = None, job_queue: Optional[CrawlJobQueue] = None, review_sink: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """
+        브랜드의 모든 제품 리뷰를 크롤링하면서 제품 결과를 완료되는 대로 내보내는 제너레이터
+        
+        브랜드명은 첫 결과를 내보내기 전에 self.brand_name에 기록된다.
+        
+        Args:
+            brand_url: 브랜드 페이지 URL
+            max_products: 최대 제품 수 (None이면 모든 제품)
+            max_pages_per_product: 제품당 최대 페이지 수
+            max_reviews_per_product: 제품당 최대 리뷰 수
+            test_mode: 테스트 모드 (더 보기 버튼 3번만 클릭)
+            max_more_clicks: 더 보기 버튼 최대 클릭 횟수
+            resume: 중단 후 재개 모드 (기존 JSON 파일에서 이미 크롤링된 제품 건너뛰기)
+            workers: 병렬 워커(Chrome 프로세스) 수 (1이면 현재 브라우저로 순차 크롤링)
+            http_reviews: 리뷰 API를 찾은 뒤부터는 브라우저 대신 HTTP로 리뷰 수집 (review_backend='network' 필요)
+            http_concurrency: HTTP 리뷰 수집 시 동시 요청 수
+            skip_unchanged: 목록의 리뷰 수가 지난 크롤링과 같은 제품은 페이지를 열지 않고
+                            목록의 가격/평점만 갱신한 결과를 내보냄 (결과에 'unchanged': True)
+            time_budget: 전체 크롤링 시간 예산 (초). 남은 시간을 남은 제품의 목록 리뷰 수 비율로 나눠
+                         제품마다 리뷰 수집 시간을 제한 (None이면 제한 없음)
+            deadline: 마감 시각 (time.time() 기준 초). 지정하면 CrawlScheduler로 제품을 우선순위
+                      (경과 시간, 리뷰 수 증가분, 목록 순위) 순서로 크롤링하고, 남은 시간이 부족하면
+                      새 제품을 시작하지 않고 남은 제품을 schedule_{브랜드명}.json에 기록
+                      (이미 크롤링된 제품도 우선순위로 다시 평가하므로 resume은 사용하지 않음)
+            job_queue: 여러 프로세스가 함께 쓰는 작업 큐. 지정하면 목록의 제품을 큐에 등록한 뒤
+                       큐에서 하나씩 임대해 크롤링 (재개/변경 감지/마감/병렬 워커 옵션은 사용하지 않음)
+            review_sink: 브라우저로 수집하는 제품의 후기를 페이지마다 넘겨받는 함수 (crawl_product_reviews 참고,
+                         제품 정보에는 목록 정보가 병합됨). 이 제품들의 결과는 'streamed': True이고 reviews가 비어 있다.
+                         병렬 워커와 HTTP 리뷰 수집 결과는 지금처럼 reviews에 후기를 담아 내보낸다.
+            
+        Yields:
+            제품별 크롤링 결과 (crawl_product_reviews 결과, 완료 순서)
+        """
+        if deadline is not None:
+            until_deadline = max(0.0, deadline - time.time())
+            time_budget = until_deadline if time_budget is None else min(time_budget, until_deadline)
+        budget_end = time.monotonic() + time_budget if time_budget is not None else None
+        if deadline is not None and resume:
+            # 마감 모드는 이미 크롤링된 제품도 경과 시간/리뷰 수 증가분으로 다시 평가해야 하므로 건너뛰지 않음
+            # (지난 실행에서 끝내지 못한 제품은 스케줄 체크포인트로 먼저 처리)
+            resume = False
+        
         # 1. 브랜드 페이지에서 모든 제품 링크 추출
         products, brand_name = self.get_brand_products(brand_url, max_products)
+        self.brand_name = brand_name
         
         if not products:
             print("⚠ 제품을 찾을 수 없습니다.")
-            return [], brand_name
+            return
+        
+        if job_queue is not None:
+            crawl_kwargs = {
+                'max_pages': max_pages_per_product,
+                'max_reviews': max_reviews_per_product,
+                'test_mode': test_mode,
+                'max_more_clicks': max_more_clicks,
+            }
+            for result in self._crawl_from_job_queue(brand_url, products, job_queue, crawl_kwargs, review_sink):
+                yield result
+            self.print_stats()
+            return
         
         # 2. 중단 후 재개: 기존 JSON 파일에서 이미 크롤링된 제품 확인
         crawled_online_prod_sns = set()  # onlineProdSn 기준으로 매칭
         crawled_product_codes = set()  # product_code로도 매칭
-        if resume:
+        stored_products = {}  # onlineProdSn 또는 product_code -> 저장된 제품 정보 (변경 감지용)
+        if resume or skip_unchanged or deadline is not None:
             info_file = f"info_{brand_name}.json"
             if os.path.exists(info_file):
                 try:
@@ -2628,10 +3084,12 @@ class AmoreMallCrawler:
                                 match = re.search(r'onlineProdSn=(\d+)', product['product_url'])
                                 if match:
                                     crawled_online_prod_sns.add(match.group(1))
+                                    stored_products[match.group(1)] = product
                             # 제품 코드로도 매칭 (보조)
                             if product.get('product_code'):
                                 crawled_product_codes.add(product['product_code'])
-                    if crawled_online_prod_sns or crawled_product_codes:
+                                stored_products.setdefault(product['product_code'], product)
+                    if resume and (crawled_online_prod_sns or crawled_product_codes):
                         print(f"\n✓ 기존 크롤링 데이터 발견: {len(crawled_online_prod_sns)}개 제품 (onlineProdSn 기준)")
                         print(f"  → 중단된 지점부터 재개합니다.")
                 except Exception as e:
@@ -2639,16 +3097,20 @@ class AmoreMallCrawler:
                         print(f"  [디버깅] 기존 파일 읽기 오류: {e}")
         
         # 3. 각 제품의 리뷰 크롤링
-        results = []
+        completed_count = 0
         total_products = len(products)
         skipped_count = 0
         
         print(f"\n{'='*60}")
         print(f"총 {total_products}개 제품의 리뷰 크롤링 시작")
-        if crawled_online_prod_sns:
+        if resume and crawled_online_prod_sns:
             print(f"  (이미 크롤링된 {len(crawled_online_prod_sns)}개 제품 건너뛰기)")
         print(f"{'='*60}")
         
+        # 크롤링할 제품 목록 (이미 크롤링된 제품, 리뷰 수가 바뀌지 않은 제품 제외)
+        pending = []
+        history = {}  # 순번 -> (지난 크롤링의 제품 정보, 리뷰 수) (스케줄러 우선순위용)
+        unchanged_count = 0
         for idx, product in enumerate(products, 1):
             product_code = product.get('product_code', '')
             product_url = product.get('product_url', '')
@@ -2673,49 +3135,478 @@ class AmoreMallCrawler:
                 skipped_count += 1
                 continue
             
-            print(f"\n[{idx}/{total_products}] {product_name}")
-            print(f"  URL: {product['product_url']}")
+            if skip_unchanged or deadline is not None:
+                match = re.search(r'onlineProdSn=(\d+)', product_url)
+                stored = stored_products.get(match.group(1)) if match else None
+                stored = stored or stored_products.get(product_code)
+                stored_count = self._stored_review_count(stored, product_code)
+                history[idx] = (stored, stored_count)
+            
+            # 변경 감지: 목록의 리뷰 수가 지난 크롤링과 같으면 페이지를 열지 않고 가격/평점만 갱신
+            if skip_unchanged and product.get('listing_review_count') is not None:
+                if stored_count is not None and stored_count == product['listing_review_count']:
+                    print(f"\n[{idx}/{total_products}] {product_name}")
+                    print(f"  ⏭ 리뷰 수 변화 없음 ({stored_count}개). 가격/평점만 갱신합니다.")
+                    unchanged_count += 1
+                    completed_count += 1
+                    yield self._unchanged_result(product, stored)
+                    continue
             
-            try:
-                result = self.crawl_product_reviews(
-                    product['product_url'],
-                    max_pages=max_pages_per_product,
-                    max_reviews=max_reviews_per_product,
-                    test_mode=test_mode,
-                    max_more_clicks=max_more_clicks
-                )
-                
-                # 제품 정보 업데이트 (크롤링한 정보와 브랜드 페이지 정보 병합)
-                # 브랜드 페이지에서 가져온 정보로 업데이트 (제품명은 크롤링한 것이 우선)
-                if product.get('product_code') and not result['product_info'].get('product_code'):
-                    result['product_info']['product_code'] = product['product_code']
-                if product.get('product_url'):
-                    result['product_info']['product_url'] = product['product_url']
-                # 브랜드 페이지의 제품명이 더 정리되어 있으면 사용 (크롤링한 제품명이 비어있는 경우)
-                if not result['product_info'].get('product_name') and product.get('product_name'):
-                    result['product_info']['product_name'] = product['product_name']
-                results.append(result)
+            pending.append((idx, product))
+        
+        scheduler = None
+        if deadline is not None and pending:
+            scheduler = CrawlScheduler(deadline, checkpoint_path=f"schedule_{brand_name}.json")
+            pending = scheduler.plan(pending, history, total_products, incremental=self.incremental_db is not None)
+        
+        crawl_kwargs = {
+            'max_pages': max_pages_per_product,
+            'max_reviews': max_reviews_per_product,
+            'test_mode': test_mode,
+            'max_more_clicks': max_more_clicks,
+        }
+        
+        if http_reviews and self.review_backend != 'network':
+            print("  ⚠ HTTP 리뷰 수집은 review_backend='network'에서만 사용할 수 있습니다. 브라우저로 수집합니다.")
+            http_reviews = False
+        
+        if workers and workers > 1 and len(pending) > 1:
+            if http_reviews:
+                print("  ⚠ 병렬 워커 모드에서는 HTTP 리뷰 수집을 사용하지 않습니다.")
+            pool_budget = max(0.0, budget_end - time.monotonic()) if budget_end is not None else None
+            for result in self._crawl_with_worker_pool(pending, total_products, crawl_kwargs, workers, pool_budget, scheduler):
+                completed_count += 1
+                if scheduler:
+                    scheduler.complete(result['product_info'])
+                yield result
+        else:
+            http_pending = []  # 리뷰를 HTTP로 수집할 결과 (제품 정보만 수집된 상태)
+            weights = self._review_volumes(pending)
+            for position, (idx, product) in enumerate(pending):
+                print(f"\n[{idx}/{total_products}] {product.get('product_name', '제품명 없음')}")
+                print(f"  URL: {product['product_url']}")
+                
+                # 제품별 인자: 목록의 전체 리뷰 수, 남은 시간을 남은 제품의 리뷰 수 비율로 나눈 시간 예산
+                product_kwargs = {'review_total': product.get('listing_review_count')}
+                if scheduler:
+                    product_kwargs['time_budget'] = scheduler.budget(position)
+                    if product_kwargs['time_budget'] is None:
+                        print(f"  ⏱ 마감 시각까지 남은 시간이 부족하여 크롤링을 멈춥니다.")
+                        break
+                elif budget_end is not None:
+                    remaining_weight = sum(weights[i] for i, _ in pending[position:])
+                    product_kwargs['time_budget'] = max(0.0, budget_end - time.monotonic()) * weights[idx] / remaining_weight
                 
-                print(f"  ✓ {len(result['reviews'])}개의 후기 추출 완료")
+                try:
+                    # 리뷰 API를 찾은 뒤에는 브라우저에서 제품 정보만 수집
+                    use_http = http_reviews and self.review_api_url is not None
+                    product_sink = None if use_http else self._listing_review_sink(product, review_sink)
+                    result = self.crawl_product_with_recovery(product['product_url'], include_reviews=not use_http, review_sink=product_sink,
+                                                              **crawl_kwargs, **product_kwargs)
+                    self._merge_listing_info(product, result)
+                    
+                    if use_http:
+                        http_pending.append(result)
+                        print(f"  ✓ 제품 정보 수집 완료 (리뷰는 HTTP로 수집 예정)")
+                        if len(http_pending) < http_concurrency:
+                            continue
+                        # 동시 요청 수만큼 모이면 바로 리뷰를 받아 내보냄 (중단되어도 앞선 제품은 저장됨)
+                        batch, http_pending = http_pending, []
+                        for result in self._iter_http_results(batch, max_pages_per_product, max_reviews_per_product, http_concurrency):
+                            completed_count += 1
+                            if scheduler:
+                                scheduler.complete(result['product_info'])
+                            yield result
+                        continue
+                    print(f"  ✓ {result['total_reviews']}개의 후기 추출 완료")
+                    
+                except Exception as e:
+                    print(f"  ✗ 오류 발생: {e}")
+                    import traceback
+                    if self.debug:
+                        traceback.print_exc()
+                    continue
                 
-            except Exception as e:
-                print(f"  ✗ 오류 발생: {e}")
-                import traceback
-                if self.debug:
-                    traceback.print_exc()
-                continue
+                completed_count += 1
+                if scheduler:
+                    scheduler.complete(result['product_info'])
+                yield result
+            
+            # 남은 묶음 (마감이나 시간 예산이 지났으면 시작하지 않음, 스케줄러는 다음 실행으로 넘김)
+            out_of_time = ((scheduler is not None and scheduler.remaining_time() < scheduler.min_product_seconds)
+                           or (scheduler is None and budget_end is not None and time.monotonic() >= budget_end))
+            if http_pending and out_of_time:
+                print(f"  ⏱ 남은 시간이 부족하여 {len(http_pending)}개 제품의 HTTP 리뷰 수집을 시작하지 않습니다.")
+            elif http_pending:
+                for result in self._iter_http_results(http_pending, max_pages_per_product, max_reviews_per_product, http_concurrency):
+                    completed_count += 1
+                    if scheduler:
+                        scheduler.complete(result['product_info'])
+                    yield result
+        
+        if scheduler:
+            scheduler.finish()
         
         print(f"\n{'='*60}")
-        print(f"크롤링 완료: {len(results)}개 제품 (건너뛴 제품: {skipped_count}개)")
+        print(f"크롤링 완료: {completed_count}개 제품 (건너뛴 제품: {skipped_count}개, 리뷰 수 변화 없음: {unchanged_count}개)")
         print(f"{'='*60}")
+        self.print_stats()
+    
+    def _parse_listing_stats(self, listing_text: str) -> Dict:
+        """
+        목록의 제품 텍스트에서 평점, 리뷰 수, 가격 추출
+        
+        예: "10%135,000원자음2종 세트 (150ml+125ml)4.9(4,374)좋아요"
+            -> {'listing_rating': 4.9, 'listing_review_count': 4374, 'listing_price': '135,000'}
         
-        return results, brand_name
+        Args:
+            listing_text: 제품 링크의 텍스트
+            
+        Returns:
+            listing_rating, listing_review_count, listing_price 딕셔너리 (찾지 못한 항목은 None)
+        """
+        stats = {'listing_rating': None, 'listing_review_count': None, 'listing_price': None}
+        if not listing_text:
+            return stats
+        rating_matches = LISTING_RATING_PATTERN.findall(listing_text)
+        if rating_matches:
+            rating, review_count = rating_matches[-1]
+            stats['listing_rating'] = float(rating)
+            stats['listing_review_count'] = int(review_count.replace(',', ''))
+        price_match = re.search(r'(\d{1,3}(?:,\d{3})*)원', listing_text)
+        if price_match:
+            stats['listing_price'] = price_match.group(1)
+        return stats
+    
+    def _stored_review_count(self, stored_product: Optional[Dict], product_code: str) -> Optional[int]:
+        """
+        지난 크롤링에서 기록한 제품의 리뷰 수 (목록 리뷰 수 → 제품 페이지 리뷰 수 → DB 후기 수 순서)
+        
+        Args:
+            stored_product: info JSON에 저장된 제품 정보 (없으면 None)
+            product_code: 제품 코드 (DB 조회용)
+            
+        Returns:
+            리뷰 수 (알 수 없으면 None)
+        """
+        if stored_product:
+            if stored_product.get('listing_review_count') is not None:
+                return int(stored_product['listing_review_count'])
+            digits = re.sub(r'[^\d]', '', str(stored_product.get('review_count') or ''))
+            if digits:
+                return int(digits)
+        if self.incremental_db is not None and product_code:
+            return self.incremental_db.get_review_total(product_code) or None
+        return None
+    
+    def _review_volumes(self, pending: List[tuple]) -> Dict[int, float]:
+        """
+        제품별 리뷰 규모 (시간 예산 배분 가중치, 목록의 리뷰 수가 없으면 다른 제품의 평균 사용)
+        
+        Args:
+            pending: (순번, 제품 딕셔너리) 리스트
+            
+        Returns:
+            순번 -> 가중치 (1 이상)
+        """
+        known = [product['listing_review_count'] for _, product in pending if product.get('listing_review_count')]
+        default = sum(known) / len(known) if known else 1
+        return {idx: max(1, product.get('listing_review_count') or default) for idx, product in pending}
+    
+    def _unchanged_result(self, product: Dict, stored_product: Optional[Dict]) -> Dict:
+        """
+        리뷰 수가 바뀌지 않은 제품의 결과 (저장된 제품 정보에 목록의 가격/평점만 반영, 새 리뷰 없음)
+        
+        Args:
+            product: get_brand_products가 반환한 제품 딕셔너리
+            stored_product: info JSON에 저장된 제품 정보 (없으면 목록 정보만 사용)
+            
+        Returns:
+            crawl_product_reviews와 같은 형식의 결과 ('unchanged': True)
+        """
+        product_info = dict(stored_product or {})
+        product_info.setdefault('product_code', product.get('product_code', ''))
+        product_info.setdefault('product_name', product.get('product_name', ''))
+        if product.get('listing_price'):
+            product_info['current_price'] = product['listing_price']
+        if product.get('listing_rating') is not None:
+            product_info['rating'] = str(product['listing_rating'])
+        result = {'product_info': product_info, 'reviews': [], 'total_reviews': 0, 'unchanged': True}
+        self._merge_listing_info(product, result)
+        return result
+    
+    def _listing_review_sink(self, product: Dict, review_sink: Optional[Callable[[Dict], None]]) -> Optional[Callable[[Dict], None]]:
+        """
+        후기 묶음의 제품 정보에 목록 정보를 병합해 review_sink로 넘기는 함수 (review_sink가 없으면 None)
+        
+        Args:
+            product: get_brand_products가 반환한 제품 딕셔너리
+            review_sink: 후기 묶음을 넘겨받을 함수
+        """
+        if review_sink is None:
+            return None
+        
+        def sink(partial: Dict):
+            partial = dict(partial, product_info=dict(partial['product_info']))
+            self._merge_listing_info(product, partial)
+            review_sink(partial)
+        
+        return sink
+    
+    def _merge_listing_info(self, product: Dict, result: Dict):
+        """
+        크롤링 결과에 브랜드 페이지(목록)에서 가져온 정보 병합
+        
+        Args:
+            product: get_brand_products가 반환한 제품 딕셔너리
+            result: crawl_product_reviews 결과 (제자리에서 수정)
+        """
+        # 브랜드 페이지에서 가져온 정보로 업데이트 (제품명은 크롤링한 것이 우선)
+        if product.get('product_code') and not result['product_info'].get('product_code'):
+            result['product_info']['product_code'] = product['product_code']
+        if product.get('product_url'):
+            result['product_info']['product_url'] = product['product_url']
+        # 브랜드 페이지의 제품명이 더 정리되어 있으면 사용 (크롤링한 제품명이 비어있는 경우)
+        if not result['product_info'].get('product_name') and product.get('product_name'):
+            result['product_info']['product_name'] = product['product_name']
+        # 다음 실행의 변경 감지를 위해 목록의 평점/리뷰 수 기록
+        for key in ('listing_rating', 'listing_review_count', 'listing_price'):
+            if product.get(key) is not None:
+                result['product_info'][key] = product[key]
+    
+    def _crawl_from_job_queue(self, brand_url: str, products: List[Dict], job_queue: CrawlJobQueue, crawl_kwargs: Dict,
+                              review_sink: Optional[Callable[[Dict], None]] = None) -> Iterator[Dict]:
+        """
+        작업 큐에서 제품을 하나씩 임대해 크롤링
+        
+        결과를 내보낸 뒤(다음 제품을 요청받은 시점)에 작업을 완료로 기록하므로,
+        결과를 받은 쪽이 처리하기 전에 프로세스가 죽으면 임대가 만료되어 다른 프로세스가 다시 크롤링한다.
+        
+        Args:
+            brand_url: 브랜드 페이지 URL (큐의 작업 구분용)
+            products: get_brand_products가 반환한 제품 리스트
+            job_queue: 작업 큐
+            crawl_kwargs: crawl_product_reviews에 넘길 인자
+            review_sink: 후기를 페이지마다 넘겨받는 함수 (iter_brand_products 참고)
+            
+        Yields:
+            크롤링 결과 (임대한 순서)
+        """
+        restarted_before = job_queue.stats['restarted']
+        added = job_queue.enqueue(brand_url, products)
+        restarted = job_queue.stats['restarted'] - restarted_before
+        total_products = len(products)
+        print(f"\n[작업 큐] {job_queue.db_path}: 새 작업 {added}개 등록"
+              f"{f', 지난 회차 작업 {restarted}개를 다시 대기로 변경' if restarted else ''} (임대자: {job_queue.owner})")
+        
+        job_queue.start_heartbeat()
+        try:
+            while True:
+                job = job_queue.claim(brand_url)
+                if job is None:
+                    break
+                product = job['product']
+                print(f"\n[{job['position']}/{total_products}] {product.get('product_name', '제품명 없음')} (시도 {job['attempts']}회)")
+                print(f"  URL: {job['product_url']}")
+                try:
+                    result = self.crawl_product_with_recovery(job['product_url'], review_total=product.get('listing_review_count'),
+                                                              review_sink=self._listing_review_sink(product, review_sink), **crawl_kwargs)
+                    self._merge_listing_info(product, result)
+                    print(f"  ✓ {result['total_reviews']}개의 후기 추출 완료")
+                except Exception as e:
+                    job_queue.fail(brand_url, job['product_url'], str(e))
+                    print(f"  ✗ 오류 발생: {e}")
+                    if self.debug:
+                        import traceback
+                        traceback.print_exc()
+                    continue
+                yield result
+                job_queue.complete(brand_url, job['product_url'])
+        finally:
+            job_queue.stop_heartbeat()
+            job_queue.print_stats(brand_url)
+    
+    def _crawl_with_worker_pool(self, pending: List[tuple], total_products: int, crawl_kwargs: Dict, workers: int, time_budget: Optional[float] = None, scheduler: Optional[CrawlScheduler] = None) -> Iterator[Dict]:
+        """
+        여러 Chrome 프로세스로 제품 리뷰를 병렬 크롤링
+        
+        각 워커는 별도 프로세스에서 자신의 AmoreMallCrawler를 띄우고, 부모가 쉬고 있는 워커의
+        전용 큐로 제품 URL을 하나씩 넘기면 crawl_product_reviews 결과를 돌려준다.
+        부모가 워커별로 넘긴 제품을 기록하므로, 워커가 죽으면 (시작 메시지를 보내기 전이었어도)
+        그 제품을 한 번 재시도하고 워커를 새로 띄운다.
+        
+        Args:
+            pending: (순번, 제품 딕셔너리) 리스트
+            total_products: 전체 제품 수 (로그 출력용)
+            crawl_kwargs: crawl_product_reviews에 넘길 인자
+            workers: 워커 프로세스 수
+            time_budget: 전체 시간 예산 (초). 워커 수만큼의 시간을 리뷰 수 비율로 제품에 미리 나눔
+            scheduler: 마감 시각 스케줄러 (지정하면 스케줄러의 예상 작업량으로 시간 예산을 나누고,
+                       마감이 지나면 아직 시작하지 않은 제품을 큐에서 빼고 끝냄)
+            
+        Yields:
+            크롤링 결과 (워커가 끝낸 순서)
+        """
+        ctx = multiprocessing.get_context('spawn')
+        result_queue = ctx.Queue()
+        worker_count = min(workers, len(pending))
+        crawler_kwargs = dict(self._init_kwargs)
+        
+        # 제품별 인자 (전체 리뷰 수, 시간 예산)
+        weights = self._review_volumes(pending)
+        total_weight = sum(weights.values())
+        scheduled_budgets = scheduler.pool_budgets(worker_count) if scheduler else {}
+        product_kwargs = {}
+        for idx, product in pending:
+            product_kwargs[idx] = {'review_total': product.get('listing_review_count')}
+            if scheduler:
+                product_kwargs[idx]['time_budget'] = scheduled_budgets[idx]
+            elif time_budget is not None:
+                product_kwargs[idx]['time_budget'] = time_budget * worker_count * weights[idx] / total_weight
+        
+        products_by_idx = {idx: product for idx, product in pending}
+        waiting = [idx for idx, _ in pending]  # 아직 워커에 넘기지 않은 제품 순번 (앞에서부터 넘김)
+        
+        print(f"\n[워커 풀] {worker_count}개의 Chrome 워커로 {len(pending)}개 제품 병렬 크롤링")
+        
+        def start_worker(worker_id: int):
+            # 워커마다 전용 작업 큐를 두고 부모가 한 번에 한 제품씩 넘김 (어느 워커가 어떤 제품을 받았는지 부모가 앎)
+            task_queue = ctx.Queue()
+            process = ctx.Process(
+                target=_crawl_worker,
+                args=(worker_id, task_queue, result_queue, crawler_kwargs, crawl_kwargs),
+                daemon=True
+            )
+            process.start()
+            return process, task_queue
+        
+        processes = {worker_id: start_worker(worker_id) for worker_id in range(1, worker_count + 1)}
+        next_worker_id = worker_count + 1
+        restarts_left = worker_count * 3  # Chrome 실행 자체가 실패할 때 무한 재시작 방지
+        assigned = {}  # worker_id -> 넘긴 제품 순번 (시작 메시지를 받기 전이어도 처리 중으로 봄)
+        retried = set()  # 워커 사망으로 이미 재시도한 제품 순번
+        finished = {}  # 순번 -> 성공 여부 (결과는 바로 내보내고 보관하지 않음)
+        deadline_passed = False
+        
+        try:
+            while len(finished) < len(pending):
+                # 마감이 지나면 아직 넘기지 않은 제품은 포기하고 처리 중인 제품만 기다림
+                if scheduler and not deadline_passed and scheduler.remaining_time() <= 0:
+                    deadline_passed = True
+                    for idx in waiting:
+                        finished[idx] = False
+                    print(f"  ⏱ 마감 시각이 지나 시작하지 않은 {len(waiting)}개 제품을 다음 실행으로 넘깁니다.")
+                    waiting = []
+                    if len(finished) >= len(pending):
+                        break
+                
+                # 쉬고 있는 워커에 다음 제품 넘기기
+                for worker_id, (process, task_queue) in processes.items():
+                    if worker_id not in assigned and waiting:
+                        idx = waiting.pop(0)
+                        assigned[worker_id] = idx
+                        task_queue.put((idx, products_by_idx[idx]['product_url'], product_kwargs[idx]))
+                
+                try:
+                    message = result_queue.get(timeout=1)
+                except queue.Empty:
+                    message = None
+                
+                if message:
+                    kind, worker_id, idx = message[0], message[1], message[2]
+                    product = products_by_idx[idx]
+                    if kind == 'start':
+                        print(f"\n[{idx}/{total_products}] {product.get('product_name', '제품명 없음')} (워커 {worker_id})")
+                        continue
+                    if assigned.get(worker_id) == idx:
+                        del assigned[worker_id]
+                    if idx in finished:
+                        # 워커가 죽었다고 보고 다시 넘긴 제품의 결과가 늦게 도착한 경우
+                        continue
+                    if kind == 'done':
+                        result = message[3]
+                        self._merge_listing_info(product, result)
+                        finished[idx] = True
+                        print(f"  ✓ [{idx}/{total_products}] {len(result['reviews'])}개의 후기 추출 완료 (워커 {worker_id}, 진행: {len(finished)}/{len(pending)})")
+                        yield result
+                    elif kind == 'error':
+                        finished[idx] = False
+                        print(f"  ✗ [{idx}/{total_products}] 오류 발생 (워커 {worker_id}): {message[3]}")
+                    continue
+                
+                # 죽은 워커 확인: 넘겨받은 제품은 (시작 전이어도) 한 번 재시도, 워커는 새로 띄움
+                for worker_id, (process, _) in list(processes.items()):
+                    if process.is_alive():
+                        continue
+                    del processes[worker_id]
+                    idx = assigned.pop(worker_id, None)
+                    print(f"  ⚠ 워커 {worker_id} 종료됨 (exitcode: {process.exitcode})")
+                    if idx is not None and idx not in finished:
+                        if deadline_passed:
+                            finished[idx] = False
+                            print(f"  ⏱ [{idx}/{total_products}] 마감 시각이 지나 다시 시도하지 않습니다.")
+                        elif idx in retried:
+                            finished[idx] = False
+                            print(f"  ✗ [{idx}/{total_products}] 재시도 후에도 실패하여 건너뜁니다.")
+                        else:
+                            retried.add(idx)
+                            waiting.insert(0, idx)
+                            print(f"  → [{idx}/{total_products}] 제품을 다시 큐에 넣습니다.")
+                    if len(finished) < len(pending) and restarts_left > 0:
+                        restarts_left -= 1
+                        processes[next_worker_id] = start_worker(next_worker_id)
+                        next_worker_id += 1
+                
+                if not processes:
+                    print(f"  ✗ 살아있는 워커가 없습니다. 남은 {len(pending) - len(finished)}개 제품은 건너뜁니다.")
+                    break
+        finally:
+            for process, task_queue in processes.values():
+                task_queue.put(None)
+            for process, _ in processes.values():
+                process.join(timeout=30)
+                if process.is_alive():
+                    process.terminate()
     
     def close(self):
         """브라우저 종료"""
+        if self.notice_cache:
+            self.notice_cache.close()
+        self.selectors.save()
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(wait=True)
+        if self.incremental_db is not None:
+            self.incremental_db.close()
+        if self.review_checkpoint is not None:
+            self.review_checkpoint.close()
         self.driver.quit()
 
 
+def _crawl_worker(worker_id: int, task_queue, result_queue, crawler_kwargs: Dict, crawl_kwargs: Dict):
+    """
+    워커 프로세스 진입점 (crawl_brand_products의 워커 풀 모드)
+    
+    자신의 Chrome 세션을 띄운 뒤 전용 task_queue에서 부모가 넘긴 (순번, URL, 제품별 인자)를 꺼내 크롤링하고
+    결과를 result_queue로 보낸다. None을 받으면 종료한다.
+    """
+    crawler = AmoreMallCrawler(**crawler_kwargs)
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+            idx, url, product_kwargs = task
+            result_queue.put(('start', worker_id, idx))
+            try:
+                result = crawler.crawl_product_with_recovery(url, **crawl_kwargs, **product_kwargs)
+                result_queue.put(('done', worker_id, idx, result))
+            except Exception as e:
+                result_queue.put(('error', worker_id, idx, str(e)))
+    finally:
+        crawler.print_stats(f"워커 {worker_id}")
+        crawler.close()
+
+
 if __name__ == "__main__":
     # 테스트
     url = "https://www.amoremall.com/kr/ko/product/detail?onlineProdSn=63063&clickUrl=pc%3D1766379469907&cust=null&recommendId=3505e7fb-8916-41fa-bcc0-507c55948275&dp=MOB_CAT_ORD_RANK&planId=RP-230807-095421&scenarioId=scenario_1&itemSetId=IS-201022-091405&targetGroupId=ALL&channelId=channel_2&abTestKey=0&ITEM_VALUE=CTG002_111970001785&onlineProdCode=111970001785"
@@ -1,15 +1,23 @@
 """
 데이터베이스 관리 모듈
 """
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float, DateTime, ForeignKey
+from sqlalchemy import create_engine, inspect, text, bindparam, update, Column, Integer, String, Text, Float, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set
 import json
+import sqlite3
+import time
+from review_fingerprint import review_fingerprint
 
 Base = declarative_base()
 
+# add_reviews_bulk(update_existing=True)에서 이미 저장된 후기에 갱신할 컬럼 (지문에 들어가는 컬럼 제외)
+REVIEW_UPDATE_COLUMNS = ['user_info', 'age', 'gender', 'skin_type_1', 'skin_type_2', 'review_type',
+                         'special_note_1', 'special_note_2', 'special_note_3']
+
 
 class Product(Base):
     """제품 테이블"""
@@ -53,10 +61,15 @@ class Review(Base):
     special_note_2 = Column(String(200))  # 특이사항2 (예: "유분기: 유분 적당해요")
     special_note_3 = Column(String(200))  # 특이사항3 (예: "촉촉함: 촉촉해요")
     review_text = Column(Text, nullable=False)
+    review_fingerprint = Column(String(40))  # 리뷰 지문 (작성자/평점/옵션/본문, 제품 내 중복 방지 키)
     created_at = Column(DateTime, default=datetime.now)
     
     # 관계
     product = relationship("Product", back_populates="reviews")
+    
+    __table_args__ = (
+        Index('ux_reviews_product_fingerprint', 'product_id', 'review_fingerprint', unique=True),
+    )
 
 
 class ProductSummary(Base):
@@ -88,10 +101,106 @@ class DatabaseManager:
         Args:
             db_path: SQLite 데이터베이스 파일 경로
         """
+        self.db_path = db_path
         self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
         Base.metadata.create_all(self.engine)
+        self._backfill_review_fingerprints()
+        # 유니크 인덱스가 없는 기존 DB는 migrate_review_fingerprints()를 실행하기 전까지 저장된 지문을 조회해 중복을 거름
+        self.fingerprint_index = self._has_fingerprint_index()
+        if not self.fingerprint_index:
+            print("  ⚠ 후기 중복 방지 인덱스가 없는 기존 DB입니다. "
+                  "'python main.py --migrate-db --db-path ...'로 중복 후기를 정리하고 인덱스를 만드세요.")
         Session = sessionmaker(bind=self.engine)
         self.session = Session()
+        # 대량 후기 저장 통계 (add_reviews_bulk, duplicates: 이미 저장되어 있던 후기 수)
+        self.review_insert_stats = {'rows': 0, 'duplicates': 0, 'time': 0.0}
+    
+    def _backfill_review_fingerprints(self):
+        """
+        review_fingerprint 컬럼이 없던 기존 DB에 컬럼을 추가하고 저장된 후기의 지문을 채움
+        
+        create_all은 기존 테이블을 바꾸지 않으므로 직접 추가한다. 후기를 삭제하지는 않으며,
+        중복 후기 정리와 유니크 인덱스 생성은 migrate_review_fingerprints()에서 명시적으로 실행한다.
+        """
+        columns = {column['name'] for column in inspect(self.engine).get_columns('reviews')}
+        with self.engine.begin() as conn:
+            if 'review_fingerprint' not in columns:
+                conn.execute(text("ALTER TABLE reviews ADD COLUMN review_fingerprint VARCHAR(40)"))
+            rows = conn.execute(text(
+                "SELECT id, username, rating, option, review_text FROM reviews WHERE review_fingerprint IS NULL"
+            )).fetchall()
+            if rows:
+                conn.execute(
+                    text("UPDATE reviews SET review_fingerprint = :fingerprint WHERE id = :id"),
+                    [{'id': row.id, 'fingerprint': review_fingerprint(row._asdict())} for row in rows]
+                )
+        if rows:
+            print(f"  ✓ 기존 후기 {len(rows)}개에 리뷰 지문을 채웠습니다.")
+    
+    def _has_fingerprint_index(self) -> bool:
+        """(product_id, review_fingerprint) 유니크 인덱스 존재 여부"""
+        return any(index['name'] == 'ux_reviews_product_fingerprint'
+                   for index in inspect(self.engine).get_indexes('reviews'))
+    
+    def migrate_review_fingerprints(self, dry_run: bool = False) -> Dict:
+        """
+        중복 후기 정리 후 (product_id, review_fingerprint) 유니크 인덱스 생성 (--migrate-db)
+        
+        같은 제품에 같은 지문의 후기가 여러 개면 가장 먼저 저장된 것만 남긴다.
+        삭제할 후기 수를 제품별로 먼저 출력하고, 삭제 전에 DB 파일을 {db_path}.bak-날짜시각으로 백업한다.
+        
+        Args:
+            dry_run: 삭제할 후기 수만 출력하고 DB는 바꾸지 않음
+            
+        Returns:
+            {'duplicates': 삭제(예정) 후기 수, 'products': 중복이 있는 제품 수, 'backup': 백업 파일 경로 또는 None}
+        """
+        result = {'duplicates': 0, 'products': 0, 'backup': None}
+        if self.fingerprint_index:
+            print("  ✓ 후기 중복 방지 인덱스가 이미 있습니다.")
+            return result
+        
+        duplicate_ids = "SELECT id FROM reviews WHERE id NOT IN (SELECT MIN(id) FROM reviews GROUP BY product_id, review_fingerprint)"
+        with self.engine.connect() as conn:
+            rows = conn.execute(text(
+                "SELECT products.product_code, products.product_name, COUNT(*) AS duplicates "
+                f"FROM reviews JOIN products ON products.id = reviews.product_id WHERE reviews.id IN ({duplicate_ids}) "
+                "GROUP BY reviews.product_id ORDER BY duplicates DESC"
+            )).fetchall()
+        result['duplicates'] = sum(row.duplicates for row in rows)
+        result['products'] = len(rows)
+        
+        print(f"\n[후기 지문 변환] {self.db_path}")
+        print(f"  - 삭제할 중복 후기: {result['duplicates']}개 (제품 {result['products']}개, 제품마다 가장 먼저 저장된 후기만 남김)")
+        for row in rows[:20]:
+            print(f"    · {row.product_code} {row.product_name}: {row.duplicates}개")
+        if len(rows) > 20:
+            print(f"    · 외 제품 {len(rows) - 20}개")
+        if dry_run:
+            print("  → --dry-run: DB를 바꾸지 않았습니다.")
+            return result
+        
+        # 삭제 전에 DB 파일 전체를 SQLite 백업 API로 복사
+        self.session.commit()
+        backup_path = f"{self.db_path}.bak-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        source = sqlite3.connect(self.db_path)
+        target = sqlite3.connect(backup_path)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        result['backup'] = backup_path
+        print(f"  ✓ 백업: {backup_path}")
+        
+        with self.engine.begin() as conn:
+            conn.execute(text(f"DELETE FROM reviews WHERE id IN ({duplicate_ids})"))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX ux_reviews_product_fingerprint ON reviews (product_id, review_fingerprint)"
+            ))
+        self.fingerprint_index = True
+        print(f"  ✓ 중복 후기 {result['duplicates']}개를 삭제하고 중복 방지 인덱스를 만들었습니다.")
+        return result
     
     def add_product(self, product_info: Dict) -> Product:
         """
@@ -144,39 +253,125 @@ class DatabaseManager:
     
     def add_reviews(self, product_id: int, reviews: List[Dict]) -> List[Review]:
         """
-        후기 추가
+        후기 추가 (이 제품에 같은 지문의 후기가 이미 있으면 건너뜀)
         
         Args:
             product_id: 제품 ID
             reviews: 후기 리스트
             
         Returns:
-            Review 객체 리스트
+            새로 저장한 Review 객체 리스트
         """
+        stored = {fingerprint for (fingerprint,) in
+                  self.session.query(Review.review_fingerprint).filter_by(product_id=product_id)}
         review_objects = []
         for review_data in reviews:
-            review = Review(
-                product_id=product_id,
-                username=review_data.get('username'),
-                user_info=review_data.get('user_info'),  # 원본 정보
-                age=review_data.get('age'),
-                gender=review_data.get('gender'),
-                skin_type_1=review_data.get('skin_type_1'),
-                skin_type_2=review_data.get('skin_type_2'),
-                rating=review_data.get('rating'),
-                option=review_data.get('option'),
-                review_type=review_data.get('review_type'),
-                special_note_1=review_data.get('special_note_1'),
-                special_note_2=review_data.get('special_note_2'),
-                special_note_3=review_data.get('special_note_3'),
-                review_text=review_data.get('review_text', '')
-            )
+            row = self._review_row(product_id, review_data)
+            if row['review_fingerprint'] in stored:
+                continue
+            stored.add(row['review_fingerprint'])
+            review = Review(**row)
             review_objects.append(review)
             self.session.add(review)
         
         self.session.commit()
         return review_objects
     
+    def add_reviews_bulk(self, product_id: int, reviews: List[Dict], chunk_size: int = 1000,
+                         update_existing: bool = False) -> int:
+        """
+        후기 대량 추가 (ORM 객체 없이 Core insert를 chunk_size개씩 executemany로 실행)
+        
+        add_reviews와 같은 후기 딕셔너리를 받으며, (product_id, review_fingerprint) 유니크 인덱스에
+        걸리는 후기는 INSERT ... ON CONFLICT로 처리하므로 같은 제품을 다시 크롤링해도 후기가 중복 저장되지 않는다.
+        저장 속도는 review_insert_stats에 누적된다.
+        
+        Args:
+            product_id: 제품 ID
+            reviews: 후기 리스트
+            chunk_size: 한 번에 실행할 행 수
+            update_existing: 이미 저장된 후기의 작성자 정보, 리뷰 타입, 특이사항을 새로 파싱한 값으로 갱신
+                             (False면 ON CONFLICT DO NOTHING)
+            
+        Returns:
+            새로 저장한 후기 수
+        """
+        start = time.monotonic()
+        rows = [self._review_row(product_id, review_data) for review_data in reviews]
+        if not self.fingerprint_index:
+            inserted = self._add_reviews_without_index(product_id, rows, chunk_size, update_existing)
+            self.review_insert_stats['rows'] += inserted
+            self.review_insert_stats['duplicates'] += len(rows) - inserted
+            self.review_insert_stats['time'] += time.monotonic() - start
+            return inserted
+        statement = sqlite_insert(Review.__table__)
+        index_elements = ['product_id', 'review_fingerprint']
+        if update_existing:
+            statement = statement.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={column: statement.excluded[column] for column in REVIEW_UPDATE_COLUMNS}
+            )
+            before = self.session.query(Review).filter_by(product_id=product_id).count()
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=index_elements)
+        inserted = 0
+        for offset in range(0, len(rows), chunk_size):
+            inserted += self.session.execute(statement, rows[offset:offset + chunk_size]).rowcount
+        if update_existing:
+            # DO UPDATE는 갱신한 행도 rowcount에 포함되므로 저장 전후 후기 수로 계산
+            inserted = self.session.query(Review).filter_by(product_id=product_id).count() - before
+        self.session.commit()
+        self.review_insert_stats['rows'] += inserted
+        self.review_insert_stats['duplicates'] += len(rows) - inserted
+        self.review_insert_stats['time'] += time.monotonic() - start
+        return inserted
+    
+    def _add_reviews_without_index(self, product_id: int, rows: List[Dict], chunk_size: int, update_existing: bool) -> int:
+        """유니크 인덱스가 없는 기존 DB용 add_reviews_bulk (저장된 지문을 조회해 새 후기만 insert)"""
+        stored = {fingerprint for (fingerprint,) in
+                  self.session.query(Review.review_fingerprint).filter_by(product_id=product_id)}
+        new_rows = []
+        existing_rows = []
+        for row in rows:
+            if row['review_fingerprint'] in stored:
+                existing_rows.append(row)
+                continue
+            stored.add(row['review_fingerprint'])
+            new_rows.append(row)
+        table = Review.__table__
+        for offset in range(0, len(new_rows), chunk_size):
+            self.session.execute(table.insert(), new_rows[offset:offset + chunk_size])
+        if update_existing and existing_rows:
+            statement = update(table).where(
+                table.c.product_id == bindparam('b_product_id'),
+                table.c.review_fingerprint == bindparam('b_review_fingerprint')
+            ).values({column: bindparam(f'b_{column}') for column in REVIEW_UPDATE_COLUMNS})
+            keys = ['product_id', 'review_fingerprint'] + REVIEW_UPDATE_COLUMNS
+            self.session.execute(statement, [{f'b_{key}': row[key] for key in keys} for row in existing_rows])
+        self.session.commit()
+        return len(new_rows)
+    
+    def _review_row(self, product_id: int, review_data: Dict) -> Dict:
+        """후기 딕셔너리를 reviews 테이블 컬럼 값으로 변환"""
+        return {
+            'product_id': product_id,
+            'username': review_data.get('username'),
+            'user_info': review_data.get('user_info'),  # 원본 정보
+            'age': review_data.get('age'),
+            'gender': review_data.get('gender'),
+            'skin_type_1': review_data.get('skin_type_1'),
+            'skin_type_2': review_data.get('skin_type_2'),
+            'rating': review_data.get('rating'),
+            'option': review_data.get('option'),
+            'review_type': review_data.get('review_type'),
+            'special_note_1': review_data.get('special_note_1'),
+            'special_note_2': review_data.get('special_note_2'),
+            'special_note_3': review_data.get('special_note_3'),
+            'review_text': review_data.get('review_text', ''),
+            'review_fingerprint': review_fingerprint(review_data),
+            'created_at': datetime.now(),
+        }
+    
     def add_summary(self, product_id: int, summary_data: Dict) -> ProductSummary:
         """
         제품 요약 추가 또는 업데이트
@@ -228,6 +423,29 @@ class DatabaseManager:
             return product.reviews
         return []
     
+    def get_review_total(self, product_code: str) -> int:
+        """제품에 저장된 후기 수 조회 (제품이 없으면 0)"""
+        product = self.get_product(product_code)
+        if not product:
+            return 0
+        return self.session.query(Review).filter_by(product_id=product.id).count()
+    
+    def get_review_fingerprints(self, product_code: str) -> Set[str]:
+        """
+        제품에 저장된 후기들의 지문 조회 (증분 재크롤링용)
+        
+        Args:
+            product_code: 제품 코드
+            
+        Returns:
+            review_fingerprint 집합 (제품이 없으면 빈 집합)
+        """
+        product = self.get_product(product_code)
+        if not product:
+            return set()
+        rows = self.session.query(Review.review_fingerprint).filter_by(product_id=product.id)
+        return {fingerprint for (fingerprint,) in rows}
+    
     def get_product_summary(self, product_code: str) -> Optional[ProductSummary]:
         """제품 요약 조회"""
         product = self.get_product(product_code)
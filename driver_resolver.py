@@ -0,0 +1,139 @@
+"""
+ChromeDriver 경로 결정 모듈 (디스크 캐시, 오프라인 동작)
+
+매번 ChromeDriverManager().install()로 네트워크 조회를 하지 않도록 다음 순서로 찾는다.
+1. 직접 지정한 경로 (인자 또는 CHROMEDRIVER_PATH 환경 변수)
+2. 캐시 파일에 기록된 경로 (설치된 Chrome 메이저 버전이 같을 때)
+3. PATH의 chromedriver (Chrome 메이저 버전이 같을 때)
+4. ChromeDriverManager().install() (네트워크 사용)
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+CACHE_FILE = os.path.join(os.path.expanduser('~'), '.amoremall_crawler', 'chromedriver.json')
+
+# 설치된 Chrome 버전을 확인할 실행 파일 후보
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+WINDOWS_CHROME_VERSION_COMMAND = ['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version']
+
+VERSION_PATTERN = re.compile(r'(\d+)\.\d+\.\d+(?:\.\d+)?')
+
+
+def _run_version_command(command) -> Optional[str]:
+    """버전 출력 명령 실행 후 버전 문자열 반환 (실패하면 None)"""
+    try:
+        output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output or '')
+    return match.group(0) if match else None
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    """버전 문자열의 메이저 버전 ('120.0.6099.109' -> '120')"""
+    return version.split('.')[0] if version else None
+
+
+def detect_chrome_version() -> Optional[str]:
+    """설치된 Chrome 버전 확인 (찾지 못하면 None)"""
+    if sys.platform.startswith('win'):
+        return _run_version_command(WINDOWS_CHROME_VERSION_COMMAND)
+    for binary in CHROME_BINARIES:
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if path and os.path.exists(path):
+            version = _run_version_command([path, '--version'])
+            if version:
+                return version
+    return None
+
+
+def driver_version(driver_path: str) -> Optional[str]:
+    """chromedriver 실행 파일의 버전 확인"""
+    return _run_version_command([driver_path, '--version'])
+
+
+def _load_cache(cache_file: str) -> Dict:
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file: str, driver_path: str, version: Optional[str], chrome_major: Optional[str]):
+    """캐시 저장 (여러 프로세스가 동시에 써도 깨지지 않도록 임시 파일 후 교체)"""
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump({'path': driver_path, 'version': version, 'chrome_major': chrome_major}, f)
+        os.replace(temp_file, cache_file)
+    except OSError:
+        pass
+
+
+def resolve_chromedriver(configured_path: Optional[str] = None, cache_file: str = CACHE_FILE, debug: bool = False) -> str:
+    """
+    사용할 chromedriver 경로 결정
+
+    Args:
+        configured_path: 직접 지정한 chromedriver 경로 (없으면 CHROMEDRIVER_PATH 환경 변수)
+        cache_file: 경로/버전 캐시 파일
+        debug: 디버깅 모드 (어떤 경로를 선택했는지 출력)
+
+    Returns:
+        chromedriver 실행 파일 경로
+    """
+    configured_path = configured_path or os.getenv('CHROMEDRIVER_PATH')
+    if configured_path and os.path.exists(configured_path):
+        if debug:
+            print(f"  [디버깅] 지정된 ChromeDriver 사용: {configured_path}")
+        return configured_path
+
+    chrome_major = _major(detect_chrome_version())
+
+    # 캐시된 드라이버: Chrome 메이저 버전이 바뀌지 않았으면 그대로 사용
+    cache = _load_cache(cache_file)
+    cached_path = cache.get('path')
+    if cached_path and os.path.exists(cached_path):
+        if chrome_major is None or cache.get('chrome_major') == chrome_major:
+            if debug:
+                print(f"  [디버깅] 캐시된 ChromeDriver 사용: {cached_path} ({cache.get('version')})")
+            return cached_path
+
+    # PATH의 chromedriver: 버전이 맞으면 사용
+    local_path = shutil.which('chromedriver')
+    if local_path:
+        local_version = driver_version(local_path)
+        if chrome_major is None or _major(local_version) == chrome_major:
+            _save_cache(cache_file, local_path, local_version, chrome_major)
+            if debug:
+                print(f"  [디버깅] PATH의 ChromeDriver 사용: {local_path} ({local_version})")
+            return local_path
+
+    # Chrome 버전이 바뀌었거나 처음 실행: 네트워크로 내려받기
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        if cached_path and os.path.exists(cached_path):
+            print(f"  ⚠ ChromeDriver를 내려받을 수 없어 캐시된 드라이버를 사용합니다: {e}")
+            return cached_path
+        if local_path:
+            print(f"  ⚠ ChromeDriver를 내려받을 수 없어 PATH의 드라이버를 사용합니다: {e}")
+            return local_path
+        raise
+    _save_cache(cache_file, driver_path, driver_version(driver_path), chrome_major)
+    if debug:
+        print(f"  [디버깅] ChromeDriver 설치: {driver_path}")
+    return driver_path
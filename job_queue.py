@@ -0,0 +1,286 @@
+"""
+크롤링 작업 큐 모듈 (SQLite)
+
+브랜드의 제품 URL마다 작업 행을 하나씩 두고, 여러 크롤러 프로세스가 같은 큐 파일에서
+작업을 원자적으로 가져간다(임대). 임대한 프로세스는 백그라운드 스레드로 임대 기간을 계속 연장하며,
+프로세스가 죽어 임대가 만료된 작업은 다른 프로세스가 다시 가져간다.
+여러 대의 머신에서 나눠 크롤링할 때는 공유 경로의 큐 파일을 함께 사용한다.
+브랜드의 작업이 모두 끝난(대기/처리 중인 작업이 없는) 큐에 다시 등록하면 완료/실패한 작업을
+대기 상태로 되돌려 새 회차를 시작하며, 진행 중인 회차에 나중에 합류한 프로세스는 작업을 되돌리지 않는다.
+작업은 (브랜드 URL, 제품 URL)로 구분하므로 여러 브랜드에 걸친 제품도 브랜드마다 따로 크롤링된다.
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+JOB_COLUMNS = 'brand_url, product_url, position, product, status, lease_owner, lease_expires, attempts, last_error, updated_at'
+
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        brand_url TEXT NOT NULL,
+        product_url TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        product TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'pending',
+        lease_owner TEXT,
+        lease_expires REAL,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        last_error TEXT,
+        updated_at REAL NOT NULL,
+        PRIMARY KEY (brand_url, product_url)
+    )
+"""
+
+
+class CrawlJobQueue:
+    """제품 URL 단위 크롤링 작업 큐 (pending → leased → done / failed)"""
+
+    def __init__(self, db_path: str = 'crawl_jobs.db', lease_seconds: float = 600, max_attempts: int = 3, owner: Optional[str] = None):
+        """
+        작업 큐 초기화
+
+        Args:
+            db_path: 큐 SQLite 파일 경로
+            lease_seconds: 임대 기간 (초, 이 시간 동안 연장이 없으면 다른 프로세스가 다시 가져감)
+            max_attempts: 최대 시도 횟수 (넘으면 failed)
+            owner: 임대자 이름 (기본값: 호스트명:PID)
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.stats = {'claimed': 0, 'done': 0, 'failed': 0, 'requeued': 0, 'restarted': 0, 'lost': 0}
+        self._heartbeat_stop: Optional[threading.Event] = None
+        self._heartbeat: Optional[threading.Thread] = None
+        self.conn = self._connect()
+        self.conn.execute(CREATE_TABLE_SQL.format(table='crawl_jobs'))
+        self._migrate_brand_key()
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_crawl_jobs_claim ON crawl_jobs (brand_url, status, position)")
+
+    def _migrate_brand_key(self):
+        """제품 URL만 기본 키로 쓰던 이전 큐 파일을 (브랜드 URL, 제품 URL) 기본 키로 다시 만듦"""
+        key_columns = [row[1] for row in self.conn.execute("PRAGMA table_info(crawl_jobs)") if row[5]]
+        if key_columns != ['product_url']:
+            return
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(CREATE_TABLE_SQL.format(table='crawl_jobs_new'))
+            self.conn.execute(f"INSERT INTO crawl_jobs_new ({JOB_COLUMNS}) SELECT {JOB_COLUMNS} FROM crawl_jobs")
+            self.conn.execute("DROP TABLE crawl_jobs")
+            self.conn.execute("ALTER TABLE crawl_jobs_new RENAME TO crawl_jobs")
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        print(f"  → 작업 큐 {self.db_path}를 브랜드별 작업 구분 형식으로 변환")
+
+    def _connect(self) -> sqlite3.Connection:
+        """자동 커밋 연결 (트랜잭션은 BEGIN IMMEDIATE로 직접 시작)"""
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None, check_same_thread=False)
+
+    def enqueue(self, brand_url: str, products: List[Dict]) -> int:
+        """
+        제품 목록을 작업으로 등록
+
+        브랜드에 이미 있는 URL은 목록 순서와 제품 정보만 갱신한다. 브랜드에 대기/처리 중인 작업이 없으면
+        (지난 회차가 끝났으면) 완료/실패한 작업을 대기 상태로 되돌려 새 회차를 시작한다
+        (되돌린 작업 수는 stats['restarted']).
+
+        Args:
+            brand_url: 브랜드 페이지 URL
+            products: get_brand_products가 반환한 제품 딕셔너리 리스트 (목록 순서)
+
+        Returns:
+            새로 등록된 작업 수
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._requeue_expired(brand_url, now)
+            active = self.conn.execute(
+                "SELECT COUNT(*) FROM crawl_jobs WHERE brand_url = ? AND status IN ('pending', 'leased')", (brand_url,)
+            ).fetchone()[0]
+            restarted = 0
+            if not active:
+                restarted = self.conn.execute(
+                    "UPDATE crawl_jobs SET status = 'pending', attempts = 0, last_error = NULL, updated_at = ? "
+                    "WHERE brand_url = ? AND status IN ('done', 'failed')",
+                    (now, brand_url)
+                ).rowcount
+            count_sql = "SELECT COUNT(*) FROM crawl_jobs WHERE brand_url = ?"
+            existing = self.conn.execute(count_sql, (brand_url,)).fetchone()[0]
+            self.conn.executemany(
+                "INSERT INTO crawl_jobs (brand_url, product_url, position, product, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (brand_url, product_url) DO UPDATE SET position = excluded.position, product = excluded.product",
+                [(brand_url, product['product_url'], idx, json.dumps(product, ensure_ascii=False), now)
+                 for idx, product in enumerate(products, 1) if product.get('product_url')]
+            )
+            added = self.conn.execute(count_sql, (brand_url,)).fetchone()[0] - existing
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.stats['restarted'] += restarted
+        return added
+
+    def claim(self, brand_url: str) -> Optional[Dict]:
+        """
+        다음 작업 임대 (만료된 임대는 먼저 pending으로 되돌림)
+
+        Args:
+            brand_url: 브랜드 페이지 URL
+
+        Returns:
+            {'product_url', 'position', 'product', 'attempts'} (남은 작업이 없으면 None)
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._requeue_expired(brand_url, now)
+            row = self.conn.execute(
+                "SELECT product_url, position, product, attempts FROM crawl_jobs "
+                "WHERE brand_url = ? AND status = 'pending' ORDER BY position LIMIT 1",
+                (brand_url,)
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE crawl_jobs SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE brand_url = ? AND product_url = ?",
+                    (self.owner, now + self.lease_seconds, now, brand_url, row[0])
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        self.stats['claimed'] += 1
+        return {'product_url': row[0], 'position': row[1], 'product': json.loads(row[2]), 'attempts': row[3] + 1}
+
+    def _requeue_expired(self, brand_url: str, now: float):
+        """임대 기간이 지난 작업을 pending으로 되돌림 (시도 횟수를 다 쓴 작업은 failed)"""
+        cursor = self.conn.execute(
+            "UPDATE crawl_jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "lease_owner = NULL, lease_expires = NULL, "
+            "last_error = COALESCE(last_error, '임대 만료 (' || lease_owner || ')'), updated_at = ? "
+            "WHERE brand_url = ? AND status = 'leased' AND lease_expires < ?",
+            (self.max_attempts, now, brand_url, now)
+        )
+        if cursor.rowcount > 0:
+            self.stats['requeued'] += cursor.rowcount
+            print(f"  → 임대가 만료된 작업 {cursor.rowcount}개 회수 (시도 횟수가 남은 작업은 다시 대기)")
+
+    def renew(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """이 임대자가 가진 모든 임대 연장 (연장된 작업 수 반환)"""
+        now = time.time()
+        cursor = (conn or self.conn).execute(
+            "UPDATE crawl_jobs SET lease_expires = ?, updated_at = ? WHERE lease_owner = ? AND status = 'leased'",
+            (now + self.lease_seconds, now, self.owner)
+        )
+        return cursor.rowcount
+
+    def complete(self, brand_url: str, product_url: str) -> bool:
+        """
+        작업 완료 기록
+
+        임대가 만료되어 다른 프로세스가 작업을 가져갔으면 완료로 기록하지 않고 stats['lost']로 집계한다.
+
+        Returns:
+            완료로 기록했으면 True
+        """
+        cursor = self.conn.execute(
+            "UPDATE crawl_jobs SET status = 'done', lease_owner = NULL, lease_expires = NULL, last_error = NULL, updated_at = ? "
+            "WHERE brand_url = ? AND product_url = ? AND status = 'leased' AND lease_owner = ?",
+            (time.time(), brand_url, product_url, self.owner)
+        )
+        if cursor.rowcount == 0:
+            self._lost(product_url)
+            return False
+        self.stats['done'] += 1
+        return True
+
+    def fail(self, brand_url: str, product_url: str, error: str):
+        """작업 실패 기록 (시도 횟수가 남았으면 pending으로 되돌림)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute(
+                "SELECT attempts FROM crawl_jobs "
+                "WHERE brand_url = ? AND product_url = ? AND status = 'leased' AND lease_owner = ?",
+                (brand_url, product_url, self.owner)
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    "UPDATE crawl_jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                    "lease_owner = NULL, lease_expires = NULL, last_error = ?, updated_at = ? "
+                    "WHERE brand_url = ? AND product_url = ?",
+                    (self.max_attempts, error[:1000], time.time(), brand_url, product_url)
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        if row is None:
+            self._lost(product_url)
+        elif row[0] >= self.max_attempts:
+            self.stats['failed'] += 1
+        else:
+            self.stats['requeued'] += 1
+
+    def _lost(self, product_url: str):
+        """임대를 잃은 작업 집계 (임대 만료 후 다른 프로세스가 가져간 작업)"""
+        self.stats['lost'] += 1
+        print(f"  ⚠ 작업 임대를 잃어 결과를 기록하지 못함 (다른 프로세스가 다시 가져감): {product_url}")
+
+    def start_heartbeat(self):
+        """임대 연장 스레드 시작 (임대 기간의 1/3마다 연장, 연결은 스레드 전용)"""
+        if self._heartbeat is not None:
+            return
+        self._heartbeat_stop = threading.Event()
+
+        def run(stop: threading.Event):
+            conn = self._connect()
+            try:
+                while not stop.wait(self.lease_seconds / 3):
+                    try:
+                        self.renew(conn)
+                    except sqlite3.Error as e:
+                        print(f"  ⚠ 작업 임대 연장 실패: {e}")
+            finally:
+                conn.close()
+
+        self._heartbeat = threading.Thread(target=run, args=(self._heartbeat_stop,), name='job-lease-heartbeat', daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        """임대 연장 스레드 종료"""
+        if self._heartbeat is None:
+            return
+        self._heartbeat_stop.set()
+        self._heartbeat.join()
+        self._heartbeat = None
+
+    def counts(self, brand_url: str) -> Dict[str, int]:
+        """상태별 작업 수"""
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM crawl_jobs WHERE brand_url = ? GROUP BY status", (brand_url,)
+        ).fetchall()
+        return dict(rows)
+
+    def print_stats(self, brand_url: str, title: Optional[str] = None):
+        """이 프로세스의 처리 통계와 큐 전체 상태 출력"""
+        counts = self.counts(brand_url)
+        print(f"\n[작업 큐 통계]{f' {title}' if title else ''} ({self.owner})")
+        print(f"  - 이번 프로세스: 임대 {self.stats['claimed']}건, 완료 {self.stats['done']}건, "
+              f"실패 {self.stats['failed']}건, 재시도 대기 {self.stats['requeued']}건, "
+              f"새 회차로 되돌림 {self.stats['restarted']}건, 임대 잃음 {self.stats['lost']}건")
+        print(f"  - 큐 전체: 대기 {counts.get('pending', 0)}건, 처리 중 {counts.get('leased', 0)}건, "
+              f"완료 {counts.get('done', 0)}건, 실패 {counts.get('failed', 0)}건")
+
+    def close(self):
+        self.stop_heartbeat()
+        self.conn.close()
@@ -4,15 +4,19 @@
 import argparse
 import json
 import os
+import tempfile
 import time
 from crawler import AmoreMallCrawler
 from summarizer import ReviewSummarizer
 from database import DatabaseManager
+from result_writer import BrandJsonOutput, ResultWriter, write_reviews_json
+from crawl_scheduler import parse_deadline
+from job_queue import CrawlJobQueue
 
 
 def main():
     parser = argparse.ArgumentParser(description='아모레몰 제품 후기 크롤링 및 요약')
-    parser.add_argument('url', help='제품 페이지 URL 또는 브랜드 페이지 URL')
+    parser.add_argument('url', nargs='?', help='제품 페이지 URL 또는 브랜드 페이지 URL (--migrate-db에서는 생략)')
     parser.add_argument('--max-pages', type=int, default=10, help='최대 페이지 수 (기본값: 10, 0이면 모든 페이지)')
     parser.add_argument('--max-reviews', type=int, help='최대 리뷰 수 (지정하지 않으면 제한 없음)')
     parser.add_argument('--brand', action='store_true', help='브랜드 페이지 모드 (모든 제품 크롤링)')
@@ -23,16 +27,78 @@ def main():
     parser.add_argument('--output', help='결과를 JSON 파일로 저장할 경로')
     parser.add_argument('--debug', action='store_true', help='디버깅 모드 (HTML 저장 등)')
     parser.add_argument('--test', action='store_true', help='테스트 모드 (더 보기 버튼 3번만 클릭)')
-    parser.add_argument('--max-more-clicks', type=int, help='더 보기 버튼 최대 클릭 횟수 (지정하지 않으면 test_mode에 따라 자동 설정)')
+    parser.add_argument('--max-more-clicks', type=int, help='더 보기 버튼 최대 클릭 횟수 (지정하지 않으면 전체 리뷰 수로 계산, 리뷰 수를 모르면 test_mode에 따라 자동 설정)')
+    parser.add_argument('--full-reparse', action='store_true', help='더 보기 클릭마다 페이지 전체를 다시 파싱 (기본값: 새 리뷰 카드만 증분 파싱)')
+    parser.add_argument('--review-backend', choices=['html', 'js', 'network'], default='html', help='리뷰 추출 방식 (html: BeautifulSoup 파싱, js: 브라우저에서 JSON 추출, network: 리뷰 API 응답 캡처)')
+    parser.add_argument('--workers', type=int, default=1, help='브랜드 모드에서 병렬로 띄울 Chrome 워커 수 (기본값: 1)')
+    parser.add_argument('--http-reviews', action='store_true', help='브랜드 모드에서 리뷰 API를 찾은 뒤부터 브라우저 없이 HTTP로 리뷰 수집 (--review-backend network 자동 적용)')
+    parser.add_argument('--browser-profile', choices=['full', 'light'], default='full', help='브라우저 프로필 (light: 이미지/폰트/미디어/트래커 차단, eager 로딩)')
+    parser.add_argument('--allow-url', action='append', default=[], help='light 프로필에서 차단하지 않을 URL 패턴 문자열 (여러 번 지정 가능)')
+    parser.add_argument('--chromedriver', help='chromedriver 경로 (지정하지 않으면 캐시/PATH/자동 다운로드 순서로 결정)')
+    parser.add_argument('--notice-cache', help="상품정보제공 고시 캐시 파일 경로 (지정하면 유효 기간 안의 제품은 고시를 다시 열지 않음, 예: notice_cache.db)")
+    parser.add_argument('--notice-ttl-days', type=float, default=30, help='고시 캐시 유효 기간 (일, 기본값: 30)')
+    parser.add_argument('--refresh-notice', action='store_true', help='고시 캐시를 무시하고 다시 수집')
+    parser.add_argument('--selector-cache', default='selector_cache.json', help="성공한 셀렉터 통계 파일 경로 ('none'이면 저장 안 함)")
+    parser.add_argument('--popup-mode', choices=['script', 'sweep'], default='sweep', help='팝업 처리 방식 (script: 주입한 스크립트가 자동으로 닫음, sweep: 페이지 이동마다 셀렉터로 검색)')
+    parser.add_argument('--http-concurrency', type=int, default=8, help='HTTP 리뷰 수집 동시 요청 수 (기본값: 8)')
+    parser.add_argument('--parse-workers', type=int, default=0, help='리뷰 카드 파싱 프로세스 수 (기본값: 0, 브라우저와 같은 프로세스에서 파싱)')
+    parser.add_argument('--incremental', action='store_true', help='증분 재크롤링 (리뷰를 최신순으로 보다가 --db-path에 이미 저장된 리뷰를 만나면 중단, 브랜드 모드 재개 기능은 끔)')
+    parser.add_argument('--skip-unchanged', action='store_true', help='브랜드 모드에서 목록의 리뷰 수가 지난 크롤링과 같은 제품은 가격/평점만 갱신 (재개 기능은 끔)')
+    parser.add_argument('--review-coverage', type=float, default=1.0, help='전체 리뷰 수 중 수집할 비율 (0~1, 전체 리뷰 수와 페이지 크기로 더 보기 클릭 횟수 계산, 기본값: 1.0)')
+    parser.add_argument('--time-budget', type=float, help='브랜드 모드 전체 시간 예산 (초, 제품별 리뷰 수 비율로 배분)')
+    parser.add_argument('--deadline', type=parse_deadline, help="브랜드 모드 마감 시각 ('HH:MM' 또는 'YYYY-MM-DD HH:MM', 우선순위 순서로 크롤링하고 마감에 맞춰 중단)")
+    parser.add_argument('--job-queue', help='브랜드 모드 작업 큐 SQLite 파일 경로 (같은 파일을 쓰는 여러 프로세스가 제품을 나눠 크롤링)')
+    parser.add_argument('--review-checkpoint', help='리뷰 수집 체크포인트 파일 경로 (지정하면 중단된 제품은 다음 실행에서 이어서 수집, 예: review_checkpoint.db)')
+    parser.add_argument('--recycle-after', type=int, help='한 Chrome 세션에서 크롤링할 최대 제품 수 (넘으면 브라우저 재시작)')
+    parser.add_argument('--max-browser-mb', type=float, help='Chrome 프로세스 전체 메모리 한도 (MB, 넘으면 다음 제품 전에 브라우저 재시작, psutil 필요)')
+    parser.add_argument('--prune-reviews', choices=['collapse', 'remove'], help='추출한 리뷰 카드를 화면에서 정리 (collapse: 내용을 비우고 숨김, remove: 요소 제거, 리뷰가 많은 제품의 클릭 지연/메모리 증가 방지)')
+    parser.add_argument('--orm-insert', action='store_true', help='브랜드 모드에서 후기를 대량 insert 대신 ORM 객체로 하나씩 저장')
+    parser.add_argument('--writer-queue', type=int, default=4, help='브랜드 모드에서 DB 저장을 기다릴 수 있는 최대 제품 수 (기본값: 4)')
+    parser.add_argument('--migrate-db', action='store_true', help='크롤링 대신 --db-path의 중복 후기를 정리하고 중복 방지 인덱스 생성 (삭제 전 DB 파일 백업)')
+    parser.add_argument('--dry-run', action='store_true', help='--migrate-db에서 삭제할 후기 수만 출력하고 DB는 바꾸지 않음')
     
     args = parser.parse_args()
     
+    if args.migrate_db:
+        db = DatabaseManager(db_path=args.db_path)
+        try:
+            db.migrate_review_fingerprints(dry_run=args.dry_run)
+        finally:
+            db.close()
+        return
+    if not args.url:
+        parser.error('제품 페이지 URL 또는 브랜드 페이지 URL을 지정하세요.')
+    
+    if args.http_reviews:
+        # 리뷰 API URL은 네트워크 캡처로 찾아야 함
+        args.review_backend = 'network'
+    
     print("=" * 60)
     print("아모레몰 제품 후기 크롤링 시작")
     print("=" * 60)
     
     # 크롤러 초기화
-    crawler = AmoreMallCrawler(headless=args.headless, debug=args.debug)
+    crawler = AmoreMallCrawler(
+        headless=args.headless,
+        debug=args.debug,
+        incremental_parse=not args.full_reparse,
+        review_backend=args.review_backend,
+        browser_profile=args.browser_profile,
+        allow_urls=args.allow_url,
+        driver_path=args.chromedriver,
+        notice_cache_path=args.notice_cache,
+        notice_ttl_days=args.notice_ttl_days,
+        refresh_notice=args.refresh_notice,
+        selector_cache_path=None if args.selector_cache == 'none' else args.selector_cache,
+        popup_mode=args.popup_mode,
+        parse_workers=args.parse_workers,
+        incremental_db_path=args.db_path if args.incremental else None,
+        review_coverage=args.review_coverage,
+        review_checkpoint_path=args.review_checkpoint,
+        recycle_after=args.recycle_after,
+        max_browser_mb=args.max_browser_mb,
+        review_dom_prune=args.prune_reviews
+    )
     db = DatabaseManager(db_path=args.db_path)
     summarizer = ReviewSummarizer(use_openai=args.use_openai)
     
@@ -41,170 +107,134 @@ def main():
             # 브랜드 페이지 모드: 모든 제품 크롤링
             print("\n[브랜드 모드] 브랜드의 모든 제품 리뷰 크롤링 중...")
             max_pages = None if args.max_pages == 0 else args.max_pages
-            results, brand_name = crawler.crawl_brand_products(
-                args.url,
-                max_products=args.max_products,
-                max_pages_per_product=max_pages,
-                max_reviews_per_product=args.max_reviews,
-                test_mode=args.test,
-                max_more_clicks=args.max_more_clicks
-            )
+            # 제품 크롤링이 끝나는 대로 저장 스레드(DB 저장, 요약)와 JSON 출력으로 넘기고 결과는 보관하지 않음
+            writer = ResultWriter(db_path=args.db_path, use_openai=args.use_openai, max_pending=args.writer_queue,
+                                  bulk_insert=not args.orm_insert)
+            job_queue = CrawlJobQueue(args.job_queue) if args.job_queue else None
+            json_output = None
+            product_count = 0
+            total_reviews = 0
             
-            if not results:
+            def get_json_output() -> BrandJsonOutput:
+                # 브랜드명은 첫 결과(또는 첫 후기 묶음) 전에 crawler.brand_name에 기록됨
+                nonlocal json_output
+                if json_output is None:
+                    # 파일명 기본값 생성 (브랜드명 사용)
+                    if args.output:
+                        # 출력 파일명에서 브랜드명 추출 (예: "20251227_sulwhasoo" -> "sulwhasoo")
+                        base_name = args.output.replace('.json', '').split('_')[-1] if '_' in args.output else args.output.replace('.json', '')
+                    else:
+                        # 크롤러에서 추출한 브랜드명 사용
+                        base_name = crawler.brand_name if crawler.brand_name else f"brand_{time.strftime('%Y%m%d')}"
+                    if job_queue is not None:
+                        # 같은 브랜드를 여러 프로세스가 나눠 크롤링하므로 JSON 파일은 프로세스별로 분리
+                        base_name = f"{base_name}_{job_queue.owner.replace(':', '_')}"
+                    json_output = BrandJsonOutput(args.url, base_name)
+                return json_output
+            
+            def save_review_batch(partial):
+                # 페이지마다 받은 후기 묶음을 JSON 임시 파일과 저장 스레드로 바로 넘김 (제품의 후기를 모으지 않음)
+                get_json_output().add(partial)
+                writer.submit(partial)
+            
+            try:
+                for result in crawler.iter_brand_products(
+                    args.url,
+                    max_products=args.max_products,
+                    max_pages_per_product=max_pages,
+                    max_reviews_per_product=args.max_reviews,
+                    test_mode=args.test,
+                    max_more_clicks=args.max_more_clicks,
+                    resume=not (args.incremental or args.skip_unchanged or args.deadline is not None),
+                    workers=args.workers,
+                    http_reviews=args.http_reviews,
+                    http_concurrency=args.http_concurrency,
+                    skip_unchanged=args.skip_unchanged,
+                    time_budget=args.time_budget,
+                    deadline=args.deadline,
+                    job_queue=job_queue,
+                    review_sink=save_review_batch
+                ):
+                    get_json_output().add(result)
+                    writer.submit(result)
+                    product_count += 1
+                    total_reviews += result['total_reviews']
+            finally:
+                writer.close()
+                if job_queue is not None:
+                    job_queue.close()
+                if json_output is not None:
+                    json_output.close()
+            
+            if not product_count:
                 print("오류: 제품을 찾을 수 없거나 크롤링에 실패했습니다.")
                 return
             
-            # 모든 제품의 결과를 저장
-            all_reviews_data = []
-            total_reviews = 0
-            
-            for result in results:
-                product_info = result['product_info']
-                reviews = result['reviews']
-                total_reviews += len(reviews)
-                
-                if reviews:
-                    # 데이터베이스에 저장
-                    product = db.add_product(product_info)
-                    db.add_reviews(product.id, reviews)
-                    
-                    # 요약 생성
-                    summary_data = summarizer.summarize_reviews(
-                        reviews,
-                        product_info.get('product_name', '')
-                    )
-                    db.add_summary(product.id, summary_data)
-                    
-                    all_reviews_data.append({
-                        'product_info': product_info,
-                        'reviews': reviews,
-                        'summary': summary_data
-                    })
-            
             print(f"\n{'='*60}")
             print(f"브랜드 크롤링 완료")
             print(f"{'='*60}")
-            print(f"총 제품 수: {len(results)}개")
+            print(f"총 제품 수: {product_count}개")
             print(f"총 후기 수: {total_reviews}개")
             
-            # 파일명 기본값 생성 (브랜드명 사용)
-            if args.output:
-                # 출력 파일명에서 브랜드명 추출 (예: "20251227_sulwhasoo" -> "sulwhasoo")
-                base_name = args.output.replace('.json', '').split('_')[-1] if '_' in args.output else args.output.replace('.json', '')
-            else:
-                # 크롤러에서 추출한 브랜드명 사용
-                base_name = brand_name if brand_name else f"brand_{time.strftime('%Y%m%d')}"
-            
-            # 제품 정보만 저장 (기존 데이터와 병합)
-            info_file = f"info_{base_name}.json"
-            existing_products = {}
-            if os.path.exists(info_file):
-                try:
-                    with open(info_file, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                        for product in existing_data.get('products', []):
-                            if product.get('product_code'):
-                                existing_products[product['product_code']] = product
-                    if existing_products:
-                        print(f"  ✓ 기존 제품 정보 {len(existing_products)}개 로드됨")
-                except:
-                    pass
-            
-            # 새로 크롤링한 제품 정보 추가/업데이트
-            for result in results:
-                product_info = result['product_info']
-                product_code = product_info.get('product_code')
-                if product_code:
-                    existing_products[product_code] = product_info
-            
-            all_products_info = list(existing_products.values())
-            
-            info_data = {
-                'brand_url': args.url,
-                'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_products': len(all_products_info),
-                'products': all_products_info
-            }
-            
-            with open(info_file, 'w', encoding='utf-8') as f:
-                json.dump(info_data, f, ensure_ascii=False, indent=2)
-            
-            # 리뷰만 저장 (기존 데이터와 병합)
-            review_file = f"review_{base_name}.json"
-            existing_reviews = []
-            if os.path.exists(review_file):
-                try:
-                    with open(review_file, 'r', encoding='utf-8') as f:
-                        existing_data = json.load(f)
-                        existing_reviews = existing_data.get('reviews', [])
-                    if existing_reviews:
-                        print(f"  ✓ 기존 리뷰 {len(existing_reviews)}개 로드됨")
-                except:
-                    pass
-            
-            # 새로 크롤링한 리뷰 추가
-            for result in results:
-                product_info = result['product_info']
-                reviews = result['reviews']
-                for review in reviews:
-                    # 각 리뷰에 제품 코드 추가 (참조용)
-                    review_with_product = review.copy()
-                    review_with_product['product_code'] = product_info.get('product_code', '')
-                    review_with_product['product_name'] = product_info.get('product_name', '')
-                    existing_reviews.append(review_with_product)
-            
-            review_data = {
-                'brand_url': args.url,
-                'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'total_reviews': len(existing_reviews),
-                'reviews': existing_reviews
-            }
-            
-            with open(review_file, 'w', encoding='utf-8') as f:
-                json.dump(review_data, f, ensure_ascii=False, indent=2)
-            
             print(f"\n✓ JSON 파일 저장 완료:")
-            print(f"  - 제품 정보: {info_file}")
-            print(f"    - 총 {len(all_products_info)}개 제품 (신규: {len(results)}개)")
-            print(f"    - 파일 크기: {os.path.getsize(info_file) / 1024 / 1024:.2f} MB")
-            print(f"  - 리뷰: {review_file}")
-            print(f"    - 총 {len(existing_reviews)}개 후기 (신규: {total_reviews}개)")
-            print(f"    - 파일 크기: {os.path.getsize(review_file) / 1024 / 1024:.2f} MB")
+            print(f"  - 제품 정보: {json_output.info_file}")
+            print(f"    - 총 {len(json_output.products)}개 제품 (신규: {product_count}개)")
+            print(f"    - 파일 크기: {os.path.getsize(json_output.info_file) / 1024 / 1024:.2f} MB")
+            print(f"  - 리뷰: {json_output.review_file}")
+            print(f"    - 총 {json_output.total_reviews}개 후기 (신규: {total_reviews}개)")
+            print(f"    - 파일 크기: {os.path.getsize(json_output.review_file) / 1024 / 1024:.2f} MB")
             return
         
         else:
             # 단일 제품 모드
             print("\n[1단계] 제품 후기 크롤링 중...")
             max_pages = None if args.max_pages == 0 else args.max_pages
-            result = crawler.crawl_product_reviews(args.url, max_pages=max_pages, max_reviews=args.max_reviews, test_mode=args.test)
+            
+            # 후기는 페이지마다 DB와 임시 파일에 바로 저장하고 미리보기용 10개만 메모리에 남김
+            preview = []
+            stream = {'product_id': None, 'inserted': 0}
+            review_spool = tempfile.TemporaryFile('w+', encoding='utf-8')
+            
+            def save_review_batch(partial):
+                batch = partial['reviews']
+                if stream['product_id'] is None:
+                    stream['product_id'] = db.add_product(partial['product_info']).id
+                stream['inserted'] += db.add_reviews_bulk(stream['product_id'], batch)
+                preview.extend(batch[:10 - len(preview)])
+                for review in batch:
+                    review_spool.write(json.dumps(review, ensure_ascii=False) + '\n')
+            
+            result = crawler.crawl_product_with_recovery(args.url, max_pages=max_pages, max_reviews=args.max_reviews, test_mode=args.test, review_sink=save_review_batch)
+            crawler.print_stats()
             
             if not result['product_info']:
                 print("오류: 제품 정보를 가져올 수 없습니다.")
                 return
             
             product_info = result['product_info']
-            reviews = result['reviews']
+            total_reviews = result['total_reviews']
             
             print(f"\n✓ 제품명: {product_info.get('product_name', 'N/A')}")
             print(f"✓ 제품 코드: {product_info.get('product_code', 'N/A')}")
-            print(f"✓ 추출된 후기 수: {len(reviews)}")
+            print(f"✓ 추출된 후기 수: {total_reviews}")
             
-            if not reviews:
+            if not total_reviews:
                 print("경고: 후기를 찾을 수 없습니다.")
                 return
             
-            # 2. 데이터베이스에 저장
+            # 2. 데이터베이스에 저장 (후기는 크롤링 중 묶음으로 저장됨, 고시까지 수집한 제품 정보만 갱신)
             print("\n[2단계] 데이터베이스에 저장 중...")
             product = db.add_product(product_info)
             print(f"✓ 제품 저장 완료 (ID: {product.id})")
             
-            db.add_reviews(product.id, reviews)
-            print(f"✓ 후기 저장 완료 ({len(reviews)}개)")
+            inserted = stream['inserted']
+            print(f"✓ 후기 저장 완료 (새 후기 {inserted}개, 이미 저장된 후기 {total_reviews - inserted}개)")
             
-            # 3. 후기 요약
+            # 3. 후기 요약 (저장된 후기로 요약)
             print("\n[3단계] 후기 요약 중...")
             summary_data = summarizer.summarize_reviews(
-                reviews, 
+                [{'rating': review.rating, 'review_text': review.review_text, 'option': review.option}
+                 for review in product.reviews],
                 product_info.get('product_name', '')
             )
             
@@ -217,10 +247,10 @@ def main():
             print("=" * 60)
             
             # 처음 10개 후기 상세 출력
-            display_count = min(10, len(reviews))
-            print(f"\n[총 {len(reviews)}개 후기 중 처음 {display_count}개 미리보기]\n")
+            display_count = len(preview)
+            print(f"\n[총 {total_reviews}개 후기 중 처음 {display_count}개 미리보기]\n")
             
-            for i, review in enumerate(reviews[:display_count], 1):
+            for i, review in enumerate(preview, 1):
                 print(f"\n{'─' * 60}")
                 print(f"후기 #{i}")
                 print(f"{'─' * 60}")
@@ -259,8 +289,8 @@ def main():
                 else:
                     print(f"   {review_text}")
             
-            if len(reviews) > display_count:
-                print(f"\n... 외 {len(reviews) - display_count}개의 후기가 더 있습니다.")
+            if total_reviews > display_count:
+                print(f"\n... 외 {total_reviews - display_count}개의 후기가 더 있습니다.")
             
             # 5. 요약 결과 출력
             print("\n" + "=" * 60)
@@ -317,7 +347,7 @@ def main():
                     'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S')
                 },
                 'statistics': {
-                    'total_reviews': len(reviews),
+                    'total_reviews': total_reviews,
                     'average_rating': summary_data.get('average_rating', 0),
                     'positive_count': summary_data.get('positive_count', 0),
                     'negative_count': summary_data.get('negative_count', 0)
@@ -331,39 +361,39 @@ def main():
             with open(info_file, 'w', encoding='utf-8') as f:
                 json.dump(info_data, f, ensure_ascii=False, indent=2)
             
-            # 리뷰만 저장
+            # 리뷰만 저장 (임시 파일에서 한 건씩 읽어 씀)
             review_file = f"review_{base_name}.json"
-            reviews_data = []
-            for review in reviews:
-                review_data = {
-                    'product_code': product_code,
-                    'product_name': product_info.get('product_name', ''),
-                    'username': review.get('username', ''),
-                    'user_info': review.get('user_info', ''),
-                    'age': review.get('age', ''),
-                    'gender': review.get('gender', ''),
-                    'skin_type_1': review.get('skin_type_1', ''),
-                    'skin_type_2': review.get('skin_type_2', ''),
-                    'rating': review.get('rating'),
-                    'option': review.get('option', ''),
-                    'review_type': review.get('review_type', ''),
-                    'special_note_1': review.get('special_note_1', ''),
-                    'special_note_2': review.get('special_note_2', ''),
-                    'special_note_3': review.get('special_note_3', ''),
-                    'review_text': review.get('review_text', '')
-                }
-                reviews_data.append(review_data)
             
-            review_output = {
+            def iter_review_data():
+                review_spool.seek(0)
+                for line in review_spool:
+                    review = json.loads(line)
+                    yield {
+                        'product_code': product_code,
+                        'product_name': product_info.get('product_name', ''),
+                        'username': review.get('username', ''),
+                        'user_info': review.get('user_info', ''),
+                        'age': review.get('age', ''),
+                        'gender': review.get('gender', ''),
+                        'skin_type_1': review.get('skin_type_1', ''),
+                        'skin_type_2': review.get('skin_type_2', ''),
+                        'rating': review.get('rating'),
+                        'option': review.get('option', ''),
+                        'review_type': review.get('review_type', ''),
+                        'special_note_1': review.get('special_note_1', ''),
+                        'special_note_2': review.get('special_note_2', ''),
+                        'special_note_3': review.get('special_note_3', ''),
+                        'review_text': review.get('review_text', '')
+                    }
+            
+            review_header = {
                 'product_code': product_code,
                 'product_name': product_info.get('product_name', ''),
-                'total_reviews': len(reviews),
-                'reviews': reviews_data,
+                'total_reviews': total_reviews,
                 'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S')
             }
-            
-            with open(review_file, 'w', encoding='utf-8') as f:
-                json.dump(review_output, f, ensure_ascii=False, indent=2)
+            write_reviews_json(review_file, review_header, iter_review_data())
+            review_spool.close()
             
             print("\n" + "=" * 60)
             print("JSON 파일 저장 완료")
@@ -371,7 +401,7 @@ def main():
             print(f"📁 제품 정보: {info_file}")
             print(f"   - 파일 크기: {os.path.getsize(info_file) / 1024:.2f} KB")
             print(f"📁 리뷰: {review_file}")
-            print(f"   - 총 {len(reviews)}개 후기")
+            print(f"   - 총 {total_reviews}개 후기")
             print(f"   - 파일 크기: {os.path.getsize(review_file) / 1024:.2f} KB")
             print("=" * 60)
             print("완료!")
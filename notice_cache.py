@@ -0,0 +1,89 @@
+"""
+상품정보제공 고시 캐시 모듈
+
+성분, 사용 방법, 주의사항은 거의 바뀌지 않으므로 product_code별로 SQLite 파일에 저장해 두고
+TTL 안의 제품은 재크롤링 시 고시 열기 단계를 건너뛴다.
+여러 워커 프로세스가 같은 파일을 함께 사용할 수 있다.
+"""
+import sqlite3
+import time
+from typing import Dict, Optional
+
+
+NOTICE_FIELDS = ['usage_method', 'ingredients', 'precautions']
+
+
+class NoticeCache:
+    """product_code → 고시 정보 캐시 (SQLite)"""
+
+    def __init__(self, db_path: str = 'notice_cache.db', ttl_days: float = 30):
+        """
+        고시 캐시 초기화
+
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+            ttl_days: 캐시 유효 기간 (일)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.stats = {'hits': 0, 'misses': 0, 'stale': 0, 'writes': 0}
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS notice_cache (
+                product_code TEXT PRIMARY KEY,
+                usage_method TEXT,
+                ingredients TEXT,
+                precautions TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, product_code: str) -> Optional[Dict]:
+        """
+        최신 캐시 조회
+
+        Args:
+            product_code: 제품 코드
+
+        Returns:
+            {'usage_method', 'ingredients', 'precautions'} 딕셔너리 (없거나 TTL이 지났으면 None)
+        """
+        if not product_code:
+            return None
+        row = self.conn.execute(
+            "SELECT usage_method, ingredients, precautions, updated_at FROM notice_cache WHERE product_code = ?",
+            (product_code,)
+        ).fetchone()
+        if row is None:
+            self.stats['misses'] += 1
+            return None
+        if time.time() - row[3] > self.ttl_seconds:
+            self.stats['stale'] += 1
+            return None
+        self.stats['hits'] += 1
+        return dict(zip(NOTICE_FIELDS, (value or '' for value in row[:3])))
+
+    def put(self, product_code: str, notice_info: Dict):
+        """고시 정보 저장 (아무 항목도 찾지 못했으면 다음 실행에서 다시 시도하도록 저장하지 않음)"""
+        if not product_code or not any(notice_info.get(field) for field in NOTICE_FIELDS):
+            return
+        self.conn.execute(
+            "INSERT OR REPLACE INTO notice_cache (product_code, usage_method, ingredients, precautions, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (product_code, *(notice_info.get(field, '') for field in NOTICE_FIELDS), time.time())
+        )
+        self.conn.commit()
+        self.stats['writes'] += 1
+
+    def print_stats(self, title: Optional[str] = None):
+        """캐시 적중 통계 출력"""
+        lookups = self.stats['hits'] + self.stats['misses'] + self.stats['stale']
+        if not lookups:
+            return
+        print(f"\n[고시 캐시 통계]{f' {title}' if title else ''}")
+        print(f"  - 적중 {self.stats['hits']}회, 없음 {self.stats['misses']}회, 만료 {self.stats['stale']}회 "
+              f"(적중률 {self.stats['hits'] / lookups * 100:.0f}%), 저장 {self.stats['writes']}회")
+
+    def close(self):
+        self.conn.close()
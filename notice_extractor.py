@@ -0,0 +1,147 @@
+"""
+상품정보제공 고시 파싱 모듈
+
+고시 DOM을 한 번만 순회하면서 라벨 후보(dt, th, 제목 태그)의 라벨/값 쌍을
+성분, 사용 방법, 주의사항으로 분류한다. 같은 순회에서 사용 방법/주의사항 키워드가 들어 있는
+텍스트도 기억해 두었다가, 라벨 태그가 없는 고시에서는 키워드 뒤의 텍스트를 값으로 사용한다.
+get_product_info와 _get_product_info_from_notice가 같은 함수를 사용한다.
+"""
+import re
+from typing import Dict, Optional
+
+from bs4 import Comment, NavigableString
+
+
+# 필드별 라벨 매칭 패턴 (앞쪽 필드가 우선)
+FIELD_PATTERNS = [
+    ('ingredients', re.compile(r'화장품법.*성분|전성분|성분명|^성분|ingredient', re.I)),
+    ('usage_method', re.compile(r'사용\s*방법|사용법|용법|how to use', re.I)),
+    ('precautions', re.compile(r'주의\s*사항|주의|경고|precaution', re.I)),
+]
+FIELD_NAMES = [name for name, _ in FIELD_PATTERNS]
+
+# 값으로 인정할 최소 길이 / 저장할 최대 길이
+MIN_LENGTH = {'ingredients': 20, 'usage_method': 10, 'precautions': 10}
+MAX_LENGTH = {'ingredients': 2000, 'usage_method': 1000, 'precautions': 1000}
+
+# 라벨 후보 태그 (이보다 긴 텍스트는 라벨이 아니라 본문으로 간주)
+LABEL_TAGS = ['dt', 'th', 'h2', 'h3', 'h4', 'h5', 'strong']
+LABEL_MAX_LENGTH = 60
+
+# 라벨 태그가 없을 때 본문 텍스트에서 찾을 키워드 (사용 방법, 주의사항)
+TEXT_KEYWORD_PATTERNS = {
+    'usage_method': re.compile(r'사용\s*방법|사용법|How to Use|용법', re.I),
+    'precautions': re.compile(r'사용\s*시\s*주의\s*사항|주의\s*사항|주의|precaution|경고', re.I),
+}
+# 제목 라벨의 부모 다음 형제들에서 성분 본문으로 인정할 최소 길이
+INGREDIENTS_SIBLING_MIN_LENGTH = 50
+
+# 라벨 구조가 없을 때 본문 텍스트에서 성분을 찾는 패턴
+INGREDIENTS_TEXT_PATTERN = re.compile(r'화장품법[^성\n]*성분[^\n]*\n([^\n]{50,})')
+# 성분 앞에 붙는 번호/머리말 ("1. 성분" 등)
+INGREDIENTS_PREFIX_PATTERN = re.compile(r'^\d+\.\s*\w+')
+
+
+def classify_label(label: str) -> Optional[str]:
+    """라벨 텍스트를 필드 이름으로 분류 (해당 없으면 None)"""
+    for name, pattern in FIELD_PATTERNS:
+        if pattern.search(label):
+            return name
+    return None
+
+
+def _label_value(label_element, label_text: str, field: str, separator: str) -> str:
+    """라벨 요소에 대응하는 값 텍스트 찾기"""
+    if label_element.name == 'dt':
+        value_element = label_element.find_next_sibling('dd')
+        return value_element.get_text(separator=separator, strip=True) if value_element else ''
+    if label_element.name == 'th':
+        value_element = label_element.find_next_sibling('td')
+        return value_element.get_text(separator=separator, strip=True) if value_element else ''
+
+    # 제목 태그: 다음 형제 → 부모의 다음 형제들 (빈 칸/짧은 요소는 건너뜀) → 부모 텍스트에서 라벨 뒷부분
+    min_length = INGREDIENTS_SIBLING_MIN_LENGTH if field == 'ingredients' else MIN_LENGTH[field]
+    value_element = label_element.find_next_sibling()
+    if value_element:
+        value = value_element.get_text(separator=separator, strip=True)
+        if len(value) >= MIN_LENGTH[field]:
+            return value
+    parent = label_element.find_parent()
+    if parent is None:
+        return ''
+    for sibling in parent.find_next_siblings():
+        value = sibling.get_text(separator=separator, strip=True)
+        if len(value) >= min_length:
+            return value
+    parent_text = parent.get_text(separator=separator, strip=True)
+    position = parent_text.find(label_text)
+    return parent_text[position + len(label_text):].strip() if position >= 0 else ''
+
+
+def _clean_value(field: str, value: str) -> str:
+    """필드별 정리 (너무 짧으면 빈 문자열)"""
+    value = value.strip()
+    if field == 'ingredients':
+        value = INGREDIENTS_PREFIX_PATTERN.sub('', value).strip()
+    if len(value) < MIN_LENGTH[field]:
+        return ''
+    return value[:MAX_LENGTH[field]].strip()
+
+
+def _text_after_keyword(text_node, pattern) -> str:
+    """키워드가 들어 있는 텍스트의 부모 요소에서 키워드 뒤 첫 줄 추출 (라벨 태그가 없는 고시용)"""
+    parent = text_node.find_parent()
+    if parent is None:
+        return ''
+    parent_text = parent.get_text(separator='\n', strip=True)
+    match = pattern.search(parent_text)
+    if not match:
+        return ''
+    value = re.sub(r'^[:\s]+', '', parent_text[match.end():])
+    return value.split('\n')[0].strip()
+
+
+def extract_notice_fields(soup) -> Dict[str, str]:
+    """
+    고시 DOM에서 성분, 사용 방법, 주의사항 추출 (DOM을 한 번만 순회)
+
+    Args:
+        soup: 고시가 열린 페이지의 BeautifulSoup 객체
+
+    Returns:
+        {'usage_method', 'ingredients', 'precautions'} 딕셔너리 (찾지 못한 항목은 빈 문자열)
+    """
+    fields = {name: '' for name in FIELD_NAMES}
+    keyword_texts = {}  # 필드 -> 키워드가 처음 나온 텍스트 노드 (라벨로 찾지 못했을 때 사용)
+
+    for element in soup.descendants:
+        if isinstance(element, NavigableString):
+            if isinstance(element, Comment) or element.parent is None or element.parent.name in ('script', 'style'):
+                continue
+            for field, pattern in TEXT_KEYWORD_PATTERNS.items():
+                if field not in keyword_texts and pattern.search(element):
+                    keyword_texts[field] = element
+            continue
+        if element.name not in LABEL_TAGS:
+            continue
+        label = element.get_text(' ', strip=True)
+        if not label or len(label) > LABEL_MAX_LENGTH:
+            continue
+        field = classify_label(label)
+        if not field or fields[field]:
+            continue
+        separator = ' ' if field == 'ingredients' else '\n'
+        fields[field] = _clean_value(field, _label_value(element, label, field, separator))
+        if all(fields.values()):
+            break
+
+    for field, text_node in keyword_texts.items():
+        if not fields[field]:
+            fields[field] = _clean_value(field, _text_after_keyword(text_node, TEXT_KEYWORD_PATTERNS[field]))
+
+    if not fields['ingredients']:
+        match = INGREDIENTS_TEXT_PATTERN.search(soup.get_text(separator='\n'))
+        if match:
+            fields['ingredients'] = _clean_value('ingredients', match.group(1))
+
+    return fields
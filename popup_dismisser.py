@@ -0,0 +1,98 @@
+"""
+팝업 자동 닫기 스크립트 (popup_mode='script')
+
+Page.addScriptToEvaluateOnNewDocument로 모든 페이지에 미리 등록해 두면
+팝업이 나타날 때마다 브라우저 안에서 바로 닫으므로, 페이지 이동 후
+Python 쪽에서 셀렉터를 하나씩 찾는 왕복이 필요 없다.
+
+상품정보제공 고시나 리뷰/옵션 레이어를 닫지 않도록 프로모션 팝업 컨테이너(popup/modal)만 대상으로 하며,
+크롤러가 고시와 리뷰 화면을 읽는 동안에는 sessionStorage의 일시 정지 표시를 보고 아무것도 닫지 않는다
+(같은 탭의 페이지 이동 후에도 유지됨).
+"""
+
+POPUP_MODES = ['script', 'sweep']
+
+POPUP_PAUSE_KEY = '__crawlerPopupPaused'
+
+# 팝업 안의 닫기 버튼을 찾아 클릭 (팝업이 새로 추가될 때마다 MutationObserver로 다시 실행)
+POPUP_DISMISS_SCRIPT = r"""
+(function() {
+    if (window.__crawlerPopupDismisser) { return; }
+    window.__crawlerPopupDismisser = true;
+    window.__crawlerPopupsClosed = 0;
+
+    // 프로모션/마케팅 팝업 컨테이너만 대상 (고시, 리뷰, 옵션 레이어는 layer/dialog를 쓰므로 제외)
+    var POPUP_CONTAINER = "[class*='popup'], [class*='modal']";
+    var CLOSE_SELECTORS = [
+        "[class*='btn-close']", "[class*='close']", "[aria-label='닫기']", "[aria-label='close']"
+    ];
+    var CLOSE_TEXTS = ['닫기', '오늘 하루 보지 않기', '오늘하루 보지않기', '다시 보지 않기'];
+
+    function paused() {
+        try {
+            return window.sessionStorage.getItem('%(pause_key)s') === '1';
+        } catch (e) {
+            return false;
+        }
+    }
+
+    function visible(el) {
+        var rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && window.getComputedStyle(el).visibility !== 'hidden';
+    }
+
+    function dismiss() {
+        if (paused()) { return; }
+        var popups = document.querySelectorAll(POPUP_CONTAINER);
+        for (var i = 0; i < popups.length; i++) {
+            var popup = popups[i];
+            if (!visible(popup)) { continue; }
+            var button = null;
+            for (var j = 0; j < CLOSE_SELECTORS.length && !button; j++) {
+                var candidates = popup.querySelectorAll(CLOSE_SELECTORS[j]);
+                for (var k = 0; k < candidates.length; k++) {
+                    if (visible(candidates[k])) { button = candidates[k]; break; }
+                }
+            }
+            if (!button) {
+                var clickables = popup.querySelectorAll('button, a');
+                for (var m = 0; m < clickables.length; m++) {
+                    var text = (clickables[m].textContent || '').trim();
+                    if (CLOSE_TEXTS.indexOf(text) >= 0 && visible(clickables[m])) { button = clickables[m]; break; }
+                }
+            }
+            if (button) {
+                button.click();
+                window.__crawlerPopupsClosed += 1;
+            }
+        }
+    }
+
+    function start() {
+        dismiss();
+        var scheduled = false;
+        new MutationObserver(function() {
+            if (scheduled) { return; }
+            scheduled = true;
+            setTimeout(function() { scheduled = false; dismiss(); }, 100);
+        }).observe(document.documentElement, {childList: true, subtree: true});
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', start);
+    } else {
+        start();
+    }
+})();
+""" % {'pause_key': POPUP_PAUSE_KEY}
+
+# 현재 페이지에서 스크립트가 닫은 팝업 수
+POPUPS_CLOSED_SCRIPT = "return window.__crawlerPopupsClosed || 0;"
+
+# 팝업 닫기 일시 정지/재개 (arguments[0]: True면 정지)
+POPUP_PAUSE_SCRIPT = f"""
+try {{
+    if (arguments[0]) {{ window.sessionStorage.setItem('{POPUP_PAUSE_KEY}', '1'); }}
+    else {{ window.sessionStorage.removeItem('{POPUP_PAUSE_KEY}'); }}
+}} catch (e) {{}}
+"""
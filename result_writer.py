@@ -0,0 +1,291 @@
+"""
+크롤링 결과 저장 단계 (DB 저장 + 요약, 브랜드 모드 JSON 출력)
+
+제품 하나의 크롤링이 끝날 때마다 결과를 제한된 크기의 큐에 넣으면
+별도 스레드가 하나씩 꺼내 DB에 저장하고 요약을 만든다.
+브라우저는 SQLite 커밋이나 요약 생성을 기다리지 않고 다음 제품으로 넘어가며,
+저장이 밀려 큐가 가득 차면 submit이 기다리므로 메모리가 무한정 늘지 않는다.
+크롤러의 review_sink로 받은 페이지 단위 후기 묶음({'partial': True})도 같은 큐로 넘기면
+제품의 후기를 모두 모으지 않고 묶음마다 저장하며, 요약은 제품이 끝난 결과({'streamed': True})에서
+DB에 저장된 후기로 만든다.
+"""
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from review_fingerprint import review_fingerprint
+
+from database import DatabaseManager
+from summarizer import ReviewSummarizer
+
+
+class ResultWriter:
+    """크롤링 결과를 백그라운드 스레드 하나에서 순서대로 저장하는 클래스"""
+
+    def __init__(self, db_path: str = 'amoremall_reviews.db', use_openai: bool = False, max_pending: int = 4, bulk_insert: bool = True):
+        """
+        저장 단계 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+            use_openai: OpenAI API를 사용한 요약 여부
+            max_pending: 저장을 기다릴 수 있는 최대 결과 수 (가득 차면 submit이 기다림)
+            bulk_insert: 후기를 DatabaseManager.add_reviews_bulk로 저장 (False면 ORM 객체로 하나씩 저장)
+        """
+        self.db_path = db_path
+        self.use_openai = use_openai
+        self.bulk_insert = bulk_insert
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self.stats = {'products': 0, 'reviews': 0, 'errors': 0, 'write_time': 0.0, 'blocked_time': 0.0,
+                      'review_insert_time': 0.0, 'duplicates': 0}
+        self._stream_products: Dict[str, int] = {}  # 후기 묶음을 받는 중인 제품 코드 -> 제품 ID (저장 스레드 전용)
+        self._thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, result: Dict):
+        """
+        크롤링 결과를 저장 큐에 넣기 (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            result: crawl_product_reviews 결과 ({'product_info', 'reviews', ...}) 또는 review_sink가 받은 후기 묶음
+        """
+        start = time.monotonic()
+        self.queue.put(result)
+        self.stats['blocked_time'] += time.monotonic() - start
+
+    def _run(self):
+        """저장 스레드: DB 연결은 이 스레드에서만 사용"""
+        db = DatabaseManager(db_path=self.db_path)
+        summarizer = ReviewSummarizer(use_openai=self.use_openai)
+        try:
+            while True:
+                result = self.queue.get()
+                if result is None:
+                    break
+                start = time.monotonic()
+                try:
+                    self._write(db, summarizer, result)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    print(f"  ✗ 저장 오류 ({result['product_info'].get('product_name', '제품명 없음')}): {e}")
+                self.stats['write_time'] += time.monotonic() - start
+        finally:
+            db.close()
+
+    def _write(self, db: DatabaseManager, summarizer: ReviewSummarizer, result: Dict):
+        """제품, 후기, 요약 저장 (후기가 없는 제품은 저장하지 않음)"""
+        product_info = result['product_info']
+        reviews = result['reviews']
+        if result.get('unchanged') and product_info.get('product_code'):
+            # 리뷰 수가 바뀌지 않은 제품: 목록에서 갱신한 제품 정보만 저장
+            db.add_product(product_info)
+            return
+        if result.get('partial'):
+            # 페이지 단위 후기 묶음: 제품 행은 첫 묶음에서 한 번만 만들고 후기만 저장 (요약은 제품이 끝난 뒤)
+            product_id = self._stream_products.get(product_info['product_code'])
+            if product_id is None:
+                product_id = db.add_product(product_info).id
+                self._stream_products[product_info['product_code']] = product_id
+            self._insert_reviews(db, product_id, reviews)
+            return
+        if result.get('streamed'):
+            self._stream_products.pop(product_info.get('product_code'), None)
+            if not result['total_reviews']:
+                return
+            # 후기는 묶음으로 이미 저장했으므로 고시까지 수집한 제품 정보만 갱신
+            product = db.add_product(product_info)
+        else:
+            if not reviews:
+                return
+            product = db.add_product(product_info)
+            self._insert_reviews(db, product.id, reviews)
+        if result.get('streamed') or result.get('incremental'):
+            # 후기를 보관하지 않은 결과와 새 리뷰만 있는 증분 재크롤링 결과는 저장된 전체 리뷰로 요약
+            reviews = [{'rating': review.rating, 'review_text': review.review_text, 'option': review.option}
+                       for review in product.reviews]
+        summary_data = summarizer.summarize_reviews(reviews, product_info.get('product_name', ''))
+        db.add_summary(product.id, summary_data)
+        self.stats['products'] += 1
+
+    def _insert_reviews(self, db: DatabaseManager, product_id: int, reviews: list):
+        """후기 저장 (이미 저장된 후기는 건너뛰고 통계에 집계)"""
+        start = time.monotonic()
+        if self.bulk_insert:
+            inserted = db.add_reviews_bulk(product_id, reviews)
+        else:
+            inserted = len(db.add_reviews(product_id, reviews))
+        self.stats['review_insert_time'] += time.monotonic() - start
+        self.stats['reviews'] += inserted
+        self.stats['duplicates'] += len(reviews) - inserted
+
+    def close(self, title: Optional[str] = None):
+        """남은 결과를 모두 저장한 뒤 스레드 종료 후 통계 출력"""
+        self.queue.put(None)
+        self._thread.join()
+        self.print_stats(title)
+
+    def print_stats(self, title: Optional[str] = None):
+        """저장 통계 출력"""
+        stats = self.stats
+        print(f"\n[저장 단계 통계]{f' {title}' if title else ''}")
+        print(f"  - 제품 {stats['products']}개, 후기 {stats['reviews']}개 저장 (오류 {stats['errors']}건), "
+              f"저장 시간 {stats['write_time']:.1f}초, 큐 대기 {stats['blocked_time']:.1f}초")
+        if stats['duplicates']:
+            print(f"  - 이미 저장되어 있던 후기 {stats['duplicates']}개는 건너뜀")
+        if stats['reviews'] and stats['review_insert_time']:
+            print(f"  - 후기 저장 ({'대량 insert' if self.bulk_insert else 'ORM'}): "
+                  f"{stats['reviews'] / stats['review_insert_time']:.0f}개/초")
+
+
+class BrandJsonOutput:
+    """
+    브랜드 모드 JSON 출력 (info_{이름}.json, review_{이름}.json)
+
+    제품 정보 파일은 제품마다 다시 써서 중단되어도 재개 기능이 완료된 제품을 건너뛸 수 있게 하고,
+    리뷰는 임시 JSONL 파일에 바로 추가한 뒤 close()에서 기존 리뷰 파일과 병합한다.
+    이전 실행이 중단되어 남은 임시 파일이 있으면 그 리뷰도 함께 병합한다.
+    """
+
+    def __init__(self, brand_url: str, base_name: str):
+        """
+        JSON 출력 초기화
+
+        Args:
+            brand_url: 브랜드 페이지 URL
+            base_name: 파일 이름에 사용할 이름 (info_{base_name}.json, review_{base_name}.json)
+        """
+        self.brand_url = brand_url
+        self.info_file = f"info_{base_name}.json"
+        self.review_file = f"review_{base_name}.json"
+        self.spool_file = f"{self.review_file}.partial.jsonl"
+        self.products: Dict[str, Dict] = {}  # product_code -> 제품 정보 (기존 + 신규)
+        self.new_products = 0
+        self.new_reviews = 0
+        self.total_reviews = 0
+
+        if os.path.exists(self.info_file):
+            try:
+                with open(self.info_file, 'r', encoding='utf-8') as f:
+                    for product in json.load(f).get('products', []):
+                        if product.get('product_code'):
+                            self.products[product['product_code']] = product
+                if self.products:
+                    print(f"  ✓ 기존 제품 정보 {len(self.products)}개 로드됨")
+            except (OSError, ValueError):
+                pass
+
+        self.spooled_reviews = 0
+        if os.path.exists(self.spool_file):
+            with open(self.spool_file, 'r', encoding='utf-8') as f:
+                self.spooled_reviews = sum(1 for line in f if line.strip())
+            if self.spooled_reviews:
+                print(f"  ✓ 이전 실행에서 병합되지 않은 리뷰 {self.spooled_reviews}개 발견 ({self.spool_file})")
+        self._spool = open(self.spool_file, 'a', encoding='utf-8')
+
+    def add(self, result: Dict):
+        """
+        제품 하나의 결과 추가 (리뷰는 임시 파일에 추가, 제품 정보 파일은 다시 쓰기)
+
+        Args:
+            result: crawl_product_reviews 결과 ({'product_info', 'reviews', ...}) 또는 review_sink가 받은 후기 묶음
+                    (후기 묶음은 리뷰만 추가하고 제품 정보는 제품이 끝난 결과에서 기록)
+        """
+        product_info = result['product_info']
+        for review in result['reviews']:
+            # 각 리뷰에 제품 코드 추가 (참조용)
+            review_with_product = review.copy()
+            review_with_product['product_code'] = product_info.get('product_code', '')
+            review_with_product['product_name'] = product_info.get('product_name', '')
+            self._spool.write(json.dumps(review_with_product, ensure_ascii=False) + '\n')
+        self._spool.flush()
+        self.spooled_reviews += len(result['reviews'])
+        self.new_reviews += len(result['reviews'])
+        if result.get('partial'):
+            return
+        self.new_products += 1
+
+        if product_info.get('product_code'):
+            # 마감 시각 스케줄러가 경과 시간 우선순위를 계산할 수 있도록 제품별 크롤링 시각 기록
+            self.products[product_info['product_code']] = dict(product_info, crawled_at=time.strftime('%Y-%m-%d %H:%M:%S'))
+        self._write_info()
+
+    def _write_info(self):
+        """제품 정보 파일 쓰기 (임시 파일 후 교체)"""
+        info_data = {
+            'brand_url': self.brand_url,
+            'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'total_products': len(self.products),
+            'products': list(self.products.values())
+        }
+        temp_file = f"{self.info_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(info_data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, self.info_file)
+
+    def close(self):
+        """
+        임시 리뷰 파일을 기존 리뷰 파일과 병합 (리뷰를 한 건씩 써서 새 리뷰를 메모리에 모으지 않음)
+
+        후기를 페이지마다 추가하므로 중단된 제품을 다음 실행에서 다시 크롤링하면 임시 파일에 같은 후기가
+        두 번 들어갈 수 있어, 임시 파일의 후기는 (제품 코드, 리뷰 지문)이 같으면 한 번만 쓴다.
+        """
+        self._spool.close()
+
+        existing_reviews = []
+        if os.path.exists(self.review_file):
+            try:
+                with open(self.review_file, 'r', encoding='utf-8') as f:
+                    existing_reviews = json.load(f).get('reviews', [])
+                if existing_reviews:
+                    print(f"  ✓ 기존 리뷰 {len(existing_reviews)}개 로드됨")
+            except (OSError, ValueError):
+                pass
+        spooled_count = sum(1 for _ in self._iter_spooled())
+        self.total_reviews = len(existing_reviews) + spooled_count
+
+        header = {'brand_url': self.brand_url, 'crawled_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                  'total_reviews': self.total_reviews}
+        write_reviews_json(self.review_file, header, itertools.chain(existing_reviews, self._iter_spooled()))
+        os.remove(self.spool_file)
+
+    def _iter_spooled(self):
+        """임시 리뷰 파일의 리뷰를 한 건씩 읽기 ((제품 코드, 리뷰 지문)이 같은 리뷰는 처음 것만)"""
+        seen = set()
+        with open(self.spool_file, 'r', encoding='utf-8') as spool:
+            for line in spool:
+                if not line.strip():
+                    continue
+                review = json.loads(line)
+                key = (review.get('product_code'), review_fingerprint(review))
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield review
+
+
+def write_reviews_json(path: str, header: Dict, reviews: Iterable[Dict]):
+    """
+    헤더 필드 뒤에 "reviews" 배열이 오는 JSON 파일 쓰기 (리뷰를 한 건씩 써서 메모리에 모으지 않음, 임시 파일 후 교체)
+
+    Args:
+        path: 출력 파일 경로
+        header: "reviews" 앞에 쓸 필드
+        reviews: 리뷰 딕셔너리 (제너레이터 가능)
+    """
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as out:
+        out.write('{\n')
+        for key, value in header.items():
+            out.write(f'  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n')
+        out.write('  "reviews": [')
+        count = 0
+        for review in reviews:
+            out.write(',\n' if count else '\n')
+            out.write('    ' + json.dumps(review, ensure_ascii=False, indent=2).replace('\n', '\n    '))
+            count += 1
+        out.write('\n  ]\n}\n' if count else ']\n}\n')
+    os.replace(temp_file, path)
@@ -0,0 +1,155 @@
+"""
+리뷰 수집 체크포인트 모듈
+
+리뷰가 수천 개인 제품을 수집하다 Chrome이 죽으면 그때까지 모은 리뷰를 모두 잃으므로,
+iter_reviews가 몇 페이지마다 지금까지 모은 리뷰 묶음, "더 보기" 클릭 횟수, 중복 체크용 ID를
+SQLite 파일에 기록한다. 다음 실행에서 같은 제품을 수집하면 저장된 리뷰를 먼저 내보내고
+"더 보기"를 같은 횟수만큼 파싱 없이 클릭한 뒤 이어서 수집한다.
+제품 수집이 정상적으로 끝나면 체크포인트를 지운다.
+
+리뷰 목록은 시간이 지나면 바뀌므로 max_age_hours보다 오래된 체크포인트는 쓰지 않고 지우며,
+정렬 순서나 수집 방식(review_backend)이 저장할 때와 다르면 클릭 위치가 맞지 않으므로 역시 버린다.
+"""
+import json
+import sqlite3
+import time
+from typing import Dict, List, Optional, Set
+
+
+MAX_AGE_HOURS = 24  # 이보다 오래된 체크포인트는 재개하지 않음
+
+
+class ReviewCheckpoint:
+    """제품별 리뷰 수집 진행 상황 저장소 (SQLite)"""
+
+    def __init__(self, db_path: str = 'review_checkpoint.db', max_age_hours: float = MAX_AGE_HOURS):
+        """
+        체크포인트 저장소 초기화
+
+        Args:
+            db_path: 체크포인트 SQLite 파일 경로
+            max_age_hours: 체크포인트 유효 시간 (마지막 저장 이후 이 시간이 지나면 버림)
+        """
+        self.db_path = db_path
+        self.max_age_seconds = max_age_hours * 3600
+        self.stats = {'saves': 0, 'resumed': 0, 'resumed_reviews': 0, 'discarded': 0}
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_checkpoints (
+                checkpoint_key TEXT PRIMARY KEY,
+                clicks INTEGER NOT NULL,
+                page_size INTEGER,
+                review_count INTEGER NOT NULL,
+                seen_ids TEXT NOT NULL,
+                context TEXT,
+                updated_at REAL NOT NULL
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(review_checkpoints)")}
+        if 'context' not in columns:
+            self.conn.execute("ALTER TABLE review_checkpoints ADD COLUMN context TEXT")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS review_checkpoint_batches (
+                checkpoint_key TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                reviews TEXT NOT NULL,
+                PRIMARY KEY (checkpoint_key, seq)
+            )
+        """)
+        self.conn.commit()
+        self._purge_expired()
+
+    def _purge_expired(self):
+        """유효 시간이 지난 체크포인트 삭제"""
+        expired = [key for (key,) in self.conn.execute(
+            "SELECT checkpoint_key FROM review_checkpoints WHERE updated_at < ?", (time.time() - self.max_age_seconds,)
+        ).fetchall()]
+        for checkpoint_key in expired:
+            self.clear(checkpoint_key)
+        if expired:
+            self.stats['discarded'] += len(expired)
+            print(f"  → {self.max_age_seconds / 3600:.0f}시간이 지난 리뷰 체크포인트 {len(expired)}개 삭제")
+
+    def load(self, checkpoint_key: str, context: Optional[str] = None) -> Optional[Dict]:
+        """
+        체크포인트 조회 (유효 시간이 지났거나 수집 조건이 다르면 삭제하고 None 반환)
+
+        Args:
+            checkpoint_key: 제품 식별자 (제품 코드 또는 URL)
+            context: 수집 조건 (정렬 순서, 수집 방식, 저장할 때의 값과 같아야 재개)
+
+        Returns:
+            {'reviews', 'clicks', 'page_size', 'seen_ids'} 딕셔너리 (없으면 None)
+        """
+        row = self.conn.execute(
+            "SELECT clicks, page_size, seen_ids, context, updated_at FROM review_checkpoints WHERE checkpoint_key = ?",
+            (checkpoint_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        age = time.time() - row[4]
+        if age > self.max_age_seconds or row[3] != context:
+            if age > self.max_age_seconds:
+                print(f"  → 리뷰 체크포인트가 {age / 3600:.0f}시간 전 것이라 처음부터 수집합니다.")
+            else:
+                print(f"  → 리뷰 체크포인트의 수집 조건({row[3]})이 현재({context})와 달라 처음부터 수집합니다.")
+            self.clear(checkpoint_key)
+            self.stats['discarded'] += 1
+            return None
+        reviews = []
+        for (batch,) in self.conn.execute(
+            "SELECT reviews FROM review_checkpoint_batches WHERE checkpoint_key = ? ORDER BY seq", (checkpoint_key,)
+        ):
+            reviews.extend(json.loads(batch))
+        self.stats['resumed'] += 1
+        self.stats['resumed_reviews'] += len(reviews)
+        return {'reviews': reviews, 'clicks': row[0], 'page_size': row[1], 'seen_ids': set(json.loads(row[2]))}
+
+    def save(self, checkpoint_key: str, new_reviews: List[Dict], clicks: int, seen_ids: Set[str], page_size: Optional[int] = None,
+             context: Optional[str] = None):
+        """
+        지난 체크포인트 이후 새로 모은 리뷰 묶음과 현재 진행 상황 저장 (한 트랜잭션)
+
+        Args:
+            checkpoint_key: 제품 식별자
+            new_reviews: 지난 체크포인트 이후 내보낸 후기 리스트
+            clicks: 지금까지의 "더 보기" 클릭 횟수
+            seen_ids: 중복 체크용 리뷰 ID 집합
+            page_size: 첫 페이지의 리뷰 수 (재개 시 클릭 횟수 계산용)
+            context: 수집 조건 (load에서 비교)
+        """
+        with self.conn:
+            row = self.conn.execute(
+                "SELECT COALESCE(MAX(seq), 0), (SELECT review_count FROM review_checkpoints WHERE checkpoint_key = ?) "
+                "FROM review_checkpoint_batches WHERE checkpoint_key = ?",
+                (checkpoint_key, checkpoint_key)
+            ).fetchone()
+            if new_reviews:
+                self.conn.execute(
+                    "INSERT INTO review_checkpoint_batches (checkpoint_key, seq, reviews) VALUES (?, ?, ?)",
+                    (checkpoint_key, row[0] + 1, json.dumps(new_reviews, ensure_ascii=False))
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO review_checkpoints "
+                "(checkpoint_key, clicks, page_size, review_count, seen_ids, context, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (checkpoint_key, clicks, page_size, (row[1] or 0) + len(new_reviews),
+                 json.dumps(sorted(seen_ids), ensure_ascii=False), context, time.time())
+            )
+        self.stats['saves'] += 1
+
+    def clear(self, checkpoint_key: str):
+        """제품 수집 완료: 체크포인트 삭제"""
+        with self.conn:
+            self.conn.execute("DELETE FROM review_checkpoint_batches WHERE checkpoint_key = ?", (checkpoint_key,))
+            self.conn.execute("DELETE FROM review_checkpoints WHERE checkpoint_key = ?", (checkpoint_key,))
+
+    def print_stats(self, title: Optional[str] = None):
+        """체크포인트 통계 출력"""
+        if not any(self.stats.values()):
+            return
+        print(f"\n[리뷰 체크포인트 통계]{f' {title}' if title else ''}")
+        print(f"  - 저장 {self.stats['saves']}회, 재개 {self.stats['resumed']}개 제품 (복원한 후기 {self.stats['resumed_reviews']}개), "
+              f"오래되었거나 수집 조건이 달라 버린 체크포인트 {self.stats['discarded']}개")
+
+    def close(self):
+        self.conn.close()
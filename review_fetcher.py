@@ -0,0 +1,242 @@
+"""
+브라우저 없이 리뷰 API를 직접 호출하는 리뷰 수집 모듈
+
+네트워크 캡처(review_backend='network')로 찾은 리뷰 API URL을 템플릿으로 사용해
+제품별 onlineProdSn/onlineProdCode와 페이지 번호만 바꿔 가며 요청한다.
+요청은 asyncio + aiohttp로 동시에 보내며, 연결은 keep-alive로 재사용하고
+쿠키는 Selenium 세션에서 가져온다.
+iter_fetch는 제품 하나의 리뷰를 다 받을 때마다 바로 내보내므로 호출한 쪽이 결과를 곧바로 저장할 수 있다.
+"""
+import asyncio
+import json
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit, urlunsplit
+
+import aiohttp
+
+from review_payload import payload_to_cards
+
+
+# 페이지 번호/오프셋/페이지 크기로 간주할 쿼리 파라미터 이름
+PAGE_PARAMS = ['page', 'pageNo', 'pageNum', 'pageIndex', 'currentPage', 'curPage']
+OFFSET_PARAMS = ['offset', 'start', 'startIndex']
+PAGE_SIZE_PARAMS = ['pageSize', 'size', 'limit', 'rows', 'listSize', 'perPage']
+# 제품 URL에서 리뷰 API로 옮겨 줄 제품 식별 파라미터
+PRODUCT_PARAMS = ['onlineProdSn', 'onlineProdCode']
+
+
+def cookies_from_driver(driver) -> Dict[str, str]:
+    """Selenium 세션의 쿠키를 {이름: 값} 딕셔너리로 변환"""
+    try:
+        return {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+    except Exception:
+        return {}
+
+
+class ReviewFetcher:
+    """리뷰 API 직접 호출 클래스 (동시 요청 수 제한 + 연결 재사용)"""
+
+    def __init__(self, endpoint_url: str, cookies: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None,
+                 concurrency: int = 8, timeout: float = 15, retries: int = 2, debug: bool = False):
+        """
+        리뷰 수집기 초기화
+
+        Args:
+            endpoint_url: 리뷰 API URL (네트워크 캡처로 찾은 URL 또는 로컬 스텁 서버 URL)
+            cookies: 요청에 사용할 쿠키 (cookies_from_driver 결과)
+            headers: 추가 요청 헤더 (User-Agent, Referer 등)
+            concurrency: 동시에 보낼 최대 요청 수
+            timeout: 요청당 제한 시간 (초)
+            retries: 실패한 요청 재시도 횟수
+            debug: 디버깅 모드
+        """
+        parts = urlsplit(endpoint_url)
+        self.base_url = urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))
+        self.base_params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        self.cookies = cookies or {}
+        self.headers = {
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+            **(headers or {}),
+        }
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.debug = debug
+
+        self.page_param = next((name for name in PAGE_PARAMS if name in self.base_params), None)
+        self.offset_param = None if self.page_param else next((name for name in OFFSET_PARAMS if name in self.base_params), None)
+        if not self.page_param and not self.offset_param:
+            self.page_param = 'page'
+        size_param = next((name for name in PAGE_SIZE_PARAMS if name in self.base_params), None)
+        self.page_size = int(self.base_params[size_param]) if size_param and self.base_params[size_param].isdigit() else None
+        self.first_page = int(self.base_params.get(self.page_param, 1) or 1) if self.page_param else 0
+
+        self.stats = {'requests': 0, 'failures': 0, 'rejected': {}, 'bytes': 0, 'reviews': 0, 'elapsed': 0.0}
+
+    def _page_params(self, product_params: Dict[str, str], page_index: int) -> Dict[str, str]:
+        """page_index번째(0부터) 페이지 요청 파라미터 생성"""
+        params = {**self.base_params, **product_params}
+        if self.page_param:
+            params[self.page_param] = str(self.first_page + page_index)
+        else:
+            params[self.offset_param] = str(page_index * (self.page_size or 10))
+        return params
+
+    def product_params(self, product_url: str) -> Dict[str, str]:
+        """
+        제품 URL에서 리뷰 API에 넣을 제품 식별 파라미터 추출
+
+        Raises:
+            ValueError: 리뷰 API URL에 제품 식별 파라미터가 없어 제품을 바꿀 수 없는 경우
+        """
+        query = dict(parse_qsl(urlsplit(product_url).query))
+        params = {name: query[name] for name in PRODUCT_PARAMS if name in self.base_params and query.get(name)}
+        if not params:
+            raise ValueError(f"리뷰 API URL에 제품 식별 파라미터({', '.join(PRODUCT_PARAMS)})가 없습니다: {self.base_url}")
+        return params
+
+    async def _get_json(self, session, semaphore: asyncio.Semaphore, params: Dict[str, str]):
+        """리뷰 API 한 페이지 요청 (실패 시 재시도, 최종 실패하면 None)"""
+        for attempt in range(self.retries + 1):
+            async with semaphore:
+                try:
+                    async with session.get(self.base_url, params=params) as response:
+                        body = await response.read()
+                        self.stats['requests'] += 1
+                        self.stats['bytes'] += len(body)
+                        if response.status == 200:
+                            return json.loads(body.decode(response.charset or 'utf-8'))
+                        if self.debug:
+                            print(f"  [디버깅] 리뷰 API 응답 코드 {response.status}: {params}")
+                        if response.status < 500 and response.status != 429:
+                            # 401/403/404 등은 재시도해도 같으므로 바로 실패로 집계 (쿠키 만료, 잘못된 템플릿 등)
+                            rejected = self.stats['rejected']
+                            rejected[response.status] = rejected.get(response.status, 0) + 1
+                            self.stats['failures'] += 1
+                            return None
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                    if self.debug:
+                        print(f"  [디버깅] 리뷰 API 요청 오류 ({attempt + 1}회차): {e}")
+            if attempt < self.retries:
+                await asyncio.sleep(0.5 * (attempt + 1))
+        self.stats['failures'] += 1
+        return None
+
+    async def _fetch_product(self, session, semaphore: asyncio.Semaphore, product_url: str,
+                             max_pages: Optional[int], max_reviews: Optional[int]) -> List[Dict]:
+        """제품 하나의 리뷰를 빈 페이지가 나올 때까지 순서대로 요청"""
+        try:
+            product_params = self.product_params(product_url)
+        except ValueError as e:
+            print(f"  ⚠ {e}")
+            return []
+
+        cards = []
+        seen = set()
+        page_index = 0
+        while max_pages is None or page_index < max_pages:
+            payload = await self._get_json(session, semaphore, self._page_params(product_params, page_index))
+            page_cards = payload_to_cards(payload) if payload is not None else []
+            new_cards = []
+            for card in page_cards:
+                key = (card['username'], card['text'][:50])
+                if key not in seen:
+                    seen.add(key)
+                    new_cards.append(card)
+            # 빈 페이지 또는 같은 페이지가 반복되면 마지막 페이지로 간주
+            if not new_cards:
+                break
+            cards.extend(new_cards)
+            if max_reviews and len(cards) >= max_reviews:
+                cards = cards[:max_reviews]
+                break
+            if self.page_size and len(page_cards) < self.page_size:
+                break
+            page_index += 1
+        return cards
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """keep-alive 연결을 재사용하는 세션 생성 (이벤트 루프 안에서 호출)"""
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers,
+                                     cookies=self.cookies, auto_decompress=True)
+
+    async def _fetch_product_with_url(self, session, semaphore: asyncio.Semaphore, product_url: str,
+                                      max_pages: Optional[int], max_reviews: Optional[int]) -> Tuple[str, List[Dict]]:
+        """_fetch_product 결과에 제품 URL을 붙여 반환 (완료 순서로 받을 때 제품 구분용)"""
+        return product_url, await self._fetch_product(session, semaphore, product_url, max_pages, max_reviews)
+
+    def iter_fetch(self, product_urls: List[str], max_pages: Optional[int] = None,
+                   max_reviews: Optional[int] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        여러 제품의 리뷰를 동시에 수집하면서 제품별 결과를 완료되는 대로 내보내는 제너레이터 (동기 호출용)
+
+        중간에 그만 받으면(제너레이터를 닫으면) 남은 요청을 취소한다.
+
+        Args:
+            product_urls: 제품 페이지 URL 리스트 (onlineProdSn/onlineProdCode 포함)
+            max_pages: 제품당 최대 페이지 수 (None이면 제한 없음)
+            max_reviews: 제품당 최대 리뷰 수 (None이면 제한 없음)
+
+        Yields:
+            (제품 URL, 리뷰 카드 딕셔너리 리스트) 튜플 (완료 순서)
+        """
+        loop = asyncio.new_event_loop()
+        start = time.monotonic()
+
+        async def open_session():
+            return self._open_session()
+
+        session = loop.run_until_complete(open_session())
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = {
+            loop.create_task(self._fetch_product_with_url(session, semaphore, url, max_pages, max_reviews))
+            for url in product_urls
+        }
+        try:
+            while pending:
+                done, pending = loop.run_until_complete(asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED))
+                for task in done:
+                    product_url, cards = task.result()
+                    self.stats['reviews'] += len(cards)
+                    yield product_url, cards
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(session.close())
+            loop.close()
+            self.stats['elapsed'] += time.monotonic() - start
+
+    def fetch_all(self, product_urls: List[str], max_pages: Optional[int] = None,
+                  max_reviews: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        여러 제품의 리뷰를 동시에 수집 (동기 호출용, 모든 제품이 끝난 뒤 한 번에 반환)
+
+        Args:
+            product_urls: 제품 페이지 URL 리스트 (onlineProdSn/onlineProdCode 포함)
+            max_pages: 제품당 최대 페이지 수 (None이면 제한 없음)
+            max_reviews: 제품당 최대 리뷰 수 (None이면 제한 없음)
+
+        Returns:
+            제품 URL을 키로 하는 리뷰 카드 딕셔너리 리스트
+        """
+        results = dict(self.iter_fetch(product_urls, max_pages, max_reviews))
+        return {url: results.get(url, []) for url in product_urls}
+
+    def print_stats(self):
+        """요청 통계 출력"""
+        elapsed = self.stats['elapsed']
+        rate = self.stats['reviews'] / elapsed if elapsed else 0
+        print(f"\n[HTTP 리뷰 수집 통계]")
+        print(f"  - 요청: {self.stats['requests']}회 (실패 {self.stats['failures']}회), "
+              f"수신 {self.stats['bytes'] / 1024 / 1024:.2f} MB")
+        if self.stats['rejected']:
+            codes = ', '.join(f"{status} {count}회" for status, count in sorted(self.stats['rejected'].items()))
+            print(f"  ⚠ 재시도하지 않은 오류 응답: {codes} (쿠키 만료 또는 리뷰 API URL 확인 필요)")
+        print(f"  - 리뷰: {self.stats['reviews']}개, {elapsed:.1f}초 ({rate:.1f}개/초)")
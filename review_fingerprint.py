@@ -0,0 +1,38 @@
+"""
+리뷰 지문(fingerprint) 모듈
+
+작성자, 평점, 옵션, 리뷰 본문을 정규화해 해시한 값으로 같은 리뷰를 식별한다.
+줄바꿈 등 공백 차이는 무시한다.
+"""
+import hashlib
+import re
+from typing import Dict
+
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _normalize(value) -> str:
+    """공백을 하나로 줄이고 앞뒤 공백 제거 (None은 빈 문자열)"""
+    if value is None:
+        return ''
+    return WHITESPACE_PATTERN.sub(' ', str(value)).strip()
+
+
+def review_fingerprint(review: Dict) -> str:
+    """
+    리뷰 지문 계산
+
+    Args:
+        review: 후기 딕셔너리 (username, rating, option, review_text 사용)
+
+    Returns:
+        40자리 16진수 SHA-1 문자열
+    """
+    parts = [
+        _normalize(review.get('username')),
+        _normalize(review.get('rating')),
+        _normalize(review.get('option')),
+        _normalize(review.get('review_text')),
+    ]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
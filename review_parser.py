@@ -0,0 +1,538 @@
+"""
+리뷰 카드 파싱 모듈
+
+브라우저 없이 동작하는 파싱 로직만 모아 두어 AmoreMallCrawler와
+파싱 프로세스 풀(parse_review_html)이 함께 사용한다.
+"""
+import re
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+
+class ReviewParser:
+    """리뷰 카드(BeautifulSoup 요소 또는 JSON 카드)를 후기 딕셔너리로 변환하는 클래스"""
+    
+    def __init__(self, debug: bool = False):
+        """
+        파서 초기화
+        
+        Args:
+            debug: 디버깅 모드 (파싱 실패 원인 출력, raw_html 저장)
+        """
+        self.debug = debug
+    
+    def _parse_user_info(self, user_info: str) -> Dict:
+        """
+        사용자 정보 원문을 나이/성별/피부타입으로 분리
+        
+        Args:
+            user_info: 원본 사용자 정보 (예: "20대/여성/지성/트러블", "40대여성복합성주름")
+            
+        Returns:
+            age, gender, skin_type_1, skin_type_2 키를 가진 딕셔너리
+        """
+        age = ""
+        gender = ""
+        skin_type_1 = ""
+        skin_type_2 = ""
+        
+        if user_info:
+            # "/" 구분자가 있는 경우와 없는 경우 모두 처리
+            if '/' in user_info:
+                # "20대/여성/지성/트러블" 형식 파싱
+                parts = [p.strip() for p in user_info.split('/') if p.strip()]
+                
+                if len(parts) >= 1:
+                    # 나이 추출 (예: "20대", "30대")
+                    age_match = re.search(r'(\d+대)', parts[0])
+                    if age_match:
+                        age = age_match.group(1)
+                
+                if len(parts) >= 2:
+                    # 성별 추출
+                    if '여성' in parts[1] or '여' in parts[1]:
+                        gender = '여성'
+                    elif '남성' in parts[1] or '남' in parts[1]:
+                        gender = '남성'
+                
+                if len(parts) >= 3:
+                    # 피부타입1 추출
+                    skin_type_1 = parts[2]
+                
+                if len(parts) >= 4:
+                    # 피부타입2 추출
+                    skin_type_2 = parts[3]
+            else:
+                # "/" 구분자가 없는 경우 (예: "40대여성복합성주름")
+                # 정규식으로 패턴 매칭하여 추출
+                
+                # 나이 추출 (예: "20대", "30대", "40대", "50대 이상")
+                age_match = re.search(r'(\d+대(?:\s*이상)?)', user_info)
+                if age_match:
+                    age = age_match.group(1).strip()
+                
+                # 성별 추출
+                if '여성' in user_info or '여' in user_info:
+                    gender = '여성'
+                elif '남성' in user_info or '남' in user_info:
+                    gender = '남성'
+                
+                # 피부타입 패턴 정의 (더 포괄적으로)
+                # 주요 피부타입 (skin_type_1)
+                main_skin_types = [
+                    '지성', '건성', '수분부족지성', '수분부족', '복합성', 
+                    '민감성', '중성', '수분'
+                ]
+                
+                # 부가 정보 (skin_type_2)
+                additional_info = [
+                    '트러블', '모공', '주름', '칙칙함', '건조함', 
+                    '탄력없음', '수분부족', '민감성'
+                ]
+                
+                # 피부타입 추출 (긴 패턴부터 매칭)
+                found_main = None
+                found_additional = []
+                
+                # 주요 피부타입 찾기 (긴 것부터)
+                for st in sorted(main_skin_types, key=len, reverse=True):
+                    if st in user_info:
+                        found_main = st
+                        break
+                
+                # 부가 정보 찾기
+                for info in sorted(additional_info, key=len, reverse=True):
+                    if info in user_info and info != found_main:
+                        found_additional.append(info)
+                
+                # 중복 제거
+                found_additional = list(dict.fromkeys(found_additional))  # 순서 유지하며 중복 제거
+                
+                # 피부타입 할당
+                if found_main:
+                    skin_type_1 = found_main
+                
+                # 부가 정보 할당 (주요 피부타입과 중복되지 않는 것만)
+                if found_additional:
+                    # 첫 번째 부가 정보를 skin_type_2에 할당
+                    # 단, 이미 skin_type_1에 할당된 것은 제외
+                    for info in found_additional:
+                        if info != skin_type_1:
+                            skin_type_2 = info
+                            break
+                    
+                    # 두 번째 부가 정보가 있으면 skin_type_2에 추가 (또는 별도 처리)
+                    if len(found_additional) > 1 and not skin_type_2:
+                        for info in found_additional[1:]:
+                            if info != skin_type_1:
+                                skin_type_2 = info
+                                break
+                
+                # 나이가 없고 피부타입만 있는 경우 (예: "건성건조함")
+                if not age and (skin_type_1 or skin_type_2):
+                    # 이미 파싱된 상태이므로 그대로 사용
+                    pass
+        
+        return {
+            'age': age,
+            'gender': gender,
+            'skin_type_1': skin_type_1,
+            'skin_type_2': skin_type_2,
+        }
+    
+    def _infer_special_notes(self, review_text: str, all_text: str) -> List[str]:
+        """
+        prdStyle 특이사항이 없을 때 리뷰 텍스트에서 키워드 기반으로 특이사항 추출
+        
+        Args:
+            review_text: 리뷰 본문
+            all_text: 리뷰 카드 전체 텍스트
+            
+        Returns:
+            "키워드: 내용" 형식의 특이사항 리스트
+        """
+        # 발색감, 지속력, 사용감, 향, 민감성, 보습감 등 키워드 찾기
+        special_keywords = {
+            '지속력': ['지속', '오래', '오랫동안', '지속력'],
+            '발색감': ['발색', '색상', '컬러', '톤'],
+            '사용감': ['사용감', '발림', '밀착', '부드러움', '끈적'],
+            '향': ['향', '냄새', '향기', '아로마'],
+            '민감성': ['민감', '순함', '자극', '알레르기'],
+            '보습감': ['보습', '촉촉', '수분', '건조'],
+            '유분기': ['유분', '기름', '번들', '윤기'],
+            '광택감': ['광택', '글로시', '윤기', '번들']
+        }
+        
+        found_notes = []
+        for keyword, patterns in special_keywords.items():
+            for pattern in patterns:
+                if pattern in review_text or pattern in all_text:
+                    # 해당 키워드 주변 텍스트 추출
+                    text_to_search = review_text if review_text else all_text
+                    match = re.search(f'{pattern}[^\n]*', text_to_search, re.I)
+                    if match:
+                        note_text = match.group(0).strip()[:50]  # 최대 50자
+                        if note_text and note_text not in found_notes:
+                            found_notes.append(f"{keyword}: {note_text}")
+                            break
+        
+        return found_notes
+    
+    def _find_user_info_in_text(self, all_text: str) -> str:
+        """리뷰 카드 전체 텍스트에서 사용자 정보(나이/성별/피부타입) 패턴 찾기"""
+        info_patterns = [
+            r'(\d+대[^\n]*여성|남성[^\n]*)',
+            r'(\d+대[^\n]*지성|건성|수분[^\n]*)',
+            r'(\d+대[^\n]*)',
+            r'(여성|남성[^\n]*지성|건성[^\n]*)'
+        ]
+        for pattern in info_patterns:
+            info_match = re.search(pattern, all_text)
+            if info_match:
+                return info_match.group(1).strip()
+        return ""
+    
+    def _pick_review_text(self, text_lines: List[str]) -> str:
+        """리뷰 본문 요소가 없을 때 텍스트 라인 중 리뷰 본문으로 보이는 가장 긴 줄 선택"""
+        review_text = ""
+        # 리뷰 관련 키워드가 포함된 긴 텍스트 찾기
+        review_keywords = ['지속력', '촉촉', '유분', '향', '각질', '입술', '립', '보습', '수분', '건조', '사용', '후기']
+        candidate_texts = []
+        
+        for line in text_lines:
+            if len(line) > 30:  # 최소 길이
+                # 리뷰 키워드가 있거나 매우 긴 텍스트
+                if any(kw in line for kw in review_keywords) or len(line) > 100:
+                    candidate_texts.append(line)
+        
+        if candidate_texts:
+            # 가장 긴 텍스트 선택
+            review_text = max(candidate_texts, key=len)
+            # 불필요한 텍스트 제거
+            review_text = re.sub(r'신고내용.*?차단하기', '', review_text, flags=re.DOTALL)
+            review_text = review_text.strip()
+        elif text_lines:
+            # 키워드가 없어도 가장 긴 텍스트 선택
+            review_text = max(text_lines, key=len)
+        
+        return review_text
+    
+    def _review_from_card_data(self, card: Dict, index: int = 0) -> Optional[Dict]:
+        """
+        JavaScript로 추출한 리뷰 카드 JSON을 후기 딕셔너리로 변환
+        (_parse_review_element와 같은 형식)
+        
+        Args:
+            card: _extract_review_cards_js가 반환한 카드 딕셔너리
+            index: 카드 인덱스 (디버깅용)
+            
+        Returns:
+            파싱된 후기 데이터
+        """
+        all_text = card.get('all_text') or ''
+        if len(all_text) < 20:
+            return None
+        text_lines = [line.strip() for line in all_text.split('\n') if line.strip()]
+        
+        username = card.get('username') or ''
+        if not username:
+            username_match = re.search(r'([a-zA-Z0-9]+\*+)', all_text)
+            if username_match:
+                username = username_match.group(1)
+        
+        user_info = card.get('user_info') or self._find_user_info_in_text(all_text)
+        user_fields = self._parse_user_info(user_info)
+        
+        # 평점: star5 등의 클래스 우선, 없으면 별 아이콘 개수
+        rating = 0
+        star_match = re.search(r'star(\d+)', card.get('star_class') or '')
+        if star_match:
+            rating = int(star_match.group(1))
+        else:
+            rating = card.get('star_count') or 0
+        
+        review_text = card.get('text') or ''
+        if review_text:
+            review_text = re.sub(r'신고내용.*?차단하기', '', review_text, flags=re.DOTALL)
+            review_text = re.sub(r'작성자:.*?글내용:', '', review_text)
+            review_text = review_text.strip()
+        if not review_text or len(review_text) < 20:
+            review_text = self._pick_review_text(text_lines)
+        
+        special_notes = list(card.get('notes') or [])
+        if not special_notes:
+            special_notes = self._infer_special_notes(review_text, all_text)
+        special_notes += [''] * 3
+        
+        if not review_text or len(review_text) <= 10:
+            if self.debug and index < 3:
+                print(f"    [디버깅] 카드 {index} 파싱 실패 - 전체 텍스트 샘플: {all_text[:200]}")
+            return None
+        
+        review_data = {
+            'username': username,
+            'user_info': user_info,
+            'age': user_fields['age'],
+            'gender': user_fields['gender'],
+            'skin_type_1': user_fields['skin_type_1'],
+            'skin_type_2': user_fields['skin_type_2'],
+            'rating': rating if rating > 0 else None,
+            'option': card.get('option') or '',
+            'review_type': card.get('review_type') or '',
+            'special_note_1': special_notes[0],
+            'special_note_2': special_notes[1],
+            'special_note_3': special_notes[2],
+            'review_text': review_text,
+        }
+        if self.debug:
+            review_data['raw_html'] = all_text[:1000]
+        return review_data
+    
+    def _parse_review_element(self, element, index: int = 0) -> Optional[Dict]:
+        """
+        개별 후기 요소 파싱
+        
+        Args:
+            element: BeautifulSoup 요소
+            index: 요소 인덱스 (디버깅용)
+            
+        Returns:
+            파싱된 후기 데이터
+        """
+        try:
+            # 요소의 전체 텍스트 가져오기
+            all_text = element.get_text(separator='\n', strip=True)
+            text_lines = [line.strip() for line in all_text.split('\n') if line.strip()]
+            
+            # 최소한의 텍스트가 없으면 스킵
+            if not all_text or len(all_text) < 20:
+                return None
+            
+            review_data = {}
+            
+            # 사용자명 추출 - 아모레몰 구조에 맞춤
+            username = ""
+            # 아모레몰: span.profileCard__userTitle
+            username_elem = (
+                element.find('span', class_=re.compile('profileCard__userTitle|userTitle', re.I)) or
+                element.find(class_=re.compile('profileCard__userTitle|userTitle', re.I)) or
+                element.find('span', class_=lambda x: x and 'userTitle' in x) or
+                element.find(class_=re.compile('user|name|nick|id', re.I))
+            )
+            if username_elem:
+                username = username_elem.get_text(strip=True)
+            
+            # 텍스트에서 사용자명 패턴 직접 찾기
+            if not username:
+                username_match = re.search(r'([a-zA-Z0-9]+\*+)', all_text)
+                if username_match:
+                    username = username_match.group(1)
+            
+            # 사용자 정보 (나이/성별/피부타입 등) - 아모레몰 구조에 맞춤
+            user_info = ""
+            # 아모레몰: span.profileCard__userDesc
+            info_elem = (
+                element.find('span', class_=re.compile('profileCard__userDesc|userDesc', re.I)) or
+                element.find(class_=re.compile('profileCard__userDesc|userDesc', re.I)) or
+                element.find('span', class_=lambda x: x and 'userDesc' in x) or
+                element.find(class_=re.compile('info|demographic|user-info', re.I))
+            )
+            if info_elem:
+                user_info = info_elem.get_text(strip=True)
+            
+            # 텍스트에서 직접 추출 (백업)
+            if not user_info:
+                user_info = self._find_user_info_in_text(all_text)
+            
+            # user_info를 세분화하여 파싱
+            user_fields = self._parse_user_info(user_info)
+            
+            # 평점 추출 - 아모레몰 구조에 맞춤
+            rating = 0
+            
+            # 방법 1: 아모레몰 구조 - div.icoStarWrap.star5 (star5 = 5점)
+            star_wrap = element.find('div', class_=re.compile('icoStarWrap|starWrap', re.I))
+            if star_wrap:
+                star_class = ' '.join(star_wrap.get('class', []))
+                # star5, star4 등의 패턴 찾기
+                star_match = re.search(r'star(\d+)', star_class)
+                if star_match:
+                    rating = int(star_match.group(1))
+                else:
+                    # 별 개수 세기
+                    stars = star_wrap.find_all('i', class_=re.compile('icoStar|star', re.I))
+                    rating = len(stars) if stars else 0
+            
+            # 방법 2: 별 요소 직접 찾기
+            if rating == 0:
+                star_elements = element.find_all('i', class_=re.compile('icoStar|star', re.I))
+                if star_elements:
+                    rating = len(star_elements)
+            
+            # 방법 3: 텍스트에서 평점 숫자 찾기
+            if rating == 0:
+                rating_match = re.search(r'(\d+)\s*점|평점[:\s]*(\d+)|(\d+)\s*/\s*5', all_text)
+                if rating_match:
+                    rating = int(rating_match.group(1) or rating_match.group(2) or rating_match.group(3))
+            
+            # 방법 4: 클래스에서 평점 찾기
+            if rating == 0:
+                rating_elem = element.find(class_=re.compile('rating|score|point', re.I))
+                if rating_elem:
+                    rating_text = rating_elem.get_text(strip=True)
+                    rating_match = re.search(r'(\d+)', rating_text)
+                    if rating_match:
+                        rating = int(rating_match.group(1))
+            
+            # 옵션 정보 (예: "옵션: 베리")
+            option = ""
+            option_patterns = [
+                r'옵션[:\s]*([^\n]+)',
+                r'option[:\s]*([^\n]+)',
+                r'선택[:\s]*([^\n]+)'
+            ]
+            
+            for pattern in option_patterns:
+                option_match = re.search(pattern, all_text, re.I)
+                if option_match:
+                    option = option_match.group(1).strip()
+                    break
+            
+            # 리뷰 텍스트 추출 - 아모레몰 구조에 맞춤
+            review_text = ""
+            
+            # 방법 1: 아모레몰 구조 - p.txt 또는 div.txt
+            text_elem = (
+                element.find('p', class_='txt') or
+                element.find('p', class_=lambda x: x and 'txt' in x) or
+                element.find('div', class_='txt') or
+                element.find(['p', 'div'], class_=re.compile('txt|text|content', re.I))
+            )
+            if text_elem:
+                review_text = text_elem.get_text(strip=True)
+                # 불필요한 텍스트 제거 (신고 버튼 등)
+                review_text = re.sub(r'신고내용.*?차단하기', '', review_text, flags=re.DOTALL)
+                review_text = re.sub(r'작성자:.*?글내용:', '', review_text)
+                review_text = review_text.strip()
+            
+            # 방법 2: 모든 텍스트 라인 중 가장 긴 것 찾기
+            if not review_text or len(review_text) < 20:
+                review_text = self._pick_review_text(text_lines)
+            
+            # 리뷰 타입 (예: "한달 사용 리뷰")
+            review_type = ""
+            type_patterns = [
+                r'(\d+\s*[일개월주년]+?\s*사용\s*리뷰)',
+                r'(한달|한\s*달|1개월)\s*사용',
+                r'사용\s*리뷰'
+            ]
+            
+            for pattern in type_patterns:
+                type_match = re.search(pattern, all_text, re.I)
+                if type_match:
+                    review_type = type_match.group(0).strip()
+                    break
+            
+            # 특이사항 추출 (prdStyle 구조: dt/dd)
+            special_note_1 = ""
+            special_note_2 = ""
+            special_note_3 = ""
+            
+            prd_style = element.find('div', class_=re.compile('prdStyle', re.I))
+            if prd_style:
+                # dt/dd 구조로 된 특이사항 추출
+                dts = prd_style.find_all('dt')
+                dds = prd_style.find_all('dd')
+                
+                special_notes = []
+                for i, dt in enumerate(dts):
+                    if i < len(dds):
+                        label = dt.get_text(strip=True)
+                        value = dds[i].get_text(strip=True)
+                        special_notes.append(f"{label}: {value}")
+                
+                if len(special_notes) >= 1:
+                    special_note_1 = special_notes[0]
+                if len(special_notes) >= 2:
+                    special_note_2 = special_notes[1]
+                if len(special_notes) >= 3:
+                    special_note_3 = special_notes[2]
+            
+            # 특이사항이 없으면 텍스트에서 키워드 기반으로 추출
+            if not special_note_1:
+                found_notes = self._infer_special_notes(review_text, all_text)
+                
+                if len(found_notes) >= 1:
+                    special_note_1 = found_notes[0]
+                if len(found_notes) >= 2:
+                    special_note_2 = found_notes[1]
+                if len(found_notes) >= 3:
+                    special_note_3 = found_notes[2]
+            
+            # 최소한 리뷰 텍스트가 있어야 유효한 후기로 간주
+            if review_text and len(review_text) > 10:
+                review_data = {
+                    'username': username,
+                    'user_info': user_info,  # 원본 정보
+                    'age': user_fields['age'],
+                    'gender': user_fields['gender'],
+                    'skin_type_1': user_fields['skin_type_1'],
+                    'skin_type_2': user_fields['skin_type_2'],
+                    'rating': rating if rating > 0 else None,
+                    'option': option,
+                    'review_type': review_type,
+                    'special_note_1': special_note_1,  # 특이사항1 (예: "지속력: 오래 지속돼요")
+                    'special_note_2': special_note_2,  # 특이사항2 (예: "유분기: 유분 적당해요")
+                    'special_note_3': special_note_3,  # 특이사항3 (예: "촉촉함: 촉촉해요")
+                    'review_text': review_text,
+                }
+                
+                # 디버깅 모드일 때만 raw_html 저장
+                if self.debug:
+                    review_data['raw_html'] = str(element)[:1000]
+                
+                return review_data
+            else:
+                # 디버깅: 파싱 실패 원인 출력
+                if self.debug and index < 3:
+                    print(f"    [디버깅] 요소 {index} 파싱 실패 - 텍스트 길이: {len(review_text) if review_text else 0}")
+                    print(f"      전체 텍스트 샘플: {all_text[:200]}")
+            
+        except Exception as e:
+            if self.debug:
+                print(f"후기 파싱 오류 (요소 {index}): {e}")
+        
+        return None
+
+
+def card_element(card_html: str):
+    """
+    리뷰 카드 outerHTML을 카드 요소(Tag)로 변환
+    
+    BeautifulSoup 문서 객체가 아니라 최상위 카드 요소를 돌려주므로, 증분 파싱과 파싱 프로세스 풀이
+    전체 파싱(_find_review_elements)과 같은 요소를 _parse_review_element에 넘기게 된다.
+    
+    Returns:
+        카드 요소 (HTML에 요소가 없으면 None)
+    """
+    return BeautifulSoup(card_html, 'html.parser').find()
+
+
+def parse_review_html(card_htmls: List[str], debug: bool = False) -> List[Optional[Dict]]:
+    """
+    리뷰 카드 HTML 문자열 리스트 파싱 (파싱 프로세스 풀에서 실행)
+    
+    Args:
+        card_htmls: 리뷰 카드 요소의 outerHTML 리스트
+        debug: 디버깅 모드
+        
+    Returns:
+        후기 딕셔너리 리스트 (파싱 실패한 카드는 None)
+    """
+    parser = ReviewParser(debug)
+    parsed = []
+    for index, card_html in enumerate(card_htmls):
+        element = card_element(card_html)
+        parsed.append(parser._parse_review_element(element, index) if element else None)
+    return parsed
@@ -0,0 +1,138 @@
+"""
+리뷰 API 응답(JSON)을 리뷰 카드 형식으로 변환하는 모듈
+
+브라우저 네트워크 캡처(review_backend='network')와 직접 HTTP 수집에서 공통으로 사용한다.
+변환 결과는 AmoreMallCrawler._review_from_card_data가 받는 카드 딕셔너리와 같은 형식이다.
+"""
+from typing import Any, Dict, List, Optional
+
+
+# 리뷰 항목에서 필드별로 시도할 키 (앞쪽이 우선)
+TEXT_KEYS = ['reviewContent', 'reviewContents', 'reviewText', 'contents', 'content', 'reviewCn', 'text']
+USERNAME_KEYS = ['memberNickname', 'nickname', 'nickName', 'memberId', 'loginId', 'userId', 'writerId', 'writer', 'name']
+USER_INFO_KEYS = ['userInfo', 'profileDesc', 'profile', 'memberInfo']
+AGE_KEYS = ['ageGroup', 'ageRange', 'age', 'ageName']
+GENDER_KEYS = ['gender', 'genderName', 'sex']
+SKIN_TYPE_KEYS = ['skinType', 'skinTypeName', 'skinTypeNm']
+SKIN_TROUBLE_KEYS = ['skinTrouble', 'skinTroubleName', 'skinConcern', 'skinConcernName']
+RATING_KEYS = ['starScore', 'reviewScore', 'score', 'rating', 'starPoint', 'star', 'grade']
+OPTION_KEYS = ['optionName', 'prodOptionName', 'optionNm', 'option', 'prodName']
+REVIEW_TYPE_KEYS = ['reviewTypeName', 'reviewType', 'typeName']
+STYLE_LIST_KEYS = ['prdStyles', 'prdStyleList', 'styles', 'evaluations', 'surveyList', 'reviewSurveys']
+STYLE_LABEL_KEYS = ['title', 'name', 'question', 'label', 'itemName']
+STYLE_VALUE_KEYS = ['value', 'answer', 'content', 'text', 'itemValue']
+GENDER_NAMES = {'F': '여성', 'W': '여성', 'FEMALE': '여성', 'M': '남성', 'MALE': '남성'}
+
+
+def _first_value(item: Dict, keys: List[str]) -> Any:
+    """keys 중 값이 있는 첫 번째 키의 값 반환"""
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _as_text(value: Any) -> str:
+    """값을 공백 정리된 문자열로 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, dict):
+        value = _first_value(value, ['name', 'value', 'text', 'title']) or ''
+    return ' '.join(str(value).split())
+
+
+def _looks_like_review(item: Any) -> bool:
+    """리뷰 본문 키가 있는 딕셔너리인지 확인"""
+    return isinstance(item, dict) and any(isinstance(item.get(key), str) for key in TEXT_KEYS)
+
+
+def find_review_items(payload: Any, depth: int = 0) -> Optional[List[Dict]]:
+    """
+    응답 JSON에서 리뷰 항목 리스트 찾기 (중첩 구조를 재귀적으로 탐색)
+
+    Args:
+        payload: 파싱된 응답 JSON
+
+    Returns:
+        리뷰 항목 리스트 (찾지 못하면 None)
+    """
+    if depth > 6:
+        return None
+    if isinstance(payload, list):
+        if payload and all(_looks_like_review(item) for item in payload[:5]):
+            return payload
+        for item in payload[:5]:
+            found = find_review_items(item, depth + 1)
+            if found is not None:
+                return found
+    elif isinstance(payload, dict):
+        for value in payload.values():
+            if isinstance(value, (dict, list)):
+                found = find_review_items(value, depth + 1)
+                if found is not None:
+                    return found
+    return None
+
+
+def review_item_to_card(item: Dict) -> Dict:
+    """
+    리뷰 API 항목을 리뷰 카드 딕셔너리로 변환
+
+    Args:
+        item: 리뷰 API 응답의 리뷰 항목
+
+    Returns:
+        username, user_info, star_class, star_count, option, review_type, notes, text, all_text 키를 가진 딕셔너리
+    """
+    username = _as_text(_first_value(item, USERNAME_KEYS))
+
+    user_info = _as_text(_first_value(item, USER_INFO_KEYS))
+    if not user_info:
+        # 나이/성별/피부타입이 따로 오면 화면 표기("20대/여성/지성/트러블")와 같은 형식으로 조합
+        gender = _as_text(_first_value(item, GENDER_KEYS))
+        parts = [
+            _as_text(_first_value(item, AGE_KEYS)),
+            GENDER_NAMES.get(gender.upper(), gender),
+            _as_text(_first_value(item, SKIN_TYPE_KEYS)),
+            _as_text(_first_value(item, SKIN_TROUBLE_KEYS)),
+        ]
+        user_info = '/'.join(part for part in parts if part)
+
+    rating = 0
+    try:
+        rating = int(round(float(_first_value(item, RATING_KEYS) or 0)))
+    except (TypeError, ValueError):
+        rating = 0
+
+    notes = []
+    styles = _first_value(item, STYLE_LIST_KEYS) or []
+    if isinstance(styles, list):
+        for style in styles:
+            if isinstance(style, dict):
+                label = _as_text(_first_value(style, STYLE_LABEL_KEYS))
+                value = _as_text(_first_value(style, STYLE_VALUE_KEYS))
+                if label and value:
+                    notes.append(f"{label}: {value}")
+
+    text = str(_first_value(item, TEXT_KEYS) or '').strip()
+    option = _as_text(_first_value(item, OPTION_KEYS))
+    review_type = _as_text(_first_value(item, REVIEW_TYPE_KEYS))
+
+    return {
+        'username': username,
+        'user_info': user_info,
+        'star_class': f"star{rating}" if rating else '',
+        'star_count': rating,
+        'option': option,
+        'review_type': review_type,
+        'notes': notes,
+        'text': text,
+        'all_text': '\n'.join(part for part in [username, user_info, option, review_type, text] if part),
+    }
+
+
+def payload_to_cards(payload: Any) -> List[Dict]:
+    """응답 JSON 전체를 리뷰 카드 딕셔너리 리스트로 변환 (리뷰가 없으면 빈 리스트)"""
+    items = find_review_items(payload) or []
+    return [review_item_to_card(item) for item in items]
@@ -0,0 +1,116 @@
+"""
+셀렉터 캐시 모듈
+
+페이지 종류(product, review_list, brand_list, notice)와 셀렉터 목록 이름별로
+마지막으로 성공한 셀렉터를 기억해 다음 페이지에서 가장 먼저 시도한다.
+성공 통계는 JSON 파일에 저장되어 다음 실행에서도 사용된다.
+셀렉터는 목록 안의 위치가 아니라 "by:값" 문자열로 기억하므로 코드에서 셀렉터
+목록 순서를 바꾸거나 항목을 추가해도 기억된 셀렉터가 다른 셀렉터로 바뀌지 않는다.
+"""
+import json
+import os
+from typing import Dict, List, Optional
+
+
+def selector_key(selector) -> str:
+    """셀렉터를 캐시 키 문자열로 변환 ((By, 값) 튜플은 "by:값", 문자열은 그대로)"""
+    if isinstance(selector, tuple):
+        by, value = selector
+        return f"{by}:{value}"
+    return str(selector)
+
+
+class SelectorCache:
+    """성공한 셀렉터를 먼저 시도하도록 셀렉터 목록 순서를 바꾸는 클래스"""
+
+    def __init__(self, path: Optional[str] = 'selector_cache.json'):
+        """
+        셀렉터 캐시 초기화
+
+        Args:
+            path: 통계를 저장할 JSON 파일 경로 (None이면 저장하지 않음)
+        """
+        self.path = path
+        self.data: Dict[str, Dict] = {}
+        self.session = {'hits': 0, 'misses': 0}
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except (OSError, ValueError):
+                self.data = {}
+
+    def _entry(self, page_type: str, name: str) -> Dict:
+        entry = self.data.setdefault(page_type, {}).setdefault(name, {'winner': None, 'hits': 0, 'misses': 0, 'wins': {}})
+        if entry['winner'] is not None and not isinstance(entry['winner'], str):
+            # 이전 형식(목록 인덱스)으로 저장된 기록은 현재 목록과 맞는지 알 수 없으므로 버림
+            entry['winner'] = None
+            entry['wins'] = {}
+        return entry
+
+    def ordered(self, page_type: str, name: str, candidates: List) -> List:
+        """
+        기억된 셀렉터를 맨 앞으로 옮긴 셀렉터 목록 반환
+
+        Args:
+            page_type: 페이지 종류
+            name: 셀렉터 목록 이름
+            candidates: 원래 순서의 셀렉터 목록
+
+        Returns:
+            새 순서의 셀렉터 목록 (기억된 셀렉터가 없으면 원래 순서)
+        """
+        winner = self._entry(page_type, name)['winner']
+        for i, candidate in enumerate(candidates):
+            if selector_key(candidate) == winner:
+                return [candidate] + list(candidates[:i]) + list(candidates[i + 1:])
+        return list(candidates)
+
+    def record(self, page_type: str, name: str, candidates: List, selector):
+        """
+        성공한 셀렉터 기록 (기억된 셀렉터가 바로 성공했으면 적중, 아니면 실패로 집계)
+
+        Args:
+            page_type: 페이지 종류
+            name: 셀렉터 목록 이름
+            candidates: 원래 순서의 셀렉터 목록 (ordered에 넘긴 것과 같은 목록)
+            selector: 성공한 셀렉터
+        """
+        if selector not in candidates:
+            return
+        key = selector_key(selector)
+        entry = self._entry(page_type, name)
+        if entry['winner'] == key:
+            entry['hits'] += 1
+            self.session['hits'] += 1
+        else:
+            entry['misses'] += 1
+            self.session['misses'] += 1
+        entry['winner'] = key
+        entry['wins'][key] = entry['wins'].get(key, 0) + 1
+
+    def save(self):
+        """통계를 파일에 저장 (임시 파일 후 교체)"""
+        if not self.path:
+            return
+        try:
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def print_stats(self, title: Optional[str] = None):
+        """이번 실행의 적중 통계와 누적 통계 출력"""
+        lookups = self.session['hits'] + self.session['misses']
+        if not lookups:
+            return
+        print(f"\n[셀렉터 캐시 통계]{f' {title}' if title else ''}")
+        print(f"  - 이번 실행: 적중 {self.session['hits']}회, 실패 {self.session['misses']}회 "
+              f"(적중률 {self.session['hits'] / lookups * 100:.0f}%)")
+        for page_type, entries in sorted(self.data.items()):
+            for name, entry in sorted(entries.items()):
+                total = entry['hits'] + entry['misses']
+                if total:
+                    print(f"  - {page_type}/{name}: 누적 적중 {entry['hits']}/{total}회, 현재 셀렉터 {entry['winner']}")
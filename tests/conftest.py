@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+import pytest
+
+# 모듈이 저장소 최상위에 있으므로 테스트에서 바로 import할 수 있게 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BRAND_URL = 'https://www.amoremall.com/brand'
+
+
+def product_url(sn):
+    return f'https://www.amoremall.com/kr/ko/product/detail?onlineProdSn={sn}'
+
+
+@pytest.fixture
+def make_product():
+    """브랜드 목록에서 얻은 것과 같은 모양의 제품 dict 생성"""
+    def make(sn, name=None, review_count=100):
+        return {
+            'product_url': product_url(sn),
+            'product_code': f'P{sn}',
+            'product_name': name or f'제품 {sn}',
+            'listing_review_count': review_count,
+        }
+    return make
+
+
+@pytest.fixture
+def make_products(make_product):
+    """onlineProdSn 1..count 제품 목록 생성"""
+    def make(count):
+        return [make_product(sn) for sn in range(1, count + 1)]
+    return make
+
+
+@pytest.fixture
+def crawled_at():
+    """몇 시간 전 시각을 크롤링 결과의 crawled_at 형식으로 반환"""
+    def at(hours_ago):
+        return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(time.time() - hours_ago * 3600))
+    return at
+
+
+
+@pytest.fixture
+def make_review():
+    """후기 파서가 돌려주는 것과 같은 모양의 후기 dict 생성"""
+    def make(n, **fields):
+        review = {
+            'username': f'작성자{n}',
+            'rating': 5,
+            'option': '50ml',
+            'review_text': f'후기 내용 {n}',
+        }
+        review.update(fields)
+        return review
+    return make
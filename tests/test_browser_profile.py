@@ -0,0 +1,15 @@
+from browser_profile import blocked_url_patterns
+
+
+def test_widget_icons_and_scripts_are_not_blocked():
+    patterns = blocked_url_patterns()
+
+    assert '*.svg' not in patterns
+    assert '*.ts' not in patterns
+    assert '*.png' in patterns
+
+
+def test_allowlist_removes_matching_patterns():
+    patterns = blocked_url_patterns(['woff', 'googletagmanager.com'])
+
+    assert not any('woff' in p or 'googletagmanager.com' in p for p in patterns)
@@ -0,0 +1,54 @@
+import json
+import time
+
+import pytest
+
+from conftest import BRAND_URL
+from crawl_scheduler import CrawlScheduler
+
+
+def test_plan_ranks_stale_product_before_recently_crawled_one(make_product, crawled_at):
+    fresh = make_product(1, '최근 크롤링')
+    stale = make_product(2, '오래된 크롤링')
+    history = {
+        1: ({'crawled_at': crawled_at(1)}, 100),
+        2: ({'crawled_at': crawled_at(30 * 24)}, 100),
+    }
+    scheduler = CrawlScheduler(time.time() + 3600)
+
+    queue = scheduler.plan([(1, fresh), (2, stale)], history, total_products=2)
+
+    assert [idx for idx, _ in queue] == [2, 1]
+
+
+def test_brand_run_with_deadline_schedules_previously_crawled_stale_product(tmp_path, monkeypatch, make_product, crawled_at):
+    pytest.importorskip('selenium')
+    pytest.importorskip('bs4')
+    from crawler import AmoreMallCrawler
+
+    monkeypatch.chdir(tmp_path)
+    stale = make_product(1, '오래전에 크롤링한 제품')
+    new = make_product(2, '처음 보는 제품')
+    stored = dict(stale, crawled_at=crawled_at(30 * 24))
+    (tmp_path / 'info_TEST.json').write_text(json.dumps({'products': [stored]}, ensure_ascii=False), encoding='utf-8')
+
+    # 브라우저 없이 브랜드 루프만 실행
+    crawler = AmoreMallCrawler.__new__(AmoreMallCrawler)
+    crawler.debug = False
+    crawler.incremental_db = None
+    crawler.review_backend = 'html'
+    crawler.review_api_url = None
+    crawled = []
+
+    def crawl_product(url, **kwargs):
+        crawled.append(url)
+        return {'product_info': {'product_url': url}, 'reviews': [], 'total_reviews': 0}
+
+    monkeypatch.setattr(crawler, 'get_brand_products', lambda brand_url, max_products=None: ([stale, new], 'TEST'))
+    monkeypatch.setattr(crawler, 'crawl_product_with_recovery', crawl_product)
+    monkeypatch.setattr(crawler, 'print_stats', lambda title=None: None)
+
+    results = list(crawler.iter_brand_products(BRAND_URL, deadline=time.time() + 3600))
+
+    assert stale['product_url'] in crawled
+    assert len(results) == 2
@@ -0,0 +1,120 @@
+import glob
+import sqlite3
+
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+from database import DatabaseManager
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'reviews.db')
+
+
+def _add_product(db, make_product, sn=1):
+    product = make_product(sn)
+    return db.add_product(product).id
+
+
+def _make_legacy_db(db_path, make_product, make_review, copies):
+    """review_fingerprint 컬럼과 유니크 인덱스가 없던 DB에 같은 후기를 copies번 저장"""
+    db = DatabaseManager(db_path)
+    product_id = _add_product(db, make_product)
+    db.close()
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP INDEX ux_reviews_product_fingerprint")
+    conn.execute("ALTER TABLE reviews DROP COLUMN review_fingerprint")
+    for n, count in enumerate(copies, 1):
+        review = make_review(n)
+        for _ in range(count):
+            conn.execute("INSERT INTO reviews (product_id, username, rating, option, review_text) VALUES (?, ?, ?, ?, ?)",
+                         (product_id, review['username'], review['rating'], review['option'], review['review_text']))
+    conn.commit()
+    conn.close()
+    return product_id
+
+
+def _review_count(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_opening_legacy_db_backfills_without_deleting(db_path, make_product, make_review, capsys):
+    _make_legacy_db(db_path, make_product, make_review, copies=[2, 1])
+
+    db = DatabaseManager(db_path)
+
+    assert db.fingerprint_index is False
+    assert _review_count(db_path) == 3
+    assert len(db.get_review_fingerprints('P1')) == 2
+    assert '--migrate-db' in capsys.readouterr().out
+
+
+def test_bulk_insert_without_index_skips_stored_reviews(db_path, make_product, make_review):
+    product_id = _make_legacy_db(db_path, make_product, make_review, copies=[2])
+    db = DatabaseManager(db_path)
+
+    inserted = db.add_reviews_bulk(product_id, [make_review(1, user_info='20대'), make_review(2), make_review(2)],
+                                   update_existing=True)
+
+    assert inserted == 1
+    assert _review_count(db_path) == 3
+    assert {review.user_info for review in db.get_product_reviews('P1') if review.username == '작성자1'} == {'20대'}
+
+
+def test_migrate_dry_run_reports_without_changing_db(db_path, make_product, make_review):
+    _make_legacy_db(db_path, make_product, make_review, copies=[3, 2, 1])
+    db = DatabaseManager(db_path)
+
+    result = db.migrate_review_fingerprints(dry_run=True)
+
+    assert result == {'duplicates': 3, 'products': 1, 'backup': None}
+    assert _review_count(db_path) == 6
+    assert db.fingerprint_index is False
+    assert glob.glob(f'{db_path}.bak-*') == []
+
+
+def test_migrate_backs_up_then_removes_duplicates_and_adds_index(db_path, make_product, make_review):
+    product_id = _make_legacy_db(db_path, make_product, make_review, copies=[3, 1])
+    db = DatabaseManager(db_path)
+
+    result = db.migrate_review_fingerprints()
+
+    assert result['duplicates'] == 2
+    assert _review_count(result['backup']) == 4
+    assert _review_count(db_path) == 2
+    assert DatabaseManager(db_path).fingerprint_index is True
+    assert db.add_reviews_bulk(product_id, [make_review(1), make_review(3)]) == 1
+
+
+def test_bulk_insert_stores_same_rows_as_orm_insert(tmp_path, make_product, make_review):
+    reviews = [make_review(n, user_info='30대/여성/건성', skin_type_1='건성') for n in range(1, 4)]
+    columns = ['username', 'user_info', 'skin_type_1', 'rating', 'option', 'review_text', 'review_fingerprint']
+    stored = []
+    for name, insert in [('orm', 'add_reviews'), ('bulk', 'add_reviews_bulk')]:
+        db = DatabaseManager(str(tmp_path / f'{name}.db'))
+        getattr(db, insert)(_add_product(db, make_product), reviews)
+        stored.append([tuple(getattr(review, column) for column in columns) for review in db.get_product_reviews('P1')])
+        db.close()
+
+    assert stored[0] == stored[1]
+
+
+def test_bulk_insert_conflicts_skip_or_update_existing_reviews(db_path, make_product, make_review):
+    db = DatabaseManager(db_path)
+    product_id = _add_product(db, make_product)
+    assert db.add_reviews_bulk(product_id, [make_review(1), make_review(2)], chunk_size=1) == 2
+
+    # 같은 배치 안의 중복과 이미 저장된 후기는 모두 건너뜀
+    assert db.add_reviews_bulk(product_id, [make_review(2), make_review(3), make_review(3)], chunk_size=2) == 1
+    assert db.review_insert_stats['duplicates'] == 2
+
+    assert db.add_reviews_bulk(product_id, [make_review(1, gender='여성')], update_existing=True) == 0
+    db.session.expire_all()
+    assert [review.gender for review in db.get_product_reviews('P1') if review.username == '작성자1'] == ['여성']
+    assert _review_count(db_path) == 3
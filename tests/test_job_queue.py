@@ -0,0 +1,104 @@
+import sqlite3
+import time
+
+import pytest
+
+from conftest import BRAND_URL as BRAND
+from job_queue import CrawlJobQueue
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / 'jobs.db')
+
+
+def _drain(queue):
+    while True:
+        job = queue.claim(BRAND)
+        if job is None:
+            return
+        queue.complete(BRAND, job['product_url'])
+
+
+def test_enqueue_after_finished_run_restarts_done_jobs(queue_path, make_products):
+    queue = CrawlJobQueue(queue_path)
+    assert queue.enqueue(BRAND, make_products(2)) == 2
+    _drain(queue)
+    assert queue.claim(BRAND) is None
+
+    assert queue.enqueue(BRAND, make_products(3)) == 1
+    assert queue.stats['restarted'] == 2
+    assert queue.counts(BRAND) == {'pending': 3}
+
+
+def test_enqueue_during_active_run_keeps_done_jobs(queue_path, make_products):
+    first = CrawlJobQueue(queue_path, owner='first')
+    first.enqueue(BRAND, make_products(2))
+    job = first.claim(BRAND)
+    first.complete(BRAND, job['product_url'])
+
+    second = CrawlJobQueue(queue_path, owner='second')
+    assert second.enqueue(BRAND, make_products(2)) == 0
+    assert second.counts(BRAND) == {'done': 1, 'pending': 1}
+
+
+def test_fail_counts_failure_only_when_attempts_are_used_up(queue_path, make_products):
+    queue = CrawlJobQueue(queue_path, max_attempts=2)
+    queue.enqueue(BRAND, make_products(1))
+
+    queue.fail(BRAND, queue.claim(BRAND)['product_url'], '오류 1')
+    assert queue.stats['failed'] == 0
+    assert queue.stats['requeued'] == 1
+    assert queue.counts(BRAND) == {'pending': 1}
+
+    queue.fail(BRAND, queue.claim(BRAND)['product_url'], '오류 2')
+    assert queue.stats['failed'] == 1
+    assert queue.counts(BRAND) == {'failed': 1}
+
+
+def test_same_product_is_a_separate_job_per_brand(queue_path, make_products):
+    other_brand = f'{BRAND}?brandSn=2'
+    queue = CrawlJobQueue(queue_path)
+    queue.enqueue(BRAND, make_products(1))
+    _drain(queue)
+
+    assert queue.enqueue(other_brand, make_products(1)) == 1
+    assert queue.counts(other_brand) == {'pending': 1}
+    assert queue.counts(BRAND) == {'done': 1}
+
+
+def test_complete_after_lost_lease_is_not_counted_as_done(queue_path, make_products):
+    first = CrawlJobQueue(queue_path, owner='first', lease_seconds=60)
+    first.enqueue(BRAND, make_products(1))
+    job = first.claim(BRAND)
+    first.conn.execute("UPDATE crawl_jobs SET lease_expires = ?", (time.time() - 1,))
+
+    second = CrawlJobQueue(queue_path, owner='second')
+    assert second.claim(BRAND)['product_url'] == job['product_url']
+
+    assert first.complete(BRAND, job['product_url']) is False
+    first.fail(BRAND, job['product_url'], '늦은 실패')
+    assert first.stats['done'] == 0
+    assert first.stats['lost'] == 2
+    assert second.counts(BRAND) == {'leased': 1}
+
+
+def test_old_queue_file_is_rebuilt_with_brand_key(queue_path, make_products):
+    product = make_products(1)[0]
+    conn = sqlite3.connect(queue_path)
+    conn.execute("""
+        CREATE TABLE crawl_jobs (
+            product_url TEXT PRIMARY KEY, brand_url TEXT NOT NULL, position INTEGER NOT NULL, product TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending', lease_owner TEXT, lease_expires REAL,
+            attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT, updated_at REAL NOT NULL
+        )
+    """)
+    conn.execute("INSERT INTO crawl_jobs (product_url, brand_url, position, product, status, updated_at) "
+                 "VALUES (?, ?, 1, '{}', 'done', 0)", (product['product_url'], BRAND))
+    conn.commit()
+    conn.close()
+
+    queue = CrawlJobQueue(queue_path)
+
+    assert queue.counts(BRAND) == {'done': 1}
+    assert queue.enqueue(f'{BRAND}?brandSn=2', [product]) == 1
@@ -0,0 +1,74 @@
+import base64
+import json
+
+import pytest
+
+pytest.importorskip('selenium')
+pytest.importorskip('bs4')
+
+from crawler import AmoreMallCrawler
+
+REVIEW_URL = 'https://www.amoremall.com/api/review/list?onlineProdSn=101&page=1'
+PAYLOAD = {'data': {'reviewList': [
+    {'memberNickname': 'user1', 'starScore': 5, 'optionName': '베리', 'reviewContent': '좋아요'},
+    {'memberNickname': 'user2', 'starScore': 4, 'reviewContent': '괜찮아요'},
+]}}
+
+
+def _response_event(request_id, url, mime_type='application/json'):
+    message = {'message': {'method': 'Network.responseReceived', 'params': {
+        'requestId': request_id, 'response': {'url': url, 'mimeType': mime_type},
+    }}}
+    return {'message': json.dumps(message)}
+
+
+class FakeDriver:
+    """성능 로그와 Network.getResponseBody만 흉내 내는 드라이버"""
+
+    def __init__(self, logs, bodies):
+        self.logs = logs
+        self.bodies = bodies
+        self.body_requests = []
+
+    def get_log(self, log_type):
+        logs, self.logs = self.logs, []
+        return logs
+
+    def execute_cdp_cmd(self, command, params):
+        self.body_requests.append(params['requestId'])
+        return self.bodies[params['requestId']]
+
+
+@pytest.fixture
+def crawler():
+    crawler = AmoreMallCrawler.__new__(AmoreMallCrawler)
+    crawler.debug = False
+    crawler.review_api_url = None
+    return crawler
+
+
+def test_review_api_responses_become_cards(crawler):
+    body = json.dumps(PAYLOAD, ensure_ascii=False)
+    crawler.driver = FakeDriver(
+        [
+            _response_event('1', 'https://www.amoremall.com/api/product/detail'),
+            _response_event('2', REVIEW_URL),
+            _response_event('3', 'https://www.amoremall.com/review/widget.js', mime_type='application/javascript'),
+            {'message': 'not json'},
+        ],
+        {'2': {'body': base64.b64encode(body.encode('utf-8')).decode('ascii'), 'base64Encoded': True}},
+    )
+
+    cards = crawler._collect_network_review_cards()
+
+    assert [(card['username'], card['text']) for card in cards] == [('user1', '좋아요'), ('user2', '괜찮아요')]
+    assert crawler.driver.body_requests == ['2']
+    assert crawler.review_api_url == REVIEW_URL
+    assert crawler._collect_network_review_cards() == []  # 이미 읽은 로그는 다시 처리하지 않음
+
+
+def test_unreadable_response_body_is_skipped(crawler):
+    crawler.driver = FakeDriver([_response_event('9', REVIEW_URL)], {'9': {'body': '{잘린 JSON', 'base64Encoded': False}})
+
+    assert crawler._collect_network_review_cards() == []
+    assert crawler.review_api_url is None
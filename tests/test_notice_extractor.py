@@ -0,0 +1,48 @@
+import pytest
+
+bs4 = pytest.importorskip('bs4')
+
+from notice_extractor import extract_notice_fields
+
+INGREDIENTS = '정제수, 글리세린, 부틸렌글라이콜, 나이아신아마이드, 판테놀, 알란토인, 카보머, 트로메타민, 향료'
+
+
+def _fields(html):
+    return extract_notice_fields(bs4.BeautifulSoup(html, 'html.parser'))
+
+
+def test_table_labels():
+    fields = _fields(f"""
+        <table>
+          <tr><th>화장품법에 따라 기재해야 하는 모든 성분</th><td>{INGREDIENTS}</td></tr>
+          <tr><th>사용방법</th><td>적당량을 덜어 얼굴 전체에 펴 발라 줍니다.</td></tr>
+          <tr><th>사용할 때의 주의사항</th><td>상처가 있는 부위 등에는 사용을 자제할 것</td></tr>
+        </table>
+    """)
+
+    assert fields['ingredients'] == INGREDIENTS
+    assert fields['usage_method'] == '적당량을 덜어 얼굴 전체에 펴 발라 줍니다.'
+    assert fields['precautions'] == '상처가 있는 부위 등에는 사용을 자제할 것'
+
+
+def test_heading_label_scans_parent_siblings_for_ingredients():
+    fields = _fields(f"""
+        <div class="title"><h4>화장품법에 따라 기재해야 하는 모든 성분</h4></div>
+        <div class="line"></div>
+        <div class="desc">{INGREDIENTS}</div>
+    """)
+
+    assert fields['ingredients'] == INGREDIENTS
+
+
+def test_label_less_notice_uses_keyword_text():
+    fields = _fields("""
+        <div class="notice">
+          <p>사용방법: 적당량을 덜어 얼굴 전체에 펴 발라 줍니다.</p>
+          <p>주의사항 : 상처가 있는 부위 등에는 사용을 자제할 것</p>
+        </div>
+    """)
+
+    assert fields['usage_method'] == '적당량을 덜어 얼굴 전체에 펴 발라 줍니다.'
+    assert fields['precautions'] == '상처가 있는 부위 등에는 사용을 자제할 것'
+    assert fields['ingredients'] == ''
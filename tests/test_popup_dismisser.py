@@ -0,0 +1,7 @@
+from popup_dismisser import POPUP_DISMISS_SCRIPT, POPUP_PAUSE_KEY, POPUP_PAUSE_SCRIPT
+
+
+def test_dismiss_and_pause_scripts_share_the_pause_key():
+    assert f"getItem('{POPUP_PAUSE_KEY}')" in POPUP_DISMISS_SCRIPT
+    assert f"setItem('{POPUP_PAUSE_KEY}', '1')" in POPUP_PAUSE_SCRIPT
+    assert f"removeItem('{POPUP_PAUSE_KEY}')" in POPUP_PAUSE_SCRIPT
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+pytest.importorskip('sqlalchemy')
+
+from conftest import BRAND_URL
+from database import DatabaseManager
+from result_writer import BrandJsonOutput, ResultWriter
+
+
+def _partial(product, reviews):
+    return {'product_info': product, 'reviews': reviews, 'partial': True}
+
+
+def test_streamed_batches_are_stored_and_summarized(tmp_path, make_product, make_review):
+    db_path = str(tmp_path / 'reviews.db')
+    product = make_product(1)
+    writer = ResultWriter(db_path=db_path)
+    writer.submit(_partial(product, [make_review(1), make_review(2)]))
+    writer.submit(_partial(product, [make_review(2), make_review(3)]))
+    writer.submit({'product_info': dict(product, ingredients='정제수'), 'reviews': [], 'total_reviews': 3, 'streamed': True})
+    writer.close()
+
+    db = DatabaseManager(db_path)
+    try:
+        stored = db.get_product('P1')
+        assert stored.ingredients == '정제수'
+        assert len(stored.reviews) == 3
+        assert db.get_product_summary('P1').total_reviews == 3
+    finally:
+        db.close()
+    assert writer.stats['products'] == 1
+    assert writer.stats['reviews'] == 3
+    assert writer.stats['duplicates'] == 1
+    assert writer.stats['errors'] == 0
+
+
+def test_streamed_product_without_reviews_is_not_stored(tmp_path, make_product):
+    db_path = str(tmp_path / 'reviews.db')
+    writer = ResultWriter(db_path=db_path)
+    writer.submit({'product_info': make_product(1), 'reviews': [], 'total_reviews': 0, 'streamed': True})
+    writer.close()
+
+    db = DatabaseManager(db_path)
+    try:
+        assert db.get_product('P1') is None
+    finally:
+        db.close()
+
+
+def test_brand_json_writes_spooled_batches_once(tmp_path, monkeypatch, make_product, make_review):
+    monkeypatch.chdir(tmp_path)
+    product = make_product(1)
+    output = BrandJsonOutput(BRAND_URL, 'brand')
+    output.add(_partial(product, [make_review(1), make_review(2)]))
+    # 다시 크롤링한 제품의 같은 후기가 한 번 더 들어와도 리뷰 파일에는 한 번만 쓰임
+    output.add(_partial(product, [make_review(2), make_review(3)]))
+    output.add({'product_info': product, 'reviews': [], 'total_reviews': 3, 'streamed': True})
+    output.close()
+
+    with open(output.review_file, encoding='utf-8') as f:
+        data = json.load(f)
+    assert data['total_reviews'] == 3
+    assert [review['username'] for review in data['reviews']] == ['작성자1', '작성자2', '작성자3']
+    assert all(review['product_code'] == 'P1' for review in data['reviews'])
+    with open(output.info_file, encoding='utf-8') as f:
+        assert [p['product_code'] for p in json.load(f)['products']] == ['P1']
+    assert output.new_products == 1
+    assert not (tmp_path / output.spool_file).exists()
@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+from review_checkpoint import ReviewCheckpoint
+
+
+@pytest.fixture
+def checkpoint_path(tmp_path):
+    return str(tmp_path / 'checkpoint.db')
+
+
+def _save(checkpoint, context='html:default'):
+    checkpoint.save('P1', [{'review_id': 'r1'}], clicks=5, seen_ids={'r1'}, page_size=10, context=context)
+
+
+def test_load_resumes_matching_checkpoint(checkpoint_path):
+    checkpoint = ReviewCheckpoint(checkpoint_path)
+    _save(checkpoint)
+
+    resumed = checkpoint.load('P1', 'html:default')
+
+    assert resumed['clicks'] == 5
+    assert resumed['reviews'] == [{'review_id': 'r1'}]
+
+
+def test_load_discards_checkpoint_with_different_context(checkpoint_path):
+    checkpoint = ReviewCheckpoint(checkpoint_path)
+    _save(checkpoint, context='html:default')
+
+    assert checkpoint.load('P1', 'network:newest') is None
+    assert checkpoint.load('P1', 'html:default') is None  # 버린 체크포인트는 삭제됨
+
+
+def test_expired_checkpoint_is_not_resumed(checkpoint_path):
+    checkpoint = ReviewCheckpoint(checkpoint_path, max_age_hours=1)
+    _save(checkpoint)
+    checkpoint.conn.execute("UPDATE review_checkpoints SET updated_at = ?", (time.time() - 2 * 3600,))
+    checkpoint.conn.commit()
+
+    assert checkpoint.load('P1', 'html:default') is None
+
+    _save(checkpoint)
+    checkpoint.conn.execute("UPDATE review_checkpoints SET updated_at = ?", (time.time() - 2 * 3600,))
+    checkpoint.conn.commit()
+    checkpoint.close()
+    reopened = ReviewCheckpoint(checkpoint_path, max_age_hours=1)
+    assert reopened.conn.execute("SELECT COUNT(*) FROM review_checkpoint_batches").fetchone()[0] == 0
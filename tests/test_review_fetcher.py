@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+
+web = pytest.importorskip('aiohttp.web')
+
+from conftest import product_url
+from review_fetcher import ReviewFetcher
+from review_payload import payload_to_cards
+
+PAGE_SIZE = 2
+REVIEWS = {
+    '101': [{'memberNickname': f'user{n}', 'starScore': 5, 'optionName': '베리', 'reviewContent': f'좋아요 {n}'}
+            for n in range(5)],
+    '102': [{'memberNickname': 'solo', 'starScore': 3, 'reviewContent': '보통이에요'}],
+    '103': [],
+}
+FORBIDDEN_SN = '403'
+
+
+@pytest.fixture
+def review_api():
+    """onlineProdSn별 리뷰를 page/pageSize로 나눠 돌려주는 스텁 리뷰 API 서버"""
+    requests = []
+
+    async def reviews(request):
+        requests.append(dict(request.query))
+        if request.query['onlineProdSn'] == FORBIDDEN_SN:
+            return web.Response(status=403)
+        items = REVIEWS.get(request.query['onlineProdSn'], [])
+        page = int(request.query['page'])
+        size = int(request.query['pageSize'])
+        return web.json_response({'data': {'reviewList': items[(page - 1) * size:page * size]}})
+
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_get('/api/reviews', reviews)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    loop.run_until_complete(site.start())
+    port = runner.addresses[0][1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield f'http://127.0.0.1:{port}/api/reviews?onlineProdSn=1&page=1&pageSize={PAGE_SIZE}', requests
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
+
+
+def test_fetch_all_pages_through_each_product(review_api):
+    endpoint, requests = review_api
+    fetcher = ReviewFetcher(endpoint, concurrency=4)
+
+    results = fetcher.fetch_all([product_url(sn) for sn in REVIEWS])
+
+    assert [card['text'] for card in results[product_url('101')]] == [f'좋아요 {n}' for n in range(5)]
+    assert [card['username'] for card in results[product_url('102')]] == ['solo']
+    assert results[product_url('103')] == []
+    assert len([q for q in requests if q['onlineProdSn'] == '101']) == 3  # 마지막 페이지가 pageSize보다 작으면 중단
+    assert fetcher.stats['reviews'] == 6
+
+
+def test_iter_fetch_yields_each_product_as_it_completes(review_api):
+    endpoint, _ = review_api
+    fetcher = ReviewFetcher(endpoint, concurrency=2)
+
+    fetched = fetcher.iter_fetch([product_url('101'), product_url('102')], max_reviews=3)
+    first_url, first_cards = next(fetched)
+    rest = dict(fetched)
+
+    assert {first_url, *rest} == {product_url('101'), product_url('102')}
+    cards = {first_url: first_cards, **rest}
+    assert len(cards[product_url('101')]) == 3
+
+
+def test_client_error_counts_as_failure_without_retry(review_api):
+    endpoint, requests = review_api
+    fetcher = ReviewFetcher(endpoint, retries=2)
+
+    results = fetcher.fetch_all([product_url(FORBIDDEN_SN), product_url('102')])
+
+    assert results[product_url(FORBIDDEN_SN)] == []
+    assert len([q for q in requests if q['onlineProdSn'] == FORBIDDEN_SN]) == 1
+    assert fetcher.stats['failures'] == 1
+    assert fetcher.stats['rejected'] == {403: 1}
+
+
+def test_iter_fetch_can_be_closed_early(review_api):
+    endpoint, _ = review_api
+    fetcher = ReviewFetcher(endpoint)
+
+    fetched = fetcher.iter_fetch([product_url(sn) for sn in REVIEWS])
+    next(fetched)
+    fetched.close()
+
+    assert fetcher.stats['elapsed'] > 0
+
+
+def test_payload_to_cards_finds_nested_review_list():
+    cards = payload_to_cards({'data': {'reviewList': REVIEWS['101'][:1]}})
+
+    assert cards[0]['username'] == 'user0'
+    assert cards[0]['star_count'] == 5
+    assert cards[0]['option'] == '베리'
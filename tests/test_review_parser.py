@@ -0,0 +1,81 @@
+import pytest
+
+pytest.importorskip('bs4')
+
+from bs4 import BeautifulSoup
+
+from review_parser import ReviewParser, card_element, parse_review_html
+
+CARD_HTML = '''
+<div class="reviewCard">
+    <div class="profileCard">
+        <span class="profileCard__userTitle">뷰티러버</span>
+        <span class="profileCard__userDesc">30대/여성/건성/주름</span>
+    </div>
+    <div class="icoStarWrap star4"><i class="icoStar on"></i><i class="icoStar on"></i></div>
+    <p class="option">옵션: 50ml</p>
+    <div class="prdStyle"><dl><dt>촉촉함</dt><dd>촉촉해요</dd></dl></div>
+    <p class="txt">흡수가 빠르고 건조하지 않아요. 재구매 의사 있습니다.</p>
+</div>
+'''
+PAGE_HTML = f'<html><body><div class="reviewList">{CARD_HTML}{CARD_HTML.replace("뷰티러버", "수분충전")}</div></body></html>'
+
+
+def _full_page_reviews():
+    parser = ReviewParser()
+    cards = BeautifulSoup(PAGE_HTML, 'html.parser').select('.reviewCard')
+    return [parser._parse_review_element(card, idx) for idx, card in enumerate(cards)]
+
+
+def _card_htmls():
+    return [str(card) for card in BeautifulSoup(PAGE_HTML, 'html.parser').select('.reviewCard')]
+
+
+def test_card_element_returns_the_card_tag():
+    element = card_element(CARD_HTML)
+
+    assert element.name == 'div'
+    assert element.get('class') == ['reviewCard']
+
+
+def test_parse_worker_matches_full_page_parse():
+    reviews = _full_page_reviews()
+
+    assert parse_review_html(_card_htmls()) == reviews
+    assert [review['username'] for review in reviews] == ['뷰티러버', '수분충전']
+
+
+def test_incremental_cards_match_full_page_parse():
+    pytest.importorskip('selenium')
+    from crawler import AmoreMallCrawler
+
+    class FakeDriver:
+        def execute_script(self, script, *args):
+            htmls = _card_htmls()
+            return {'total': len(htmls), 'html': htmls}
+
+    crawler = AmoreMallCrawler.__new__(AmoreMallCrawler)
+    crawler.debug = False
+    crawler.driver = FakeDriver()
+
+    elements = crawler._get_new_review_cards()
+
+    assert [element.name for element in elements] == ['div', 'div']
+    assert [crawler._parse_review_element(element, idx) for idx, element in enumerate(elements)] == _full_page_reviews()
+
+
+def test_js_card_data_matches_html_parse():
+    # REVIEW_CARDS_SCRIPT가 CARD_HTML에서 꺼내는 원시 필드
+    card = {
+        'username': '뷰티러버',
+        'user_info': '30대/여성/건성/주름',
+        'star_class': 'icoStarWrap star4',
+        'star_count': 2,
+        'option': '50ml',
+        'review_type': '',
+        'notes': ['촉촉함: 촉촉해요'],
+        'text': '흡수가 빠르고 건조하지 않아요. 재구매 의사 있습니다.',
+        'all_text': '뷰티러버\n30대/여성/건성/주름\n옵션: 50ml\n촉촉함\n촉촉해요\n흡수가 빠르고 건조하지 않아요. 재구매 의사 있습니다.',
+    }
+
+    assert ReviewParser()._review_from_card_data(card, 0) == _full_page_reviews()[0]
@@ -0,0 +1,36 @@
+import json
+
+from selector_cache import SelectorCache
+
+CLOSE = ('css selector', '.popup .close')
+BTN_CLOSE = ('xpath', "//button[contains(@class, 'btn-close')]")
+TEXT_CLOSE = ('xpath', "//button[contains(text(), '닫기')]")
+
+
+def test_winner_survives_reordered_selector_list(tmp_path):
+    path = str(tmp_path / 'selectors.json')
+    cache = SelectorCache(path)
+    cache.record('popup', 'close_button', [CLOSE, BTN_CLOSE], BTN_CLOSE)
+    cache.save()
+
+    # 다음 실행에서 셀렉터 목록 앞에 새 항목이 추가되어도 같은 셀렉터를 먼저 시도
+    reopened = SelectorCache(path)
+    candidates = [TEXT_CLOSE, CLOSE, BTN_CLOSE]
+    assert reopened.ordered('popup', 'close_button', candidates) == [BTN_CLOSE, TEXT_CLOSE, CLOSE]
+
+    reopened.record('popup', 'close_button', candidates, BTN_CLOSE)
+    assert reopened.session == {'hits': 1, 'misses': 0}
+
+
+def test_index_based_winner_from_old_file_is_ignored(tmp_path):
+    path = tmp_path / 'selectors.json'
+    path.write_text(json.dumps({'popup': {'close_button': {'winner': 1, 'hits': 3, 'misses': 1, 'wins': {'1': 4}}}}),
+                    encoding='utf-8')
+
+    cache = SelectorCache(str(path))
+    candidates = [CLOSE, BTN_CLOSE]
+
+    assert cache.ordered('popup', 'close_button', candidates) == candidates
+    cache.record('popup', 'close_button', candidates, CLOSE)
+    assert cache.data['popup']['close_button']['winner'] == 'css selector:.popup .close'
+    assert cache.data['popup']['close_button']['wins'] == {'css selector:.popup .close': 1}
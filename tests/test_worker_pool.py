@@ -0,0 +1,35 @@
+import os
+
+import pytest
+
+pytest.importorskip('selenium')
+pytest.importorskip('bs4')
+
+import crawler as crawler_module
+from crawler import AmoreMallCrawler
+
+DYING_WORKER = 1
+
+
+def fake_crawl_worker(worker_id, task_queue, result_queue, crawler_kwargs, crawl_kwargs):
+    """Chrome 없이 제품 URL만 돌려주는 워커 (DYING_WORKER는 첫 제품을 받자마자 시작 메시지 없이 죽음)"""
+    while True:
+        task = task_queue.get()
+        if task is None:
+            return
+        idx, url, product_kwargs = task
+        if worker_id == DYING_WORKER:
+            os._exit(1)
+        result_queue.put(('start', worker_id, idx))
+        result_queue.put(('done', worker_id, idx, {'product_info': {}, 'reviews': [], 'total_reviews': 0}))
+
+
+def test_product_taken_by_dead_worker_is_retried(monkeypatch, make_products):
+    monkeypatch.setattr(crawler_module, '_crawl_worker', fake_crawl_worker)
+    crawler = AmoreMallCrawler.__new__(AmoreMallCrawler)
+    crawler._init_kwargs = {}
+    products = make_products(5)
+
+    results = list(crawler._crawl_with_worker_pool(list(enumerate(products, 1)), len(products), {}, workers=2))
+
+    assert sorted(result['product_info']['product_url'] for result in results) == sorted(p['product_url'] for p in products)
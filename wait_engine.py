@@ -0,0 +1,191 @@
+"""
+이벤트 기반 대기 모듈 (고정 time.sleep 대체)
+"""
+import time
+from typing import Callable, Dict, Optional
+
+
+# 문서 변경(MutationObserver)을 기록하고 마지막 변경 이후 경과 시간(ms)을 반환
+DOM_QUIET_SCRIPT = """
+    if (!window.__crawlerMutationObserver) {
+        window.__crawlerLastMutation = Date.now();
+        window.__crawlerMutationObserver = new MutationObserver(function() {
+            window.__crawlerLastMutation = Date.now();
+        });
+        window.__crawlerMutationObserver.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, characterData: true
+        });
+    }
+    return Date.now() - window.__crawlerLastMutation;
+"""
+
+# 요소가 화면 안에 있고 클릭 가능한 상태인지 확인 (위치 반환)
+ELEMENT_STATE_SCRIPT = """
+    var el = arguments[0];
+    var rect = el.getBoundingClientRect();
+    var viewHeight = window.innerHeight || document.documentElement.clientHeight;
+    var visible = rect.width > 0 && rect.height > 0 && rect.top < viewHeight && rect.bottom > 0;
+    var disabled = el.disabled === true || el.getAttribute('aria-disabled') === 'true';
+    return {visible: visible, disabled: disabled, top: rect.top};
+"""
+
+
+class WaitEngine:
+    """조건 기반 대기 클래스 (조건별 소요 시간 통계 포함)"""
+
+    def __init__(self, driver, poll_interval: float = 0.1, debug: bool = False, ready_states: tuple = ('complete',)):
+        """
+        대기 엔진 초기화
+
+        Args:
+            driver: Selenium WebDriver
+            poll_interval: 조건 확인 간격 (초)
+            debug: 디버깅 모드 (시간 초과 로그 출력)
+            ready_states: 로딩 완료로 볼 document.readyState 값
+                          (pageLoadStrategy='eager'에서는 'interactive'도 포함)
+        """
+        self.driver = driver
+        self.poll_interval = poll_interval
+        self.debug = debug
+        self.ready_states = ready_states
+        self.stats: Dict[str, Dict] = {}
+
+    def _wait(self, name: str, condition: Callable[[], bool], timeout: float) -> bool:
+        """
+        조건이 참이 될 때까지 대기하고 통계 기록
+
+        Args:
+            name: 조건 이름 (통계 키)
+            condition: 확인할 조건 함수 (예외는 False로 간주)
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            시간 내에 조건이 충족되었는지 여부
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        satisfied = False
+        while True:
+            try:
+                if condition():
+                    satisfied = True
+                    break
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+
+        elapsed = time.monotonic() - start
+        stat = self.stats.setdefault(name, {'count': 0, 'total_time': 0.0, 'max_time': 0.0, 'timeouts': 0})
+        stat['count'] += 1
+        stat['total_time'] += elapsed
+        stat['max_time'] = max(stat['max_time'], elapsed)
+        if not satisfied:
+            stat['timeouts'] += 1
+            if self.debug:
+                print(f"  [디버깅] 대기 시간 초과: {name} ({timeout}초)")
+        return satisfied
+
+    def document_ready(self, timeout: float = 10) -> bool:
+        """document.readyState가 ready_states 중 하나가 될 때까지 대기"""
+        return self._wait(
+            'document_ready',
+            lambda: self.driver.execute_script("return document.readyState") in self.ready_states,
+            timeout
+        )
+
+    def dom_quiet(self, quiet_ms: int = 500, timeout: float = 5) -> bool:
+        """DOM 변경이 quiet_ms 동안 없을 때까지 대기"""
+        return self._wait(
+            'dom_quiet',
+            lambda: (self.driver.execute_script(DOM_QUIET_SCRIPT) or 0) >= quiet_ms,
+            timeout
+        )
+
+    def page_settled(self, timeout: float = 10, quiet_ms: int = 500) -> bool:
+        """페이지 이동 후 로딩 완료 + DOM 안정화까지 대기"""
+        start = time.monotonic()
+        ready = self.document_ready(timeout)
+        remaining = max(0.5, timeout - (time.monotonic() - start))
+        return self.dom_quiet(quiet_ms, remaining) and ready
+
+    def element_clickable(self, element, timeout: float = 3) -> bool:
+        """
+        요소가 화면 안에 보이고, 활성화되어 있고, 스크롤이 멈출 때까지 대기
+        (scrollIntoView 직후 사용)
+        """
+        last_top = [None]
+
+        def condition():
+            state = self.driver.execute_script(ELEMENT_STATE_SCRIPT, element)
+            settled = last_top[0] is not None and abs(state['top'] - last_top[0]) < 1
+            last_top[0] = state['top']
+            return state['visible'] and not state['disabled'] and settled
+
+        return self._wait('element_clickable', condition, timeout)
+
+    def count_increased(self, css_selector: str, previous_count: int, timeout: float = 10, name: str = 'count_increased') -> bool:
+        """css_selector에 해당하는 요소 수가 previous_count보다 많아질 때까지 대기"""
+        return self._wait(
+            name,
+            lambda: self.count(css_selector) > previous_count,
+            timeout
+        )
+
+    def review_count_increased(self, previous_count: int, timeout: float = 10) -> bool:
+        """리뷰 카드(.reviewCard) 수가 늘어날 때까지 대기 ("더 보기" 클릭 후)"""
+        return self.count_increased('.reviewCard', previous_count, timeout, name='review_count_increased')
+
+    def scroll_height_changed(self, previous_height: int, timeout: float = 5) -> bool:
+        """document.body.scrollHeight가 바뀔 때까지 대기 (무한 스크롤)"""
+        return self._wait(
+            'scroll_height_changed',
+            lambda: self.driver.execute_script("return document.body.scrollHeight") != previous_height,
+            timeout
+        )
+
+    def url_changed(self, previous_url: str, timeout: float = 5) -> bool:
+        """현재 URL이 바뀔 때까지 대기 (클릭 후 페이지 이동 여부 확인)"""
+        return self._wait(
+            'url_changed',
+            lambda: self.driver.current_url != previous_url,
+            timeout
+        )
+
+    def click_settled(self, previous_url: str, quiet_ms: int = 500, timeout: float = 5) -> bool:
+        """
+        클릭 후 페이지가 이동했거나 같은 페이지의 DOM 변경이 끝날 때까지 대기
+        (페이지 이동이면 로딩 완료까지 추가 대기)
+        """
+        settled = self._wait(
+            'click_settled',
+            lambda: (self.driver.current_url != previous_url or
+                     (self.driver.execute_script(DOM_QUIET_SCRIPT) or 0) >= quiet_ms),
+            timeout
+        )
+        if self.driver.current_url != previous_url:
+            return self.page_settled(timeout)
+        return settled
+
+    def count(self, css_selector: str) -> int:
+        """css_selector에 해당하는 요소 수 (대기 없음)"""
+        try:
+            return self.driver.execute_script("return document.querySelectorAll(arguments[0]).length", css_selector) or 0
+        except Exception:
+            return 0
+
+    def total_wait_time(self) -> float:
+        """지금까지 모든 조건에서 대기한 총 시간 (초)"""
+        return sum(stat['total_time'] for stat in self.stats.values())
+
+    def print_stats(self, title: Optional[str] = None):
+        """조건별 대기 통계 출력"""
+        if not self.stats:
+            return
+        print(f"\n[대기 통계]{f' {title}' if title else ''}")
+        for name, stat in sorted(self.stats.items(), key=lambda item: -item[1]['total_time']):
+            average = stat['total_time'] / stat['count'] if stat['count'] else 0
+            print(f"  - {name}: {stat['count']}회, 총 {stat['total_time']:.1f}초, "
+                  f"평균 {average:.2f}초, 최대 {stat['max_time']:.2f}초, 시간 초과 {stat['timeouts']}회")
+        print(f"  총 대기 시간: {self.total_wait_time():.1f}초")